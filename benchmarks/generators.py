@@ -0,0 +1,135 @@
+"""
+ARCHI-Ω v1.2 - Synthetic Benchmark Inputs
+
+Seeded generators for benchmark workloads:
+- Claims with random (acyclic) dependencies or one deep dependency chain
+- Claim ledgers of any size, dict-backed or columnar
+- Project contexts with realistic input sections and large free-text goals
+
+The same seed always produces the same inputs.
+"""
+
+import random
+import sys
+from pathlib import Path
+from typing import Iterator, Type
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from archi_omega.epistemic.foundation import (
+    OriginTag, ProofLevel, TestabilityLevel, Claim, ClaimLedger
+)
+from archi_omega.pipeline.stages import ProjectContext
+
+
+# Vocabulary for generated text; a few words hit the keyword classes
+# (causality, financial, security, recency) so that scans find something
+WORDS = (
+    "api", "service", "queue", "cache", "latency", "throughput", "replica",
+    "database", "index", "shard", "worker", "batch", "stream", "endpoint",
+    "deploy", "rollback", "tenant", "session", "request", "payload",
+    "improve", "reduce", "scale", "monitor", "users", "team", "tasks",
+    "cost", "security", "latest", "cause", "leads", "because", "version"
+)
+
+STATUSES = ("PASS", "FAIL", "UNKNOWN")
+
+# Dependencies are drawn from the preceding claims within this window
+DEPENDENCY_WINDOW = 1000
+
+
+def generate_text(rng: random.Random, words: int) -> str:
+    """Build a sentence of random vocabulary words"""
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def generate_claims(
+    count: int,
+    seed: int = 0,
+    max_dependencies: int = 3,
+    chain: bool = False
+) -> Iterator[Claim]:
+    """
+    Lazily generate claims C0000000, C0000001, ...
+    
+    Each claim depends on up to max_dependencies earlier claims, or with
+    chain=True on its predecessor only (one chain as deep as the ledger).
+    """
+    rng = random.Random(seed)
+    origins = list(OriginTag)
+    levels = list(ProofLevel)
+    testabilities = list(TestabilityLevel)
+    
+    for i in range(count):
+        if chain:
+            dependencies = [f"C{i - 1:07d}"] if i else []
+        else:
+            start = max(0, i - DEPENDENCY_WINDOW)
+            picks = min(i - start, rng.randint(0, max_dependencies))
+            dependencies = [f"C{j:07d}" for j in sorted(rng.sample(range(start, i), picks))]
+        
+        yield Claim(
+            claim_id=f"C{i:07d}",
+            text=generate_text(rng, rng.randint(4, 12)),
+            origin_tag=rng.choice(origins),
+            proof_level=rng.choice(levels),
+            dependencies=dependencies,
+            test_description=generate_text(rng, 4),
+            status=rng.choice(STATUSES),
+            testability=rng.choice(testabilities)
+        )
+
+
+def generate_ledger(
+    count: int,
+    seed: int = 0,
+    chain: bool = False,
+    ledger_class: Type[ClaimLedger] = ClaimLedger
+) -> ClaimLedger:
+    """Build a ledger of generated claims"""
+    ledger = ledger_class()
+    for claim in generate_claims(count, seed, chain=chain):
+        ledger.add_claim(claim)
+    return ledger
+
+
+def generate_context(
+    seed: int = 0,
+    claims: int = 0,
+    chain: bool = False,
+    goal_words: int = 12,
+    ledger_class: Type[ClaimLedger] = ClaimLedger
+) -> ProjectContext:
+    """
+    Build a project context with filled input sections and a claim ledger.
+    
+    goal_words controls the size of the free-text goal.
+    """
+    rng = random.Random(seed)
+    context = ProjectContext()
+    context.goal = generate_text(rng, goal_words)
+    context.deliverable = "Architecture document with deployment plan"
+    context.users_load = {
+        "users": rng.choice([100, 1000, 10000, 100000]),
+        "qps_average": rng.randint(10, 500),
+        "qps_peak": rng.randint(500, 5000),
+        "latency": f"<{rng.choice([100, 200, 500])}ms p95"
+    }
+    context.sla_slo = {"availability": rng.choice(["99%", "99.5%", "99.9%"])}
+    context.data = {
+        "types": generate_text(rng, 5),
+        "sensitivity": rng.choice(["Internal (no PII)", "Contains PII", "Public"]),
+        "retention": f"{rng.randint(1, 7)} years"
+    }
+    context.constraints = {
+        "budget": f"${rng.randint(1, 50) * 100}/month",
+        "timeline": f"{rng.randint(1, 12)} months",
+        "stack": rng.choice(["Python", "Node.js", "Go", "Java"])
+    }
+    context.integrations = [generate_text(rng, 2) for _ in range(rng.randint(0, 4))]
+    context.ops = {"monitoring": rng.choice(["Prometheus", "Datadog", "CloudWatch"])}
+    context.security = {"auth": rng.choice(["OAuth2", "SAML", "API keys"])}
+    context.done_criteria = {"functional": [generate_text(rng, 6) for _ in range(3)]}
+    context.claim_ledger = generate_ledger(claims, seed, chain, ledger_class)
+    return context
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+ARCHI-Ω v1.2 - Benchmark Suite
+
+Times the pipeline and the claim ledger on seeded synthetic workloads:
+1. Each pipeline stage (instrumented Pipeline, memory tracing off)
+2. ClaimLedger.validate_all, get_statistics and to_markdown_table
+3. Several scales: 10, 10k and 1M claims, deep dependency chains,
+   large free-text goals
+
+Results are written as JSON. With --baseline, timings are compared against
+an earlier results file and regressions beyond the tolerance are reported.
+
+Exit code: 0 if no regression is found, 1 otherwise
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from generators import generate_context, generate_ledger
+from archi_omega.epistemic.columnar import ColumnarClaimLedger
+from archi_omega.epistemic.foundation import ClaimLedger, RiskClass
+from archi_omega.epistemic.sharded import ShardedClaimLedger
+from archi_omega.pipeline.stages import Pipeline
+from archi_omega.utils.keywords import DEFAULT_SCANNER
+
+
+# Workloads: generate_context arguments per scenario
+SCENARIOS: Dict[str, Dict[str, Any]] = {
+    "claims-10": {"claims": 10},
+    "claims-10k": {"claims": 10_000},
+    "claims-1m": {"claims": 1_000_000},
+    "chain-10k": {"claims": 10_000, "chain": True},
+    "goal-100k-words": {"claims": 10, "goal_words": 100_000},
+}
+
+# The 1M-claim scenario takes minutes; run it with --all or --scenario
+DEFAULT_SCENARIOS = [name for name in SCENARIOS if name != "claims-1m"]
+
+LEDGER_CLASSES = {
+    "dict": ClaimLedger,
+    "columnar": ColumnarClaimLedger,
+    "sharded": ShardedClaimLedger,
+}
+
+# Differences below this many seconds are treated as noise
+NOISE_FLOOR = 0.001
+
+
+def best_of(timings: Dict[str, float], metric: str, seconds: float) -> None:
+    """Keep the fastest timing of each metric across repeats"""
+    timings[metric] = min(seconds, timings.get(metric, seconds))
+
+
+def time_call(call: Callable[[], Any]) -> float:
+    """Time a single call"""
+    start = time.perf_counter()
+    call()
+    return time.perf_counter() - start
+
+
+def ledger_scope(ledger: ClaimLedger) -> Any:
+    """
+    Context manager closing a ledger that holds resources (the process pool
+    of a ShardedClaimLedger); other ledgers are left as they are.
+    """
+    return ledger if hasattr(ledger, "__enter__") else nullcontext(ledger)
+
+
+def run_scenario(spec: Dict[str, Any], ledger_class: type, repeat: int, seed: int) -> Dict[str, float]:
+    """
+    Run one scenario repeat times from freshly generated inputs.
+    
+    Returns:
+        Dict mapping metric name to its best time in seconds
+    """
+    timings: Dict[str, float] = {}
+    pipeline = Pipeline(instrument=True, trace_memory=False)
+    
+    for _ in range(repeat):
+        # Every repeat starts cold: no cached keyword scans or validations
+        DEFAULT_SCANNER.scan.cache_clear()
+        context = generate_context(seed, ledger_class=ledger_class, **spec)
+        with ledger_scope(context.claim_ledger):
+            start = time.perf_counter()
+            pipeline.execute(context)
+            best_of(timings, "pipeline.execute", time.perf_counter() - start)
+        for metrics in pipeline.telemetry.stages.values():
+            best_of(timings, f"stage.{metrics.stage}", metrics.wall_seconds)
+        
+        ledger = generate_ledger(spec["claims"], seed, spec.get("chain", False), ledger_class)
+        with ledger_scope(ledger):
+            best_of(
+                timings, "ledger.validate_all", time_call(lambda: ledger.validate_all(RiskClass.R2))
+            )
+            best_of(timings, "ledger.get_statistics", time_call(ledger.get_statistics))
+            best_of(timings, "ledger.to_markdown_table", time_call(ledger.to_markdown_table))
+    
+    return timings
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float
+) -> List[Dict[str, Any]]:
+    """
+    Compare timings against a baseline.
+    
+    A metric regresses when it is slower than (1 + tolerance) times its
+    baseline and the difference exceeds the noise floor.
+    
+    Returns:
+        List of regressions with scenario, metric, both timings and ratio
+    """
+    regressions = []
+    for scenario, timings in results.items():
+        for metric, seconds in timings.items():
+            base = baseline.get(scenario, {}).get(metric)
+            if base is None:
+                continue
+            if seconds > base * (1 + tolerance) and seconds - base > NOISE_FLOOR:
+                regressions.append({
+                    "scenario": scenario,
+                    "metric": metric,
+                    "baseline": base,
+                    "current": seconds,
+                    "ratio": seconds / base if base else float("inf")
+                })
+    return regressions
+
+
+def main():
+    """Run the benchmark suite"""
+    parser = argparse.ArgumentParser(description="ARCHI-Ω v1.2 - Benchmark Suite")
+    parser.add_argument('--scenario', action='append', choices=list(SCENARIOS),
+                        help='Scenario to run (repeatable; default: all but claims-1m)')
+    parser.add_argument('--all', action='store_true', help='Run every scenario, including claims-1m')
+    parser.add_argument('--ledger', choices=list(LEDGER_CLASSES), default='dict',
+                        help='Claim ledger backend (default: dict)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per scenario, best kept (default: 3)')
+    parser.add_argument('--seed', type=int, default=0, help='Generator seed (default: 0)')
+    parser.add_argument('-o', '--output', type=Path, help='Write results JSON to this file (default: stdout)')
+    parser.add_argument('--baseline', type=Path, help='Results JSON to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed slowdown over the baseline (default: 0.25 = 25%%)')
+    args = parser.parse_args()
+    
+    scenarios = list(SCENARIOS) if args.all else (args.scenario or DEFAULT_SCENARIOS)
+    results: Dict[str, Dict[str, float]] = {}
+    for name in scenarios:
+        print(f"Running {name}...", file=sys.stderr)
+        results[name] = run_scenario(SCENARIOS[name], LEDGER_CLASSES[args.ledger], args.repeat, args.seed)
+    
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "ledger": args.ledger,
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    document = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(document + "\n")
+        print(f"Results written to {args.output}", file=sys.stderr)
+    else:
+        print(document)
+    
+    if not args.baseline:
+        return 0
+    
+    baseline = json.loads(args.baseline.read_text())
+    if baseline["meta"].get("ledger") != args.ledger:
+        print(f"Warning: baseline was measured with the {baseline['meta'].get('ledger')} ledger",
+              file=sys.stderr)
+    regressions = compare(results, baseline["results"], args.tolerance)
+    if not regressions:
+        print(f"No regression against {args.baseline}", file=sys.stderr)
+        return 0
+    
+    print(f"Regressions against {args.baseline}:", file=sys.stderr)
+    for item in regressions:
+        print(
+            f"  {item['scenario']} {item['metric']}: {item['baseline']:.4f}s -> "
+            f"{item['current']:.4f}s ({item['ratio']:.2f}x)",
+            file=sys.stderr
+        )
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
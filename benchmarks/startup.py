@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+ARCHI-Ω v1.2 - Start-up Benchmark
+
+Measures the cold start of the archi-omega entry point:
+1. ``python -X importtime -c "import archi_omega.cli"`` in fresh interpreters
+2. The modules with the largest cumulative import time
+3. Wall time of ``archi-omega --version``
+
+The best of several runs is kept. With --budget-ms, the import time of
+archi_omega.cli is checked against a budget, e.g. in CI.
+
+Exit code: 0 if within budget (or no budget given), 1 otherwise
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+SRC = Path(__file__).parent.parent / "src"
+
+ENTRY_MODULE = "archi_omega.cli"
+
+# "import time:      self [us] |   cumulative | imported package"
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s*\|\s*(\d+)\s*\|\s*(\S+)")
+
+
+def _environment() -> Dict[str, str]:
+    """Environment of the child interpreters, with src on the path"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC), env.get("PYTHONPATH")]))
+    return env
+
+
+def parse_importtime(output: str) -> Dict[str, float]:
+    """
+    Parse ``-X importtime`` output.
+    
+    Returns:
+        Dict mapping module name to cumulative import time in milliseconds
+    """
+    cumulative = {}
+    for line in output.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            cumulative[match.group(3)] = int(match.group(2)) / 1000
+    return cumulative
+
+
+def measure_import(module: str) -> Dict[str, float]:
+    """Import a module in a fresh interpreter and return its import times"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=_environment(),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return parse_importtime(result.stderr)
+
+
+def measure_version() -> float:
+    """Wall time of ``archi-omega --version`` in milliseconds"""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", ENTRY_MODULE, "--version"],
+        env=_environment(),
+        capture_output=True,
+        check=True
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def slowest_modules(timings: Dict[str, float], count: int) -> List[Tuple[str, float]]:
+    """Modules with the largest cumulative import time, entry module excluded"""
+    others = [(name, ms) for name, ms in timings.items() if name != ENTRY_MODULE]
+    return sorted(others, key=lambda item: item[1], reverse=True)[:count]
+
+
+def main():
+    """Run the start-up benchmark"""
+    parser = argparse.ArgumentParser(description="ARCHI-Ω v1.2 - Start-up Benchmark")
+    parser.add_argument('--repeat', type=int, default=5, help='Runs, best kept (default: 5)')
+    parser.add_argument('--top', type=int, default=10, help='Slowest modules to report (default: 10)')
+    parser.add_argument('--budget-ms', type=float,
+                        help=f'Fail if importing {ENTRY_MODULE} takes longer (milliseconds)')
+    parser.add_argument('--json', action='store_true', help='Print the results as JSON')
+    args = parser.parse_args()
+    
+    # Per module, the best cumulative time over the runs
+    timings: Dict[str, float] = {}
+    version_ms = float("inf")
+    for _ in range(args.repeat):
+        for name, ms in measure_import(ENTRY_MODULE).items():
+            timings[name] = min(ms, timings.get(name, ms))
+        version_ms = min(version_ms, measure_version())
+    
+    import_ms = timings[ENTRY_MODULE]
+    report = {
+        "python": sys.version.split()[0],
+        "repeat": args.repeat,
+        "import_ms": import_ms,
+        "version_ms": version_ms,
+        "slowest": dict(slowest_modules(timings, args.top)),
+        "budget_ms": args.budget_ms
+    }
+    
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"import {ENTRY_MODULE}: {import_ms:.1f} ms")
+        print(f"archi-omega --version: {version_ms:.1f} ms (wall, interpreter start included)")
+        print("Slowest imports (cumulative):")
+        for name, ms in report["slowest"].items():
+            print(f"  {ms:8.1f} ms  {name}")
+    
+    if args.budget_ms is not None and import_ms > args.budget_ms:
+        print(f"Start-up over budget: {import_ms:.1f} ms > {args.budget_ms:.1f} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
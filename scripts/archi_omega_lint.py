@@ -9,12 +9,18 @@ This script performs fail-closed validation of the framework implementation:
 4. Ensures no fabricated facts/sources
 5. Validates proof budget compliance
 
+Check 1 scans every Markdown, YAML and Python file of the tree (see
+archi_omega.doclint), skipping files unchanged since the last run, and can
+write its findings as JSON or SARIF.
+
 Exit code: 0 if all checks pass, 1 if any check fails
 """
 
+import argparse
+import json
 import sys
-import re
 from pathlib import Path
+from typing import List, Optional
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -28,61 +34,44 @@ RESET = '\033[0m'
 class FailClosedValidator:
     """Validates framework implementation against fail-closed principles"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        paths: Optional[List[str]] = None,
+        cache_path: Optional[Path] = None,
+        workers: Optional[int] = None
+    ):
         self.issues = []
         self.warnings = []
         self.checks_passed = 0
         self.checks_failed = 0
+        self.paths = paths
+        self.cache_path = cache_path
+        self.workers = workers
+        self.lint_report = None
     
     def check_overpromise_keywords(self, root_path: Path) -> bool:
-        """Check for overpromise keywords in documentation"""
+        """Check for overpromise keywords in documentation and sources"""
         print("\n[CHECK 1] Overpromise Keywords")
         print("=" * 60)
         
-        # Keywords that indicate overpromises
-        overpromise_patterns = [
-            (r'\bguarantee[sd]?\b(?! keyword)', 'guarantee/guaranteed'),
-            (r'\bgaranti[st]?\b(?! keyword)', 'garanti/garantis'),
-            (r'\bassured?\b(?! keyword)', 'assured'),
-            (r'\bassuré[es]?\b(?! keyword)', 'assuré'),
-            (r'\bcertain results?\b', 'certain results'),
-            (r'\brésultats certains?\b', 'résultats certains'),
-            (r'\b100%(?!\s+(uptime|coverage|test))', '100% (without context)'),
-            (r'\bargent assuré', 'argent assuré'),
-            (r'\bça marche sûr', 'ça marche sûr'),
-        ]
-        
-        # Files to check (exclude rules documentation)
-        files_to_check = [
-            'README.md',
-            'STATUS.md',
-            'setup.py'
-        ]
-        
-        found_issues = []
+        from archi_omega.doclint import lint_tree
         
-        for file_name in files_to_check:
-            file_path = root_path / file_name
-            if not file_path.exists():
-                continue
-            
-            content = file_path.read_text()
-            
-            for pattern, keyword_name in overpromise_patterns:
-                matches = list(re.finditer(pattern, content, re.IGNORECASE))
-                if matches:
-                    for match in matches:
-                        # Get line number
-                        line_num = content[:match.start()].count('\n') + 1
-                        line = content.split('\n')[line_num - 1]
-                        found_issues.append(
-                            f"  {file_name}:{line_num} - Found '{keyword_name}': {line.strip()}"
-                        )
+        # Every Markdown/YAML/Python file, except the rules documentation
+        self.lint_report = lint_tree(
+            root_path,
+            paths=self.paths,
+            cache_path=self.cache_path,
+            workers=self.workers
+        )
+        report = self.lint_report
+        print(f"  {report.files} files scanned ({report.cached} unchanged since the last run)")
         
-        if found_issues:
+        if report.findings:
             print(f"{RED}✗ FAIL{RESET} - Overpromise keywords detected:")
-            for issue in found_issues:
-                print(issue)
+            for finding in report.findings:
+                print(
+                    f"  {finding.path}:{finding.line} - Found '{finding.keyword}': {finding.text}"
+                )
             self.issues.append("Overpromise keywords found in documentation")
             self.checks_failed += 1
             return False
@@ -313,8 +302,35 @@ class FailClosedValidator:
 def main():
     """Main entry point"""
     root_path = Path(__file__).parent.parent
-    validator = FailClosedValidator()
+    
+    from archi_omega.doclint import CACHE_FILE
+    
+    parser = argparse.ArgumentParser(description="ARCHI-Ω v1.2 - Fail-Closed Validation")
+    parser.add_argument('paths', nargs='*',
+                        help='Files to scan for overpromises (default: whole tree)')
+    parser.add_argument('--json', type=Path, help='Write the overpromise findings as JSON')
+    parser.add_argument('--sarif', type=Path, help='Write the overpromise findings as SARIF 2.1.0')
+    parser.add_argument('--cache', type=Path, default=root_path / CACHE_FILE,
+                        help=f'Content-hash cache of the scan (default: {CACHE_FILE})')
+    parser.add_argument('--no-cache', action='store_true', help='Scan every file again')
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help='Scan processes; 0 scans in-process (default: number of cores)')
+    args = parser.parse_args()
+    
+    root = root_path.resolve()
+    paths = [Path(path).resolve().relative_to(root).as_posix() for path in args.paths]
+    validator = FailClosedValidator(
+        paths=paths or None,
+        cache_path=None if args.no_cache else args.cache,
+        workers=args.workers
+    )
     exit_code = validator.run_all_checks(root_path)
+    
+    report = validator.lint_report
+    if args.json:
+        args.json.write_text(json.dumps(report.to_json(), indent=2), encoding="utf-8")
+    if args.sarif:
+        args.sarif.write_text(json.dumps(report.to_sarif(), indent=2), encoding="utf-8")
     sys.exit(exit_code)
 
 
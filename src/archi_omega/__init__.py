@@ -13,30 +13,73 @@ A comprehensive architectural framework with:
 __version__ = "1.2.0"
 __author__ = "launchgard"
 
-from .epistemic.foundation import (
-    ProofLevel,
-    RiskClass,
-    TestabilityLevel,
-    OriginTag,
-    ProofBudget,
-    Claim,
-    ClaimLedger,
-    RiskClassifier,
-    ProofValidator
-)
+import importlib
+from typing import TYPE_CHECKING
+
+# Public names and the modules defining them. They are imported on first
+# access (PEP 562) so that ``import archi_omega`` and the CLI start fast.
+_EXPORTS = {
+    # Epistemic
+    "ProofLevel": ".epistemic.foundation",
+    "RiskClass": ".epistemic.foundation",
+    "TestabilityLevel": ".epistemic.foundation",
+    "OriginTag": ".epistemic.foundation",
+    "ProofBudget": ".epistemic.foundation",
+    "Claim": ".epistemic.foundation",
+    "ClaimLedger": ".epistemic.foundation",
+    "RiskClassifier": ".epistemic.foundation",
+    "ProofValidator": ".epistemic.foundation",
+    "ClaimCheck": ".epistemic.foundation",
+    "ClaimValidations": ".epistemic.foundation",
+    "DependencyIndex": ".epistemic.dependencies",
+    "ColumnarClaimLedger": ".epistemic.columnar",
+    "ClaimView": ".epistemic.columnar",
+    "ClaimStore": ".epistemic.store",
+    "PersistentClaimLedger": ".epistemic.store",
+    "ShardedClaimLedger": ".epistemic.sharded",
+    
+    # Pipeline
+    "Pipeline": ".pipeline.stages",
+    "ProjectContext": ".pipeline.stages",
+    "TerminationCode": ".pipeline.stages",
+    "Compiler": ".pipeline.stages",
+    "Expander": ".pipeline.stages",
+    "Brancher": ".pipeline.stages",
+    "Linter": ".pipeline.stages",
+    "Stressor": ".pipeline.stages",
+    "Selector": ".pipeline.stages",
+    "Committer": ".pipeline.stages",
+    "AsyncPipeline": ".pipeline.async_runner"
+}
+
+if TYPE_CHECKING:  # pragma: no cover - static analysis only
+    from .epistemic.foundation import (
+        ProofLevel, RiskClass, TestabilityLevel, OriginTag, ProofBudget,
+        Claim, ClaimLedger, RiskClassifier, ProofValidator, ClaimCheck, ClaimValidations
+    )
+    from .epistemic.dependencies import DependencyIndex
+    from .epistemic.columnar import ColumnarClaimLedger, ClaimView
+    from .epistemic.store import ClaimStore, PersistentClaimLedger
+    from .epistemic.sharded import ShardedClaimLedger
+    from .pipeline.stages import (
+        Pipeline, ProjectContext, TerminationCode, Compiler, Expander,
+        Brancher, Linter, Stressor, Selector, Committer
+    )
+    from .pipeline.async_runner import AsyncPipeline
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
 
-from .pipeline.stages import (
-    Pipeline,
-    ProjectContext,
-    TerminationCode,
-    Compiler,
-    Expander,
-    Brancher,
-    Linter,
-    Stressor,
-    Selector,
-    Committer
-)
 
 __all__ = [
     # Epistemic
@@ -49,6 +92,14 @@ __all__ = [
     "ClaimLedger",
     "RiskClassifier",
     "ProofValidator",
+    "ClaimCheck",
+    "ClaimValidations",
+    "DependencyIndex",
+    "ColumnarClaimLedger",
+    "ClaimView",
+    "ClaimStore",
+    "PersistentClaimLedger",
+    "ShardedClaimLedger",
     
     # Pipeline
     "Pipeline",
@@ -60,5 +111,6 @@ __all__ = [
     "Linter",
     "Stressor",
     "Selector",
-    "Committer"
+    "Committer",
+    "AsyncPipeline"
 ]
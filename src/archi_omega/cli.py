@@ -2,46 +2,40 @@
 ARCHI-Ω v1.2 - Command Line Interface
 
 Simple CLI for running the ARCHI-Ω framework.
+
+PyYAML and the pipeline are imported only by the code paths that need them,
+so that e.g. ``--version`` starts fast.
 """
 
 import argparse
+import glob
+import json
+import os
 import sys
-import yaml
+from collections import Counter
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Iterator, Optional, TextIO, TYPE_CHECKING
 
-from .pipeline.stages import Pipeline, ProjectContext
-from .epistemic.foundation import OriginTag, ProofLevel, TestabilityLevel, Claim
+if TYPE_CHECKING:  # pragma: no cover - annotations only
+    from .epistemic.foundation import ClaimLedger
+    from .pipeline.cache import ResultCache
+    from .pipeline.stages import Pipeline, ProjectContext
 
 
-def load_user_input(input_file: Path) -> ProjectContext:
-    """Load user input from YAML file"""
-    context = ProjectContext()
-    
-    if input_file.suffix in ['.yaml', '.yml']:
-        with open(input_file, 'r') as f:
-            data = yaml.safe_load(f)
-            
-        # Map YAML fields to context
-        context.goal = data.get('GOAL', '')
-        context.deliverable = data.get('DELIVERABLE', '')
-        context.users_load = data.get('USERS_LOAD', {})
-        context.sla_slo = data.get('SLA_SLO', {})
-        context.data = data.get('DATA', {})
-        context.constraints = data.get('CONSTRAINTS', {})
-        context.integrations = data.get('INTEGRATIONS', [])
-        context.ops = data.get('OPS', {})
-        context.security = data.get('SECURITY', {})
-        context.ai_ml = data.get('AI_ML')
-        context.done_criteria = data.get('DONE', {})
-    
-    return context
+def load_user_input(input_file: Path) -> "ProjectContext":
+    """Load and validate user input from a YAML, JSON or MessagePack file"""
+    from .ingest import load_input
+    return load_input(input_file)
 
 
 def load_config(config_file: Path) -> Dict[str, Any]:
     """Load configuration from YAML file"""
-    with open(config_file, 'r') as f:
-        config = yaml.safe_load(f)
+    from .epistemic.foundation import budgets_from_config
+    from .pipeline.catalog import weights_from_config
+    from .pipeline.selection import DEFAULT_SENSITIVITY_SAMPLES
+    from .ingest import load_yaml
+    config = load_yaml(config_file)
+    score_matrix = config.get('score_matrix') or {}
     
     return {
         "mode": config.get('mode', 'MAXCAP'),
@@ -51,81 +45,259 @@ def load_config(config_file: Path) -> Dict[str, Any]:
         "auto_gov": config.get('auto_gov', True),
         "auto_tools": config.get('auto_tools', True),
         "pcx": config.get('pcx', True),
-        "nest": config.get('nest', True)
+        "nest": config.get('nest', True),
+        "proof_budgets": budgets_from_config(config.get('risk_classes', {})),
+        "score_weights": weights_from_config(score_matrix),
+        "sensitivity_samples": int(
+            score_matrix.get('sensitivity_samples', DEFAULT_SENSITIVITY_SAMPLES)
+        )
     }
 
 
-def format_deliverable_markdown(deliverable: Dict[str, Any]) -> str:
-    """Format deliverable as markdown"""
-    lines = [
-        "# ARCHI-Ω v1.2 - Deliverable",
-        "",
-        "## 0) FACTS [USER]",
-        ""
-    ]
+def _sensitivity_markdown(deliverable: Dict[str, Any]) -> Iterator[str]:
+    """Yield the weight sensitivity lines of the recommendation, if any"""
+    select = deliverable.get('validation_summary', {}).get('select') or {}
+    sensitivity = select.get('sensitivity')
+    if not sensitivity:
+        return
+    yield (
+        f"**Stability:** {sensitivity['stability']:.1%} of "
+        f"{sensitivity['samples']} weight samples"
+    )
+    flip = sensitivity['flip']
+    if flip is None:
+        yield "**Flip distance:** none, no reweighting overturns the recommendation"
+    else:
+        yield (
+            f"**Flip distance:** {flip['weight_shift']:.1%} of the weight towards "
+            f"{flip['towards']} makes {flip['option']} overtake"
+        )
+
+
+def iter_deliverable_markdown(
+    deliverable: Dict[str, Any],
+    ledger: Optional["ClaimLedger"] = None
+) -> Iterator[str]:
+    """
+    Yield the markdown deliverable line by line.
+    
+    If a claim ledger is given, its table is streamed from the ledger instead
+    of being read from the deliverable.
+    """
+    yield "# ARCHI-Ω v1.2 - Deliverable"
+    yield ""
+    yield "## 0) FACTS [USER]"
+    yield ""
     
     for fact in deliverable.get('facts', []):
-        lines.append(f"- {fact}")
+        yield f"- {fact}"
     
-    lines.extend([
-        "",
-        "## 1) OPEN QUESTIONS",
-        ""
-    ])
+    yield ""
+    yield "## 1) OPEN QUESTIONS"
+    yield ""
     
     for question in deliverable.get('open_questions', []):
-        lines.append(f"- {question}")
+        yield f"- {question}"
     
-    lines.extend([
-        "",
-        "## 2) ASSUMPTIONS [HYP]",
-        ""
-    ])
+    yield ""
+    yield "## 2) ASSUMPTIONS [HYP]"
+    yield ""
     
     for assumption in deliverable.get('assumptions', []):
-        lines.append(f"- {assumption}")
+        yield f"- {assumption}"
     
-    lines.extend([
-        "",
-        "## 3) OPTIONS",
-        ""
-    ])
+    yield ""
+    yield "## 3) OPTIONS"
+    yield ""
     
     for option in deliverable.get('options', []):
-        lines.append(f"### {option.get('name', 'Unknown')}")
-        lines.append(f"**Total Score:** {option.get('total_score', 0)}")
-        lines.append("")
+        yield f"### {option.get('id', '?')}: {option.get('name', 'Unknown')}"
+        yield f"**Total Score:** {option.get('total_score', 0)}"
+        scores = option.get('scores', {})
+        if scores:
+            yield ""
+            yield "| " + " | ".join(scores) + " |"
+            yield "|" + "---|" * len(scores)
+            yield "| " + " | ".join(str(score) for score in scores.values()) + " |"
+            yield ""
+        tradeoffs = option.get('tradeoffs', {})
+        for label, key in (("Advantages", "advantages"), ("Disadvantages", "disadvantages")):
+            if tradeoffs.get(key):
+                yield f"**{label}:** {', '.join(tradeoffs[key])}"
+        yield ""
     
-    lines.extend([
-        "",
-        "## 4) RECOMMENDATION",
-        ""
-    ])
+    yield ""
+    yield "## 4) RECOMMENDATION"
+    yield ""
     
     rec = deliverable.get('recommendation')
     if rec:
-        lines.append(f"**Recommended Option:** {rec.get('name', 'Unknown')}")
-        lines.append(f"**Score:** {rec.get('total_score', 0)}")
+        yield f"**Recommended Option:** {rec.get('name', 'Unknown')}"
+        yield f"**Score:** {rec.get('total_score', 0)}"
+        yield from _sensitivity_markdown(deliverable)
+    else:
+        yield "No recommendation available"
+    
+    yield ""
+    yield "## 11) CLAIM LEDGER"
+    yield ""
+    if ledger is not None:
+        yield from ledger.iter_markdown_table()
     else:
-        lines.append("No recommendation available")
+        yield deliverable.get('claim_ledger', 'No claims recorded')
+    yield ""
+    yield "## 12) TERMINATION"
+    yield ""
+    yield f"**TERM:** {deliverable.get('termination', 'UNKNOWN')}"
+    yield ""
+
+
+def format_deliverable_markdown(deliverable: Dict[str, Any]) -> str:
+    """Format deliverable as markdown"""
+    return "\n".join(iter_deliverable_markdown(deliverable))
+
+
+OUTPUT_EXTENSIONS = {
+    'markdown': '.md',
+    'yaml': '.yaml',
+    'json': '.json'
+}
+
+
+def render_deliverable(deliverable: Dict[str, Any], output_format: str) -> str:
+    """Render a deliverable in one of the CLI output formats"""
+    if output_format == 'markdown':
+        return format_deliverable_markdown(deliverable)
+    elif output_format == 'yaml':
+        import yaml
+        return yaml.dump(deliverable, default_flow_style=False)
+    else:  # json
+        return json.dumps(deliverable, indent=2, default=str)
+
+
+def write_deliverable(
+    deliverable: Dict[str, Any],
+    output_format: str,
+    stream: TextIO,
+    ledger: Optional["ClaimLedger"] = None
+) -> None:
+    """
+    Write a deliverable to a file handle without building it in memory.
     
-    lines.extend([
-        "",
-        "## 11) CLAIM LEDGER",
-        "",
-        deliverable.get('claim_ledger', 'No claims recorded'),
-        "",
-        "## 12) TERMINATION",
-        "",
-        f"**TERM:** {deliverable.get('termination', 'UNKNOWN')}",
-        ""
-    ])
+    For markdown, a claim ledger can be given to stream its table directly
+    (see Pipeline.execute with render_ledger=False).
+    """
+    if output_format == 'markdown':
+        lines = iter_deliverable_markdown(deliverable, ledger)
+        stream.write(next(lines))
+        for line in lines:
+            stream.write("\n")
+            stream.write(line)
+    elif output_format == 'yaml':
+        import yaml
+        yaml.dump(deliverable, stream, default_flow_style=False)
+    else:  # json
+        json.dump(deliverable, stream, indent=2, default=str)
+
+
+def is_batch_input(input_path: Path) -> bool:
+    """Check whether the input designates several files (directory or glob)"""
+    return input_path.is_dir() or glob.has_magic(str(input_path))
+
+
+def collect_batch_inputs(input_path: Path) -> List[Path]:
+    """Expand a directory or glob pattern into a sorted list of input files"""
+    from .ingest import INPUT_FORMATS
+    if input_path.is_dir():
+        files = [f for f in input_path.iterdir() if f.suffix.lower() in INPUT_FORMATS]
+    else:
+        files = [Path(p) for p in glob.glob(str(input_path))]
+    return sorted(f for f in files if f.is_file())
+
+
+def batch_output_paths(inputs: List[Path], output_dir: Path, extension: str) -> List[Path]:
+    """
+    Output file of each batch input, so that no two inputs share one.
     
-    return "\n".join(lines)
+    Inputs keep their path relative to the directory containing all of
+    them, with the output extension; inputs differing only by their suffix
+    (e.g. ``a.yaml`` and ``a.json``) keep it too (``a.yaml.md``, ``a.json.md``).
+    """
+    absolute = [Path(os.path.abspath(path)) for path in inputs]
+    root = Path(os.path.commonpath([str(path.parent) for path in absolute]))
+    relative = [path.relative_to(root) for path in absolute]
+    stems = Counter(path.with_suffix('') for path in relative)
+    return [
+        output_dir / path.parent / (
+            (path.name if stems[path.with_suffix('')] > 1 else path.stem) + extension
+        )
+        for path in relative
+    ]
+
 
+def make_cache(args: argparse.Namespace) -> Optional["ResultCache"]:
+    """Build the result cache requested on the command line, if any"""
+    if not args.cache:
+        return None
+    from .pipeline.cache import ResultCache
+    return ResultCache(path=args.cache)
 
-def main():
+
+def make_pipeline(args: argparse.Namespace, config: Optional[Dict[str, Any]]) -> "Pipeline":
+    """Build the pipeline requested on the command line"""
+    from .pipeline.stages import Pipeline
+    return Pipeline(config, make_cache(args), instrument=bool(args.telemetry))
+
+
+def run_batch(args: argparse.Namespace, config: Dict[str, Any]) -> int:
+    """Run the pipeline over every input of a directory or glob"""
+    inputs = collect_batch_inputs(args.input)
+    if not inputs:
+        print(f"Error: No input files match '{args.input}'", file=sys.stderr)
+        return 1
+    
+    output_dir = args.output or Path('deliverables')
+    output_dir.mkdir(parents=True, exist_ok=True)
+    targets = batch_output_paths(inputs, output_dir, OUTPUT_EXTENSIONS[args.format])
+    for directory in {target.parent for target in targets}:
+        directory.mkdir(parents=True, exist_ok=True)
+    
+    def write_result(index: int, deliverable: Dict[str, Any]) -> None:
+        with open(targets[index], 'w') as stream:
+            write_deliverable(deliverable, args.format, stream)
+    
+    def report_error(index: int, error: BaseException) -> None:
+        print(f"Error processing '{inputs[index]}': {error}", file=sys.stderr)
+    
+    print(f"Executing ARCHI-Ω pipeline on {len(inputs)} inputs...", file=sys.stderr)
+    pipeline = make_pipeline(args, config)
+    counts = pipeline.execute_many(
+        inputs,
+        max_workers=args.workers,
+        loader=load_user_input,
+        on_result=write_result,
+        on_error=report_error
+    )
+    
+    print(f"Deliverables written to {output_dir}", file=sys.stderr)
+    print("\nTermination summary:", file=sys.stderr)
+    for term, count in counts.items():
+        if count:
+            print(f"  {term}: {count}", file=sys.stderr)
+    
+    return 1 if counts["ERROR"] else 0
+
+
+def main(argv: Optional[List[str]] = None):
     """Main CLI entry point"""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == 'serve':
+        from .server import main as serve_main
+        return serve_main(argv[1:])
+    if argv and argv[0] == 'watch':
+        from .watch import main as watch_main
+        return watch_main(argv[1:])
+    
     parser = argparse.ArgumentParser(
         description="ARCHI-Ω v1.2 - Architectural Framework CLI"
     )
@@ -133,7 +305,10 @@ def main():
     parser.add_argument(
         'input',
         type=Path,
-        help='Input file (YAML or markdown) with user requirements'
+        help='Input file (YAML or markdown) with user requirements, '
+             'or a directory/glob of input files for batch mode '
+             '(run "archi-omega serve --help" for the pipeline service, '
+             '"archi-omega watch --help" to re-run on file changes)'
     )
     
     parser.add_argument(
@@ -146,7 +321,8 @@ def main():
     parser.add_argument(
         '-o', '--output',
         type=Path,
-        help='Output file for deliverable (default: stdout)'
+        help='Output file for deliverable (default: stdout); '
+             'output directory in batch mode (default: deliverables)'
     )
     
     parser.add_argument(
@@ -156,25 +332,41 @@ def main():
         help='Output format (default: markdown)'
     )
     
+    parser.add_argument(
+        '-j', '--workers',
+        type=int,
+        default=None,
+        help='Worker processes for batch mode (default: number of cores)'
+    )
+    
+    parser.add_argument(
+        '--cache',
+        type=Path,
+        help='SQLite file caching deliverables of unchanged inputs'
+    )
+    
+    parser.add_argument(
+        '--telemetry',
+        choices=['json', 'prometheus'],
+        help='Print per-stage timing, memory and item counts to stderr; '
+             'in batch mode they are added to each validation summary'
+    )
+    
     parser.add_argument(
         '--version',
         action='version',
         version='ARCHI-Ω v1.2'
     )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    
+    batch = is_batch_input(args.input)
     
     # Load input
-    if not args.input.exists():
+    if not batch and not args.input.exists():
         print(f"Error: Input file '{args.input}' not found", file=sys.stderr)
         return 1
     
-    try:
-        context = load_user_input(args.input)
-    except Exception as e:
-        print(f"Error loading input: {e}", file=sys.stderr)
-        return 1
-    
     # Load config
     config = {}
     if args.config.exists():
@@ -184,33 +376,45 @@ def main():
             print(f"Warning: Could not load config: {e}", file=sys.stderr)
             print("Using default configuration", file=sys.stderr)
     
+    if batch:
+        return run_batch(args, config)
+    
+    try:
+        context = load_user_input(args.input)
+    except Exception as e:
+        print(f"Error loading input: {e}", file=sys.stderr)
+        return 1
+    
     # Run pipeline
     print("Executing ARCHI-Ω pipeline...", file=sys.stderr)
-    pipeline = Pipeline(config)
+    pipeline = make_pipeline(args, config)
+    
+    # Markdown streams the claim ledger table straight from the ledger
+    stream_ledger = args.format == 'markdown'
     
     try:
-        deliverable = pipeline.execute(context)
+        deliverable = pipeline.execute(context, render_ledger=not stream_ledger)
     except Exception as e:
         print(f"Error executing pipeline: {e}", file=sys.stderr)
         return 1
     
-    # Format output
-    if args.format == 'markdown':
-        output = format_deliverable_markdown(deliverable)
-    elif args.format == 'yaml':
-        output = yaml.dump(deliverable, default_flow_style=False)
-    else:  # json
-        import json
-        output = json.dumps(deliverable, indent=2, default=str)
+    ledger = context.claim_ledger if stream_ledger else None
     
     # Write output
     if args.output:
-        args.output.write_text(output)
+        with open(args.output, 'w') as stream:
+            write_deliverable(deliverable, args.format, stream, ledger)
         print(f"Deliverable written to {args.output}", file=sys.stderr)
     else:
-        print(output)
+        write_deliverable(deliverable, args.format, sys.stdout, ledger)
+        sys.stdout.write("\n")
     
     print(f"\nTermination: {deliverable.get('termination', 'UNKNOWN')}", file=sys.stderr)
+    
+    if args.telemetry == 'json':
+        print(pipeline.telemetry.to_json(), file=sys.stderr)
+    elif args.telemetry == 'prometheus':
+        print(pipeline.telemetry.to_prometheus(), end='', file=sys.stderr)
     return 0
 
 
@@ -0,0 +1,306 @@
+"""
+ARCHI-Ω v1.2 - Documentation Linter
+
+Overpromise check of a source tree, used by scripts/archi_omega_lint.py:
+- Every Markdown, YAML and Python file under the root, minus DEFAULT_EXCLUDES
+  (the documents defining the rules themselves)
+- Line and column of each match from a line-offset index (bisect lookups)
+- Files linted on a process pool once there are enough of them
+- Content-hash cache: unchanged files keep their previous findings
+- JSON and SARIF 2.1.0 reports
+"""
+
+import fnmatch
+import hashlib
+import json
+import os
+import re
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# Rule ID -> (keyword name, literal every match contains, pattern); patterns
+# are matched case-insensitively, and only run on texts containing the literal
+OVERPROMISE_RULES: Dict[str, Tuple[str, str, str]] = {
+    "OP001": ("guarantee/guaranteed", "guarantee", r'\bguarantee[sd]?\b(?! keyword)'),
+    "OP002": ("garanti/garantis", "garanti", r'\bgaranti[st]?\b(?! keyword)'),
+    "OP003": ("assured", "assure", r'\bassured?\b(?! keyword)'),
+    "OP004": ("assuré", "assuré", r'\bassuré[es]?\b(?! keyword)'),
+    "OP005": ("certain results", "certain result", r'\bcertain results?\b'),
+    "OP006": ("résultats certains", "résultats certain", r'\brésultats certains?\b'),
+    "OP007": ("100% (without context)", "100%", r'\b100%(?!\s+(uptime|coverage|test))'),
+    "OP008": ("argent assuré", "argent assuré", r'\bargent assuré'),
+    "OP009": ("ça marche sûr", "ça marche sûr", r'\bça marche sûr'),
+}
+
+# Files linted, by suffix
+LINT_SUFFIXES = (".md", ".yaml", ".yml", ".py")
+
+# Paths (relative, POSIX, fnmatch patterns) not linted: the rules, their
+# documentation and their tests quote the keywords on purpose
+DEFAULT_EXCLUDES = (
+    "ARCHI-OMEGA-v1.2.md",
+    "QUICK-REFERENCE.md",
+    "VALIDATION.md",
+    ".github/*",
+    "archi-omega-config.yaml",
+    "scripts/*",
+    "tests/*",
+    "src/archi_omega/doclint.py",
+    "src/archi_omega/utils/keywords.py",
+)
+
+# Directories never walked into
+SKIPPED_DIRS = frozenset({
+    ".git", "__pycache__", ".pytest_cache", ".mypy_cache", ".ruff_cache",
+    ".tox", ".nox", ".venv", "venv", "node_modules", "build", "dist"
+})
+
+# Lines containing this marker are not reported (e.g. in an HTML comment)
+ALLOW_MARKER = "archi-omega-lint: allow"
+
+# Trees with fewer files to lint are processed in-process
+PARALLEL_MIN_FILES = 64
+
+CACHE_FILE = ".archi-omega-lint-cache.json"
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+_PATTERNS = [
+    (rule_id, name, literal, re.compile(pattern, re.IGNORECASE))
+    for rule_id, (name, literal, pattern) in OVERPROMISE_RULES.items()
+]
+
+# Cached findings are only reused with the rules that produced them
+RULES_DIGEST = hashlib.sha256(
+    json.dumps([OVERPROMISE_RULES, ALLOW_MARKER], ensure_ascii=False).encode("utf-8")
+).hexdigest()
+
+
+@dataclass(frozen=True)
+class Finding:
+    """An overpromise keyword found in a file"""
+    path: str
+    line: int
+    column: int
+    rule_id: str
+    keyword: str
+    text: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class LintReport:
+    """Findings of a tree lint, with the number of files linted and reused"""
+    root: str
+    findings: List[Finding] = field(default_factory=list)
+    files: int = 0
+    cached: int = 0
+    
+    @property
+    def passed(self) -> bool:
+        return not self.findings
+    
+    def to_json(self) -> Dict[str, Any]:
+        """Report as a JSON-serializable dict"""
+        return {
+            "root": self.root,
+            "files": self.files,
+            "cached": self.cached,
+            "passed": self.passed,
+            "findings": [finding.to_dict() for finding in self.findings]
+        }
+    
+    def to_sarif(self) -> Dict[str, Any]:
+        """Report as a SARIF 2.1.0 log, e.g. for code scanning upload"""
+        rules = [
+            {
+                "id": rule_id,
+                "name": "Overpromise",
+                "shortDescription": {"text": f"Overpromise keyword '{name}'"},
+                "defaultConfiguration": {"level": "error"}
+            }
+            for rule_id, (name, _, _) in OVERPROMISE_RULES.items()
+        ]
+        results = [
+            {
+                "ruleId": finding.rule_id,
+                "level": "error",
+                "message": {"text": f"Overpromise keyword '{finding.keyword}'"},
+                "locations": [{
+                    "physicalLocation": {
+                        "artifactLocation": {"uri": finding.path, "uriBaseId": "%SRCROOT%"},
+                        "region": {
+                            "startLine": finding.line,
+                            "startColumn": finding.column,
+                            "snippet": {"text": finding.text}
+                        }
+                    }
+                }]
+            }
+            for finding in self.findings
+        ]
+        return {
+            "$schema": SARIF_SCHEMA,
+            "version": "2.1.0",
+            "runs": [{
+                "tool": {
+                    "driver": {"name": "archi-omega-lint", "version": "1.2.0", "rules": rules}
+                },
+                "results": results
+            }]
+        }
+
+
+class LineIndex:
+    """Start offsets of the lines of a text, for offset -> line lookups"""
+    
+    def __init__(self, text: str):
+        self.text = text
+        self.starts = [0]
+        self.starts.extend(match.end() for match in re.finditer("\n", text))
+    
+    def locate(self, offset: int) -> Tuple[int, int]:
+        """1-based (line, column) of a character offset"""
+        line = bisect_right(self.starts, offset)
+        return line, offset - self.starts[line - 1] + 1
+    
+    def line(self, number: int) -> str:
+        """Text of a 1-based line, without its line break"""
+        start = self.starts[number - 1]
+        end = self.starts[number] - 1 if number < len(self.starts) else len(self.text)
+        return self.text[start:end]
+
+
+def lint_text(text: str, path: str) -> List[Finding]:
+    """
+    Find overpromise keywords in a text.
+    
+    Returns:
+        Findings sorted by position
+    """
+    lowered = text.lower()
+    index: Optional[LineIndex] = None
+    findings = []
+    for rule_id, name, literal, pattern in _PATTERNS:
+        # A substring search is far cheaper than the regex on clean texts
+        if literal not in lowered:
+            continue
+        for match in pattern.finditer(text):
+            if index is None:
+                index = LineIndex(text)
+            line, column = index.locate(match.start())
+            line_text = index.line(line)
+            if ALLOW_MARKER in line_text:
+                continue
+            findings.append(Finding(path, line, column, rule_id, name, line_text.strip()))
+    findings.sort(key=lambda finding: (finding.line, finding.column, finding.rule_id))
+    return findings
+
+
+def _lint_file(task: Tuple[str, str, Optional[str]]) -> Tuple[str, str, Optional[List[Finding]]]:
+    """
+    Worker task: hash a file and lint it if its hash is not the cached one.
+    
+    Returns:
+        Tuple of (path, content hash, findings or None if unchanged)
+    """
+    root, path, cached_hash = task
+    payload = (Path(root) / path).read_bytes()
+    digest = hashlib.sha256(payload).hexdigest()
+    if digest == cached_hash:
+        return path, digest, None
+    return path, digest, lint_text(payload.decode("utf-8", errors="replace"), path)
+
+
+def _excluded(path: str, excludes: Iterable[str]) -> bool:
+    return any(fnmatch.fnmatchcase(path, pattern) for pattern in excludes)
+
+
+def iter_lint_files(root: Path, excludes: Iterable[str] = DEFAULT_EXCLUDES) -> Iterator[str]:
+    """Relative POSIX paths of the files to lint under root, sorted"""
+    excludes = tuple(excludes)
+    for directory, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(
+            name for name in dirnames
+            if name not in SKIPPED_DIRS and not name.endswith(".egg-info")
+        )
+        relative = Path(directory).relative_to(root)
+        for name in sorted(filenames):
+            if name.endswith(LINT_SUFFIXES):
+                path = (relative / name).as_posix()
+                if not _excluded(path, excludes):
+                    yield path
+
+
+def load_cache(path: Path) -> Dict[str, Dict[str, Any]]:
+    """File entries of a lint cache; empty if missing, unreadable or stale"""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("rules") != RULES_DIGEST:
+        return {}
+    return data.get("files", {})
+
+
+def save_cache(path: Path, entries: Dict[str, Dict[str, Any]]) -> None:
+    """Write a lint cache atomically"""
+    temporary = path.with_name(path.name + ".tmp")
+    temporary.write_text(json.dumps({"rules": RULES_DIGEST, "files": entries}), encoding="utf-8")
+    os.replace(temporary, path)
+
+
+def lint_tree(
+    root: Path,
+    paths: Optional[Iterable[str]] = None,
+    excludes: Iterable[str] = DEFAULT_EXCLUDES,
+    cache_path: Optional[Path] = None,
+    workers: Optional[int] = None
+) -> LintReport:
+    """
+    Lint the files of a tree for overpromise keywords.
+    
+    Args:
+        root: Tree root; findings use paths relative to it
+        paths: Relative paths to lint instead of walking the tree
+        excludes: fnmatch patterns of relative paths to skip
+        cache_path: Content-hash cache, read and rewritten (None: no cache)
+        workers: Worker processes (None: number of cores, 0: in-process)
+    
+    Returns:
+        LintReport with the findings sorted by path and position
+    """
+    root = Path(root)
+    if paths is None:
+        files = list(iter_lint_files(root, excludes))
+    else:
+        files = sorted({Path(path).as_posix() for path in paths})
+    cache = load_cache(cache_path) if cache_path is not None else {}
+    tasks = [(str(root), path, cache.get(path, {}).get("hash")) for path in files]
+    
+    if workers == 0 or len(tasks) < PARALLEL_MIN_FILES:
+        results = list(map(_lint_file, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, len(tasks) // (4 * (workers or os.cpu_count() or 1)))
+            results = list(executor.map(_lint_file, tasks, chunksize=chunksize))
+    
+    report = LintReport(str(root), files=len(results))
+    # Linting given paths keeps the cache entries of the other files
+    entries = dict(cache) if paths is not None else {}
+    for path, digest, findings in results:
+        if findings is None:
+            report.cached += 1
+            findings = [Finding(**finding) for finding in cache[path]["findings"]]
+        entries[path] = {"hash": digest, "findings": [finding.to_dict() for finding in findings]}
+        report.findings.extend(findings)
+    
+    if cache_path is not None:
+        save_cache(cache_path, entries)
+    return report
@@ -0,0 +1,497 @@
+"""
+ARCHI-Ω v1.2 - Columnar Claim Ledger
+
+Compact, array-backed storage for large claim ledgers:
+- Status, origin tag, proof level and testability stored as byte arrays
+- Claim texts and test descriptions interned in a shared string pool
+- Dependencies stored CSR-style (per-row offset/count into one index array)
+- Slotted ClaimView records, so the ClaimLedger API keeps working unchanged
+- Bulk statistics and validation over the encoded columns (NumPy when
+  available, pure Python otherwise)
+"""
+
+from array import array
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Mapping, NamedTuple, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+from .dependencies import DependencyIndex
+from .foundation import (
+    Claim, ClaimLedger, OriginTag, ProofLevel, RiskClass, TestabilityLevel,
+    ProofBudget, ClaimCheck, ClaimValidations, PROOF_BUDGETS, PROOF_RANK, TESTABILITY_RANK,
+    STRONG_CAUSALITY_MIN_RANK, HIGH_RISK_CLASSES
+)
+from ..utils.keywords import DEFAULT_SCANNER
+
+
+ORIGIN_TAGS = list(OriginTag)
+PROOF_LEVELS = list(ProofLevel)
+TESTABILITY_LEVELS = list(TestabilityLevel)
+DEFAULT_STATUSES = ["PASS", "FAIL", "UNKNOWN"]
+
+_ORIGIN_CODES = {tag: code for code, tag in enumerate(ORIGIN_TAGS)}
+# Column codes are the ordinal ranks, so level checks compare codes directly
+_PROOF_CODES = PROOF_RANK
+_TESTABILITY_CODES = TESTABILITY_RANK
+
+
+class ColumnChecks(NamedTuple):
+    """Column codes and thresholds of the ProofValidator checks for one run"""
+    unknown_origin: int  # Origin code flagged as UNKNOWN_ORIGIN, -1 for none
+    hypothesis: int  # Origin code of hypotheses
+    untested: int  # Status code of untested claims
+    min_testability: int  # Strong causality below this rank is flagged
+    min_proof: int  # Proof levels below this rank are flagged (0: no check)
+
+
+def column_flags(
+    origin: Sequence[int],
+    causal: Sequence[int],
+    testability: Sequence[int],
+    status: Sequence[int],
+    proof: Sequence[int],
+    checks: ColumnChecks
+) -> bytearray:
+    """
+    Compute the ClaimCheck bitmask of every row from encoded columns.
+    
+    Columns are byte buffers (array, memoryview, NumPy arrays) when NumPy is
+    available, or any equal-length integer sequences otherwise.
+    
+    Returns:
+        One mask byte per row
+    """
+    if np is not None:
+        origin = np.frombuffer(origin, dtype=np.int8)
+        causal = np.frombuffer(causal, dtype=np.int8).astype(bool)
+        testability = np.frombuffer(testability, dtype=np.int8)
+        status = np.frombuffer(status, dtype=np.int8)
+        flags = np.zeros(len(origin), dtype=np.uint8)
+        
+        def mark(rows, check: ClaimCheck) -> None:
+            flags[rows] |= np.uint8(check)
+        
+        mark(causal & (testability < checks.min_testability), ClaimCheck.UNTESTED_CAUSALITY)
+        untested_hypothesis = (origin == checks.hypothesis) & (status == checks.untested)
+        mark(untested_hypothesis, ClaimCheck.UNTESTED_HYPOTHESIS)
+        mark(origin == checks.unknown_origin, ClaimCheck.UNKNOWN_ORIGIN)
+        if checks.min_proof:
+            mark(np.frombuffer(proof, dtype=np.int8) < checks.min_proof, ClaimCheck.LOW_PROOF)
+        return bytearray(flags.tobytes())
+    
+    unknown_origin, hypothesis, untested, min_testability, min_proof = checks
+    origin_flag = int(ClaimCheck.UNKNOWN_ORIGIN)
+    causality_flag = int(ClaimCheck.UNTESTED_CAUSALITY)
+    hypothesis_flag = int(ClaimCheck.UNTESTED_HYPOTHESIS)
+    proof_flag = int(ClaimCheck.LOW_PROOF)
+    return bytearray(
+        (origin_flag if origin_code == unknown_origin else 0)
+        | (causality_flag if is_causal and testability_rank < min_testability else 0)
+        | (hypothesis_flag if origin_code == hypothesis and status_code == untested else 0)
+        | (proof_flag if proof_rank < min_proof else 0)
+        for origin_code, is_causal, testability_rank, status_code, proof_rank
+        in zip(origin, causal, testability, status, proof)
+    )
+
+
+def column_histogram(column: Sequence[int], size: int) -> List[int]:
+    """Count the rows of each code 0..size-1 in an encoded column"""
+    if np is not None:
+        return np.bincount(np.frombuffer(column, dtype=np.int8), minlength=size).tolist()
+    counts = Counter(column)
+    return [counts.get(code, 0) for code in range(size)]
+
+
+class StringPool:
+    """Interns strings so that repeated texts are stored once"""
+    
+    def __init__(self):
+        self.strings: List[str] = []
+        self._codes: Dict[str, int] = {}
+    
+    def code(self, text: str) -> Optional[int]:
+        """Get the code of a string already in the pool"""
+        return self._codes.get(text)
+    
+    def intern(self, text: str) -> int:
+        """Get the code of a string, adding it to the pool if needed"""
+        code = self._codes.get(text)
+        if code is None:
+            code = len(self.strings)
+            self.strings.append(text)
+            self._codes[text] = code
+        return code
+    
+    def __getitem__(self, code: int) -> str:
+        return self.strings[code]
+    
+    def __len__(self) -> int:
+        return len(self.strings)
+
+
+class ClaimIds(Sequence):
+    """Claim IDs of a snapshot of ledger rows, decoded from the pool on access"""
+    
+    def __init__(self, pool: StringPool, id_codes: Sequence[int]):
+        self._strings = pool.strings  # append-only: codes stay valid
+        self._codes = id_codes
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._strings[code] for code in self._codes[index]]
+        return self._strings[self._codes[index]]
+    
+    def __iter__(self) -> Iterator[str]:
+        strings = self._strings
+        return (strings[code] for code in self._codes)
+    
+    def __len__(self) -> int:
+        return len(self._codes)
+
+
+class ClaimView:
+    """
+    Slotted, read/write view of one claim row of a ColumnarClaimLedger.
+    
+    Exposes the same attributes and methods as Claim; assigning an attribute
+    writes through to the ledger columns.
+    """
+    
+    __slots__ = ("_ledger", "_row")
+    
+    def __init__(self, ledger: 'ColumnarClaimLedger', row: int):
+        self._ledger = ledger
+        self._row = row
+    
+    @property
+    def claim_id(self) -> str:
+        return self._ledger._pool[self._ledger._id_code[self._row]]
+    
+    @property
+    def text(self) -> str:
+        return self._ledger._pool[self._ledger._text[self._row]]
+    
+    @text.setter
+    def text(self, value: str) -> None:
+        self._ledger._text[self._row] = self._ledger._pool.intern(value)
+        self._ledger._causal[self._row] = DEFAULT_SCANNER.contains(value, "causality")
+    
+    @property
+    def origin_tag(self) -> OriginTag:
+        return ORIGIN_TAGS[self._ledger._origin[self._row]]
+    
+    @origin_tag.setter
+    def origin_tag(self, value: OriginTag) -> None:
+        self._ledger._origin[self._row] = _ORIGIN_CODES[value]
+    
+    @property
+    def proof_level(self) -> ProofLevel:
+        return PROOF_LEVELS[self._ledger._proof[self._row]]
+    
+    @proof_level.setter
+    def proof_level(self, value: ProofLevel) -> None:
+        self._ledger._proof[self._row] = _PROOF_CODES[value]
+    
+    @property
+    def dependencies(self) -> List[str]:
+        return self._ledger._row_dependencies(self._row)
+    
+    @dependencies.setter
+    def dependencies(self, value: List[str]) -> None:
+        self._ledger._set_row_dependencies(self._row, value)
+    
+    @property
+    def test_description(self) -> str:
+        return self._ledger._pool[self._ledger._test[self._row]]
+    
+    @test_description.setter
+    def test_description(self, value: str) -> None:
+        self._ledger._test[self._row] = self._ledger._pool.intern(value)
+    
+    @property
+    def status(self) -> str:
+        return self._ledger._status_values[self._ledger._status[self._row]]
+    
+    @status.setter
+    def status(self, value: str) -> None:
+        self._ledger._status[self._row] = self._ledger._status_code(value)
+    
+    @property
+    def testability(self) -> TestabilityLevel:
+        return TESTABILITY_LEVELS[self._ledger._testability[self._row]]
+    
+    @testability.setter
+    def testability(self, value: TestabilityLevel) -> None:
+        self._ledger._testability[self._row] = _TESTABILITY_CODES[value]
+    
+    # Claim behaviour only reads attributes, so it applies to views as is
+    validate_strong_causality = Claim.validate_strong_causality
+    to_dict = Claim.to_dict
+    
+    def to_claim(self) -> Claim:
+        """Materialize the row as a standalone Claim"""
+        return Claim(
+            claim_id=self.claim_id,
+            text=self.text,
+            origin_tag=self.origin_tag,
+            proof_level=self.proof_level,
+            dependencies=self.dependencies,
+            test_description=self.test_description,
+            status=self.status,
+            testability=self.testability
+        )
+    
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (Claim, ClaimView)):
+            return self.to_dict() == other.to_dict()
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"ClaimView({self.claim_id!r}, row={self._row})"
+
+
+class ColumnarClaims(Mapping):
+    """Read-only ``claims`` mapping (claim ID -> ClaimView) of a columnar ledger"""
+    
+    def __init__(self, ledger: 'ColumnarClaimLedger'):
+        self._ledger = ledger
+    
+    def __getitem__(self, claim_id: str) -> ClaimView:
+        row = self._ledger._row_of(claim_id)
+        if row is None:
+            raise KeyError(claim_id)
+        return ClaimView(self._ledger, row)
+    
+    def __contains__(self, claim_id: object) -> bool:
+        return isinstance(claim_id, str) and self._ledger._row_of(claim_id) is not None
+    
+    def __iter__(self) -> Iterator[str]:
+        pool = self._ledger._pool
+        return (pool[code] for code in self._ledger._id_code)
+    
+    def __len__(self) -> int:
+        return len(self._ledger._id_code)
+
+
+class ColumnarClaimLedger(ClaimLedger):
+    """
+    Claim ledger storing claims as columns of small integers.
+    
+    Drop-in replacement for ClaimLedger: ``claims`` maps IDs to slotted
+    ClaimView records decoded on access. The dependency index is built
+    lazily from the CSR columns the first time it is needed.
+    """
+    
+    def __init__(self):
+        # Storage is columnar: ClaimLedger.__init__ is deliberately not called
+        self.claims = ColumnarClaims(self)
+        self._pool = StringPool()
+        self._id_code = array('l')
+        self._row_by_code = array('l')
+        self._text = array('l')
+        self._test = array('l')
+        self._origin = array('b')
+        self._proof = array('b')
+        self._testability = array('b')
+        self._status = array('b')
+        self._causal = array('b')
+        self._status_values: List[str] = list(DEFAULT_STATUSES)
+        self._dep_start = array('l')
+        self._dep_count = array('l')
+        self._dep_ids = array('l')
+        self._dependency_index: Optional[DependencyIndex] = None
+        
+        self._dirty = set()
+        self._validations: Dict[str, Dict[str, Any]] = {}
+        self._validated_budget: Optional[ProofBudget] = None
+    
+    @property
+    def dependency_index(self) -> DependencyIndex:
+        if self._dependency_index is None:
+            index = DependencyIndex()
+            for row, claim_id in enumerate(self.claims):
+                index.set_dependencies(claim_id, self._row_dependencies(row))
+            self._dependency_index = index
+        return self._dependency_index
+    
+    def _row_of(self, claim_id: str) -> Optional[int]:
+        code = self._pool.code(claim_id)
+        if code is None or code >= len(self._row_by_code):
+            return None
+        row = self._row_by_code[code]
+        return None if row < 0 else row
+    
+    def _status_code(self, status: str) -> int:
+        try:
+            return self._status_values.index(status)
+        except ValueError:
+            self._status_values.append(status)
+            return len(self._status_values) - 1
+    
+    def _row_dependencies(self, row: int) -> List[str]:
+        start = self._dep_start[row]
+        pool = self._pool
+        return [pool[code] for code in self._dep_ids[start:start + self._dep_count[row]]]
+    
+    def _set_row_dependencies(self, row: int, dependencies: List[str]) -> None:
+        # Rewrites in place when the new list fits, otherwise appends a new
+        # segment (the old one is reclaimed by compact())
+        codes = [self._pool.intern(dependency) for dependency in dependencies]
+        if len(codes) > self._dep_count[row]:
+            self._dep_start[row] = len(self._dep_ids)
+            self._dep_ids.extend(codes)
+        else:
+            start = self._dep_start[row]
+            self._dep_ids[start:start + len(codes)] = array('l', codes)
+        self._dep_count[row] = len(codes)
+    
+    def add_claim(self, claim: Claim) -> None:
+        """Add a claim to the ledger (replacing any claim with the same ID)"""
+        row = self._row_of(claim.claim_id)
+        if row is None:
+            self._append_row(claim)
+        else:
+            view = ClaimView(self, row)
+            view.text = claim.text
+            view.test_description = claim.test_description
+            view.origin_tag = claim.origin_tag
+            view.proof_level = claim.proof_level
+            view.testability = claim.testability
+            view.status = claim.status
+            view.dependencies = claim.dependencies
+        
+        if self._dependency_index is not None:
+            self._dependency_index.set_dependencies(claim.claim_id, claim.dependencies)
+        self.mark_dirty(claim.claim_id)
+    
+    def _append_row(self, claim: Claim) -> None:
+        pool = self._pool
+        code = pool.intern(claim.claim_id)
+        if code >= len(self._row_by_code):
+            self._row_by_code.extend([-1] * (len(pool) - len(self._row_by_code)))
+        self._row_by_code[code] = len(self._id_code)
+        self._id_code.append(code)
+        
+        self._text.append(pool.intern(claim.text))
+        self._test.append(pool.intern(claim.test_description))
+        self._origin.append(_ORIGIN_CODES[claim.origin_tag])
+        self._proof.append(_PROOF_CODES[claim.proof_level])
+        self._testability.append(_TESTABILITY_CODES[claim.testability])
+        self._status.append(self._status_code(claim.status))
+        self._causal.append(DEFAULT_SCANNER.contains(claim.text, "causality"))
+        self._dep_start.append(len(self._dep_ids))
+        self._dep_count.append(len(claim.dependencies))
+        self._dep_ids.extend([pool.intern(dependency) for dependency in claim.dependencies])
+    
+    def get_claim(self, claim_id: str) -> Optional[ClaimView]:
+        """Get a claim view by ID"""
+        row = self._row_of(claim_id)
+        return None if row is None else ClaimView(self, row)
+    
+    def _claim_ids(self) -> ClaimIds:
+        """IDs of the current rows, decoded only for the claims looked at"""
+        return ClaimIds(self._pool, self._id_code[:])
+    
+    def _column_checks(
+        self,
+        risk_class: RiskClass,
+        proof_budget: Optional[ProofBudget]
+    ) -> ColumnChecks:
+        """Column codes and thresholds of the checks for a risk class and budget"""
+        minimum_level = proof_budget.minimum_level if proof_budget else None
+        high_risk = risk_class in HIGH_RISK_CLASSES
+        return ColumnChecks(
+            unknown_origin=_ORIGIN_CODES[OriginTag.UNKNOWN] if high_risk else -1,
+            hypothesis=_ORIGIN_CODES[OriginTag.HYP],
+            untested=self._status_code("UNKNOWN"),
+            min_testability=STRONG_CAUSALITY_MIN_RANK,
+            min_proof=PROOF_RANK[minimum_level] if minimum_level is not None else 0
+        )
+    
+    def validate_claims(
+        self,
+        risk_class: RiskClass,
+        proof_budget: Optional[ProofBudget] = None
+    ) -> ClaimValidations:
+        """
+        Validate every claim as bulk operations over the encoded columns.
+        
+        Same findings as ProofValidator.validate_claims over the ledger, with
+        the proof level and testability columns used as the rank arrays.
+        
+        Returns:
+            ClaimValidations with one ClaimCheck bitmask per row
+        """
+        proof_budget = proof_budget or PROOF_BUDGETS.get(risk_class)
+        flags = column_flags(
+            self._origin, self._causal, self._testability, self._status, self._proof,
+            self._column_checks(risk_class, proof_budget)
+        )
+        # Copies, like the claim IDs, so later updates do not change the results
+        return ClaimValidations(
+            self._claim_ids(), flags, self._proof[:], self._testability[:],
+            risk_class, proof_budget
+        )
+    
+    def validate_all(
+        self,
+        risk_class: RiskClass,
+        proof_budget: Optional[ProofBudget] = None
+    ) -> Dict[str, Any]:
+        """
+        Validate all claims in the ledger.
+        
+        The checks run in bulk over the columns (see validate_claims); only
+        flagged claims get their messages rendered, and claim IDs are decoded
+        only for the claims looked at (see ClaimResults).
+        """
+        self._dirty.clear()
+        return self.validate_claims(risk_class, proof_budget).summary()
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get statistics about claims in the ledger, as bulk column histograms"""
+        return self._statistics(
+            column_histogram(self._status, len(self._status_values)),
+            column_histogram(self._origin, len(ORIGIN_TAGS)),
+            column_histogram(self._proof, len(PROOF_LEVELS))
+        )
+    
+    def _statistics(
+        self,
+        status_counts: List[int],
+        origin_counts: List[int],
+        proof_counts: List[int]
+    ) -> Dict[str, Any]:
+        """Statistics in the ClaimLedger.get_statistics format from code counts"""
+        by_status = {
+            status: count for status, count in zip(self._status_values, status_counts)
+            if count or status in DEFAULT_STATUSES
+        }
+        
+        return {
+            "total_claims": len(self._id_code),
+            "by_status": by_status,
+            "by_origin": {tag.value: count for tag, count in zip(ORIGIN_TAGS, origin_counts)},
+            "by_proof_level": {level.value: count for level, count in zip(PROOF_LEVELS, proof_counts)}
+        }
+    
+    def compact(self) -> None:
+        """Reclaim dependency segments left behind by dependency rewrites"""
+        dep_ids = array('l')
+        for row in range(len(self._id_code)):
+            start = self._dep_start[row]
+            self._dep_start[row] = len(dep_ids)
+            dep_ids.extend(self._dep_ids[start:start + self._dep_count[row]])
+        self._dep_ids = dep_ids
+    
+    @classmethod
+    def from_ledger(cls, ledger: ClaimLedger) -> 'ColumnarClaimLedger':
+        """Build a columnar ledger from any claim ledger"""
+        columnar = cls()
+        for claim in ledger.claims.values():
+            columnar.add_claim(claim)
+        return columnar
@@ -0,0 +1,154 @@
+"""
+ARCHI-Ω v1.2 - Claim Dependency Index
+
+Forward and reverse adjacency index over claim dependencies, with:
+- Dangling reference detection (dependencies on unknown claim IDs)
+- Cycle detection (iterative Tarjan SCC, linear in nodes + edges)
+- Transitive dependent queries in O(affected)
+"""
+
+from typing import Dict, List, Set, Tuple, Iterable
+
+
+class DependencyIndex:
+    """Adjacency index mapping claims to their dependencies and dependents"""
+    
+    def __init__(self):
+        self.forward: Dict[str, Tuple[str, ...]] = {}
+        self.reverse: Dict[str, Set[str]] = {}
+        self.edge_count = 0
+    
+    def set_dependencies(self, claim_id: str, dependencies: Iterable[str]) -> None:
+        """Register (or replace) the dependencies of a claim"""
+        self.remove(claim_id)
+        edges = tuple(dependencies)
+        self.forward[claim_id] = edges
+        for dependency in edges:
+            self.reverse.setdefault(dependency, set()).add(claim_id)
+        self.edge_count += len(edges)
+    
+    def remove(self, claim_id: str) -> None:
+        """Remove a claim's outgoing edges (its dependents are kept)"""
+        edges = self.forward.pop(claim_id, ())
+        for dependency in edges:
+            dependents = self.reverse.get(dependency)
+            if dependents is not None:
+                dependents.discard(claim_id)
+                if not dependents:
+                    del self.reverse[dependency]
+        self.edge_count -= len(edges)
+    
+    def dependencies(self, claim_id: str) -> Tuple[str, ...]:
+        """Direct dependencies of a claim"""
+        return self.forward.get(claim_id, ())
+    
+    def dependents(self, claim_id: str) -> Set[str]:
+        """Direct dependents of a claim"""
+        return self.reverse.get(claim_id, set())
+    
+    def transitive_dependents(self, claim_ids: Iterable[str]) -> Set[str]:
+        """
+        Expand claim IDs with all their transitive dependents.
+        
+        Runs in time proportional to the affected subgraph only.
+        
+        Returns:
+            The given IDs plus every claim depending on them, directly or not
+        """
+        affected = set(claim_ids)
+        stack = list(affected)
+        while stack:
+            for dependent in self.reverse.get(stack.pop(), ()):
+                if dependent not in affected:
+                    affected.add(dependent)
+                    stack.append(dependent)
+        return affected
+    
+    def dangling(self) -> Dict[str, List[str]]:
+        """
+        Find dependencies on claim IDs that are not in the index.
+        
+        Returns:
+            Dict mapping each affected claim ID to its missing dependency IDs
+        """
+        dangling: Dict[str, List[str]] = {}
+        for dependency, dependents in self.reverse.items():
+            if dependency not in self.forward:
+                for claim_id in dependents:
+                    dangling.setdefault(claim_id, []).append(dependency)
+        return {claim_id: sorted(missing) for claim_id, missing in sorted(dangling.items())}
+    
+    def strongly_connected_components(self) -> List[List[str]]:
+        """
+        Compute strongly connected components (iterative Tarjan algorithm).
+        
+        Dangling edges are ignored. Runs in O(nodes + edges).
+        
+        Returns:
+            Components in reverse topological order
+        """
+        index: Dict[str, int] = {}
+        low: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack: Set[str] = set()
+        components: List[List[str]] = []
+        counter = 0
+        
+        for root in self.forward:
+            if root in index:
+                continue
+            
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self.forward[root]))]
+            
+            while work:
+                node, successors = work[-1]
+                descended = False
+                for successor in successors:
+                    if successor not in self.forward:
+                        continue
+                    if successor not in index:
+                        index[successor] = low[successor] = counter
+                        counter += 1
+                        stack.append(successor)
+                        on_stack.add(successor)
+                        work.append((successor, iter(self.forward[successor])))
+                        descended = True
+                        break
+                    if successor in on_stack:
+                        low[node] = min(low[node], index[successor])
+                if descended:
+                    continue
+                
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component[::-1])
+        
+        return components
+    
+    def find_cycles(self) -> List[List[str]]:
+        """
+        Find dependency cycles.
+        
+        Returns:
+            List of cycles, each given as the claim IDs of one strongly
+            connected component (self-dependencies included)
+        """
+        return [
+            component for component in self.strongly_connected_components()
+            if len(component) > 1 or component[0] in self.forward[component[0]]
+        ]
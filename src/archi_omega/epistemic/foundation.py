@@ -9,9 +9,17 @@ This module implements the epistemic foundation of the ARCHI-Ω framework:
 - Origin tags
 """
 
-from enum import Enum
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+import csv
+import json
+from enum import Enum, IntFlag
+from types import MappingProxyType
+from typing import (
+    List, Dict, Any, Optional, Set, Iterable, Iterator, TextIO, Mapping, Sequence, Tuple
+)
+from dataclasses import dataclass, replace
+
+from .dependencies import DependencyIndex
+from ..utils.keywords import DEFAULT_SCANNER
 
 
 class ProofLevel(Enum):
@@ -47,50 +55,123 @@ class OriginTag(Enum):
     UNKNOWN = "UNKNOWN"  # Unknown - requires verification
 
 
-@dataclass
+# Ordinal ranks (S0 < ... < S4, T0 < ... < T3), so that level checks are
+# integer comparisons
+PROOF_RANK: Mapping[ProofLevel, int] = MappingProxyType(
+    {level: rank for rank, level in enumerate(ProofLevel)}
+)
+TESTABILITY_RANK: Mapping[TestabilityLevel, int] = MappingProxyType(
+    {level: rank for rank, level in enumerate(TestabilityLevel)}
+)
+
+# Strong causality requires TRACE ≥ T2
+STRONG_CAUSALITY_MIN_RANK = TESTABILITY_RANK[TestabilityLevel.T2]
+
+# Risk classes where claims of UNKNOWN origin are issues
+HIGH_RISK_CLASSES = frozenset({RiskClass.R2, RiskClass.R3})
+
+
+@dataclass(frozen=True)
 class ProofBudget:
-    """Proof budget requirements for a risk class"""
+    """
+    Proof budget requirements for a risk class.
+    
+    Claims below minimum_level (if set) get a proof level warning.
+    """
     risk_class: RiskClass
-    required_levels: List[ProofLevel]
+    required_levels: Tuple[ProofLevel, ...]
     minimum_pillars: int = 1
     requires_alternatives: bool = False
     requires_guardrails: bool = False
+    minimum_level: Optional[ProofLevel] = None
     
     @classmethod
     def for_risk_class(cls, risk_class: RiskClass) -> 'ProofBudget':
-        """Get proof budget for a risk class"""
-        if risk_class == RiskClass.R0:
-            return cls(
-                risk_class=risk_class,
-                required_levels=[ProofLevel.S1],
-                minimum_pillars=1,
-                requires_alternatives=False,
-                requires_guardrails=False
-            )
-        elif risk_class == RiskClass.R1:
-            return cls(
-                risk_class=risk_class,
-                required_levels=[ProofLevel.S0, ProofLevel.S1],
-                minimum_pillars=1,
-                requires_alternatives=False,
-                requires_guardrails=False
-            )
-        elif risk_class == RiskClass.R2:
-            return cls(
-                risk_class=risk_class,
-                required_levels=[ProofLevel.S2, ProofLevel.S4],
-                minimum_pillars=2,
-                requires_alternatives=True,
-                requires_guardrails=True
-            )
-        else:  # R3
-            return cls(
-                risk_class=risk_class,
-                required_levels=[],
-                minimum_pillars=0,
-                requires_alternatives=False,
-                requires_guardrails=True
-            )
+        """Get proof budget for a risk class (shared, immutable instance)"""
+        return PROOF_BUDGETS[risk_class]
+
+
+# Default proof budget of each risk class
+PROOF_BUDGETS: Mapping[RiskClass, ProofBudget] = MappingProxyType({
+    RiskClass.R0: ProofBudget(
+        risk_class=RiskClass.R0,
+        required_levels=(ProofLevel.S1,),
+        minimum_pillars=1
+    ),
+    RiskClass.R1: ProofBudget(
+        risk_class=RiskClass.R1,
+        required_levels=(ProofLevel.S0, ProofLevel.S1),
+        minimum_pillars=1
+    ),
+    RiskClass.R2: ProofBudget(
+        risk_class=RiskClass.R2,
+        required_levels=(ProofLevel.S2, ProofLevel.S4),
+        minimum_pillars=2,
+        requires_alternatives=True,
+        requires_guardrails=True,
+        minimum_level=ProofLevel.S2
+    ),
+    RiskClass.R3: ProofBudget(
+        risk_class=RiskClass.R3,
+        required_levels=(),
+        minimum_pillars=0,
+        requires_guardrails=True
+    )
+})
+
+
+def budgets_from_config(risk_classes: Mapping[str, Any]) -> Dict[RiskClass, ProofBudget]:
+    """
+    Build proof budgets from the ``risk_classes`` section of the config.
+    
+    Each class lists its ``proof_budget`` items: proof levels ("S2"),
+    "alternatives", "guardrails" or "STOP" (no acceptable level). Conditional
+    items such as "S2_if_unstable" are not enforced. ``minimum_pillars`` and
+    ``minimum_level`` are optional; anything not given keeps the default of
+    PROOF_BUDGETS.
+    
+    Returns:
+        Dict mapping risk class to its proof budget
+    
+    Raises:
+        ValueError: If a risk class, proof level or budget item is unknown
+    """
+    budgets = {}
+    for name, spec in (risk_classes or {}).items():
+        if name not in RiskClass.__members__:
+            raise ValueError(f"Unknown risk class in config: {name}")
+        risk_class = RiskClass[name]
+        spec = spec or {}
+        changes: Dict[str, Any] = {}
+        
+        if "proof_budget" in spec:
+            levels = []
+            changes["requires_alternatives"] = False
+            changes["requires_guardrails"] = False
+            for item in spec["proof_budget"] or []:
+                if item in ProofLevel.__members__:
+                    levels.append(ProofLevel[item])
+                elif item == "alternatives":
+                    changes["requires_alternatives"] = True
+                elif item == "guardrails":
+                    changes["requires_guardrails"] = True
+                elif item == "STOP":
+                    levels = []
+                    changes["requires_guardrails"] = True
+                elif not (isinstance(item, str) and item.split("_if_")[0] in ProofLevel.__members__):
+                    raise ValueError(f"Unknown proof budget item for {name}: {item}")
+            changes["required_levels"] = tuple(levels)
+        
+        if "minimum_pillars" in spec:
+            changes["minimum_pillars"] = int(spec["minimum_pillars"])
+        if "minimum_level" in spec:
+            level = spec["minimum_level"]
+            if level is not None and level not in ProofLevel.__members__:
+                raise ValueError(f"Unknown minimum proof level for {name}: {level}")
+            changes["minimum_level"] = ProofLevel[level] if level is not None else None
+        
+        budgets[risk_class] = replace(PROOF_BUDGETS[risk_class], **changes)
+    return budgets
 
 
 @dataclass
@@ -110,12 +191,10 @@ class Claim:
         Validate that strong causality claims have adequate testability.
         Strong causality requires TRACE ≥ T2.
         """
-        causality_keywords = ["will cause", "causes", "results in", "leads to", "guarantees"]
-        is_causal = any(keyword in self.text.lower() for keyword in causality_keywords)
-        
-        if is_causal:
-            return self.testability in [TestabilityLevel.T2, TestabilityLevel.T3]
-        return True
+        # Claims at T2 or above pass whatever their text: skip the scan
+        if TESTABILITY_RANK[self.testability] >= STRONG_CAUSALITY_MIN_RANK:
+            return True
+        return not DEFAULT_SCANNER.contains(self.text, "causality")
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert claim to dictionary for ledger"""
@@ -129,6 +208,20 @@ class Claim:
             "status": self.status,
             "testability": self.testability.value
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Claim':
+        """Build a claim from its ledger dictionary (inverse of to_dict)"""
+        return cls(
+            claim_id=data["claim_id"],
+            text=data["text"],
+            origin_tag=OriginTag(data["origin_tag"]),
+            proof_level=ProofLevel(data["proof_level"]),
+            dependencies=list(data.get("dependencies", [])),
+            test_description=data.get("test", ""),
+            status=data.get("status", "UNKNOWN"),
+            testability=TestabilityLevel(data.get("testability", TestabilityLevel.T2.value))
+        )
 
 
 class RiskClassifier:
@@ -168,74 +261,388 @@ class RiskClassifier:
         return RiskClass.R1
 
 
-class ProofValidator:
-    """Validates proof levels against requirements"""
+class ClaimCheck(IntFlag):
+    """ProofValidator findings, as bits of a per-claim mask"""
+    UNKNOWN_ORIGIN = 1  # Issue: UNKNOWN origin for a high-risk class
+    UNTESTED_CAUSALITY = 2  # Issue: strong causality below T2
+    LOW_PROOF = 4  # Warning: proof level below the budget minimum_level
+    UNTESTED_HYPOTHESIS = 8  # Warning: hypothesis with UNKNOWN status
+
+
+# Findings that make a claim invalid; the other ones are warnings
+ISSUE_CHECKS = ClaimCheck.UNKNOWN_ORIGIN | ClaimCheck.UNTESTED_CAUSALITY
+ALL_CHECKS = ISSUE_CHECKS | ClaimCheck.LOW_PROOF | ClaimCheck.UNTESTED_HYPOTHESIS
+
+# Plain-int masks for the per-claim loops (IntFlag operations are slow)
+_UNKNOWN_ORIGIN = int(ClaimCheck.UNKNOWN_ORIGIN)
+_UNTESTED_CAUSALITY = int(ClaimCheck.UNTESTED_CAUSALITY)
+_LOW_PROOF = int(ClaimCheck.LOW_PROOF)
+_UNTESTED_HYPOTHESIS = int(ClaimCheck.UNTESTED_HYPOTHESIS)
+_ISSUE_MASK = int(ISSUE_CHECKS)
+
+# Level descriptions by rank, for the messages (Enum attribute access is slow)
+_PROOF_VALUES = [level.value for level in ProofLevel]
+_TESTABILITY_VALUES = [level.value for level in TestabilityLevel]
+
+
+class ClaimResults(Mapping):
+    """
+    Read-only ``claim_validations`` mapping (claim ID -> result) of a batch.
     
-    @staticmethod
-    def validate_claim(claim: Claim, risk_class: RiskClass) -> Dict[str, Any]:
+    Results are rendered on access (see ClaimValidations.result), so a batch
+    of millions of claims is summarized without one dict per claim; claims
+    without findings get a new result on every access.
+    """
+    
+    def __init__(self, validations: "ClaimValidations"):
+        self._validations = validations
+        self._index: Optional[Dict[str, int]] = None
+    
+    def __getitem__(self, claim_id: str) -> Dict[str, Any]:
+        if self._index is None:
+            self._index = {key: index for index, key in enumerate(self._validations.claim_ids)}
+        return self._validations.result(self._index[claim_id])
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._validations.claim_ids)
+    
+    def __len__(self) -> int:
+        return len(self._validations)
+    
+    # One pass in claim order instead of one lookup per key
+    def values(self) -> Iterator[Dict[str, Any]]:
+        return map(self._validations.result, range(len(self._validations)))
+    
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        return zip(self._validations.claim_ids, self.values())
+
+
+class ClaimValidations:
+    """
+    Batch validation results of ProofValidator.validate_claims.
+    
+    Findings are stored as one ClaimCheck bitmask per claim (``flags``),
+    with parallel arrays of claim IDs and proof level / testability ranks.
+    Messages are rendered only when asked for, with messages(), result(),
+    issues(), warnings() or summary(). Results rendered elsewhere (e.g. by
+    shard workers) can be supplied by index as ``rendered``.
+    """
+    
+    def __init__(
+        self,
+        claim_ids: Sequence[str],
+        flags: Sequence[int],
+        proof_ranks: Sequence[int],
+        testability_ranks: Sequence[int],
+        risk_class: RiskClass,
+        proof_budget: Optional[ProofBudget],
+        rendered: Optional[Dict[int, Dict[str, Any]]] = None
+    ):
+        self.claim_ids = claim_ids
+        self.flags = flags
+        self.proof_ranks = proof_ranks
+        self.testability_ranks = testability_ranks
+        self.risk_class = risk_class
+        self.proof_budget = proof_budget
+        self.rendered = rendered
+        # Message parts shared by all claims of the batch
+        self._risk_value = risk_class.value if risk_class is not None else None
+        self._risk_name = risk_class.name if risk_class is not None else None
+        minimum_level = proof_budget.minimum_level if proof_budget else None
+        self._minimum_name = minimum_level.name if minimum_level else None
+    
+    def __len__(self) -> int:
+        return len(self.claim_ids)
+    
+    @property
+    def valid(self) -> bool:
+        """True if no claim has an issue (warnings allowed)"""
+        return not any(flag & _ISSUE_MASK for flag in self.flags)
+    
+    def flagged(self, checks: int = ALL_CHECKS) -> List[int]:
+        """Indices of the claims with any of the given findings"""
+        checks = int(checks)
+        return [index for index, flag in enumerate(self.flags) if flag & checks]
+    
+    def count(self, check: ClaimCheck) -> int:
+        """Number of claims with a finding"""
+        check = int(check)
+        return sum(1 for flag in self.flags if flag & check)
+    
+    def messages(self, index: int) -> Tuple[List[str], List[str]]:
         """
-        Validate that a claim has adequate proof for the risk class.
+        Render the findings of one claim.
         
         Returns:
-            Dict with validation results
+            Tuple of (issues, warnings) messages
         """
-        proof_budget = ProofBudget.for_risk_class(risk_class)
+        flag = self.flags[index]
+        issues: List[str] = []
+        warnings: List[str] = []
+        if not flag:
+            return issues, warnings
         
-        results = {
+        claim_id = self.claim_ids[index]
+        if flag & _UNKNOWN_ORIGIN:
+            issues.append(
+                f"Claim {claim_id} has UNKNOWN origin for high-risk ({self._risk_value})"
+            )
+        if flag & _UNTESTED_CAUSALITY:
+            testability = _TESTABILITY_VALUES[self.testability_ranks[index]]
+            issues.append(
+                f"Claim {claim_id} has strong causality but insufficient testability "
+                f"(has {testability}, needs ≥T2)"
+            )
+        if flag & _LOW_PROOF:
+            proof_level = _PROOF_VALUES[self.proof_ranks[index]]
+            warnings.append(
+                f"Claim {claim_id} for {self._risk_name} should have proof level "
+                f"≥{self._minimum_name} (currently {proof_level})"
+            )
+        if flag & _UNTESTED_HYPOTHESIS:
+            warnings.append(f"Claim {claim_id} is hypothesis but not yet tested")
+        return issues, warnings
+    
+    def result(self, index: int) -> Dict[str, Any]:
+        """Result of one claim in the ProofValidator.validate_claim format"""
+        if self.rendered is not None and index in self.rendered:
+            return self.rendered[index]
+        issues, warnings = self.messages(index)
+        return {
+            "valid": not self.flags[index] & _ISSUE_MASK,
+            "issues": issues,
+            "warnings": warnings
+        }
+    
+    def issues(self) -> List[str]:
+        """Issue messages of all claims, in claim order"""
+        return [message for index in self.flagged(ISSUE_CHECKS) for message in self.messages(index)[0]]
+    
+    def warnings(self) -> List[str]:
+        """Warning messages of all claims, in claim order"""
+        return [message for index in self.flagged() for message in self.messages(index)[1]]
+    
+    def summary(self) -> Dict[str, Any]:
+        """
+        Results of all claims in the ClaimLedger.validate_all format.
+        
+        Only the flagged claims are rendered up front; claim_validations is
+        a ClaimResults view rendering each claim's result on access.
+        """
+        summary = {
             "valid": True,
             "issues": [],
-            "warnings": []
+            "warnings": [],
+            "claim_validations": ClaimResults(self)
         }
+        for index in self.flagged():
+            result = self.result(index)
+            if not result["valid"]:
+                summary["valid"] = False
+                summary["issues"].extend(result["issues"])
+            summary["warnings"].extend(result["warnings"])
+        return summary
+
+
+class ProofValidator:
+    """Validates proof levels against requirements"""
+    
+    @staticmethod
+    def validate_claim(
+        claim: Claim,
+        risk_class: RiskClass,
+        proof_budget: Optional[ProofBudget] = None
+    ) -> Dict[str, Any]:
+        """
+        Validate that a claim has adequate proof for the risk class.
         
-        # Check origin tag
-        if claim.origin_tag == OriginTag.UNKNOWN and risk_class in [RiskClass.R2, RiskClass.R3]:
-            results["issues"].append(
-                f"Claim {claim.claim_id} has UNKNOWN origin for high-risk ({risk_class.value})"
-            )
-            results["valid"] = False
+        proof_budget defaults to the budget of the risk class in PROOF_BUDGETS.
         
-        # Check testability for strong causality
-        if not claim.validate_strong_causality():
-            results["issues"].append(
-                f"Claim {claim.claim_id} has strong causality but insufficient testability "
-                f"(has {claim.testability.value}, needs ≥T2)"
-            )
-            results["valid"] = False
+        Returns:
+            Dict with validation results
+        """
+        return ProofValidator.validate_claims((claim,), risk_class, proof_budget).result(0)
+    
+    @staticmethod
+    def validate_claims(
+        claims: Iterable[Claim],
+        risk_class: RiskClass,
+        proof_budget: Optional[ProofBudget] = None
+    ) -> ClaimValidations:
+        """
+        Validate many claims at once, without building per-claim results.
         
-        # Check proof level adequacy
-        if risk_class == RiskClass.R2:
-            if claim.proof_level in [ProofLevel.S0, ProofLevel.S1]:
-                results["warnings"].append(
-                    f"Claim {claim.claim_id} for R2 should have proof level ≥S2 "
-                    f"(currently {claim.proof_level.value})"
-                )
+        Every check is an integer or identity comparison; the keyword scan
+        for strong causality only runs on claims below T2.
         
-        # Check hypothesis status
-        if claim.origin_tag == OriginTag.HYP and claim.status == "UNKNOWN":
-            results["warnings"].append(
-                f"Claim {claim.claim_id} is hypothesis but not yet tested"
-            )
+        Returns:
+            ClaimValidations with one ClaimCheck bitmask per claim
+        """
+        proof_budget = proof_budget or PROOF_BUDGETS.get(risk_class)
+        minimum_level = proof_budget.minimum_level if proof_budget else None
+        min_proof = PROOF_RANK[minimum_level] if minimum_level is not None else 0
+        unknown_origin = _UNKNOWN_ORIGIN if risk_class in HIGH_RISK_CLASSES else 0
+        unknown, hypothesis = OriginTag.UNKNOWN, OriginTag.HYP
+        proof_rank, testability_rank = PROOF_RANK, TESTABILITY_RANK
         
-        return results
+        claim_ids: List[str] = []
+        flags = bytearray()
+        proof_ranks = bytearray()
+        testability_ranks = bytearray()
+        for claim in claims:
+            proof = proof_rank[claim.proof_level]
+            testability = testability_rank[claim.testability]
+            origin = claim.origin_tag
+            flag = 0
+            if origin is unknown:
+                flag = unknown_origin
+            elif origin is hypothesis and claim.status == "UNKNOWN":
+                flag = _UNTESTED_HYPOTHESIS
+            if testability < STRONG_CAUSALITY_MIN_RANK and not claim.validate_strong_causality():
+                flag |= _UNTESTED_CAUSALITY
+            if proof < min_proof:
+                flag |= _LOW_PROOF
+            
+            claim_ids.append(claim.claim_id)
+            flags.append(flag)
+            proof_ranks.append(proof)
+            testability_ranks.append(testability)
+        
+        return ClaimValidations(
+            claim_ids, flags, proof_ranks, testability_ranks, risk_class, proof_budget
+        )
+
+
+# Column order of claim exports (keys of Claim.to_dict)
+CLAIM_EXPORT_FIELDS = (
+    "claim_id", "text", "origin_tag", "proof_level", "dependencies", "test", "status", "testability"
+)
 
 
 class ClaimLedger:
-    """Manages a ledger of claims"""
+    """
+    Manages a ledger of claims.
+    
+    Validation results are cached per claim. Claims added or changed since the
+    last validation (and the claims depending on them) are tracked in a dirty
+    set, so validate_all only revalidates what changed. Claims edited in place
+    must be reported with mark_dirty() or changed through update_claim().
+    
+    Dependencies are indexed forward and backward as claims are added, see
+    check_dependencies() and get_dependents().
+    """
     
     def __init__(self):
         self.claims: Dict[str, Claim] = {}
+        self.dependency_index = DependencyIndex()
+        self._dirty: Set[str] = set()
+        self._validations: Dict[str, Dict[str, Any]] = {}
+        self._validated_budget: Optional[ProofBudget] = None
     
     def add_claim(self, claim: Claim) -> None:
-        """Add a claim to the ledger"""
+        """Add a claim to the ledger (replacing any claim with the same ID)"""
         self.claims[claim.claim_id] = claim
+        self.dependency_index.set_dependencies(claim.claim_id, claim.dependencies)
+        self.mark_dirty(claim.claim_id)
+    
+    def update_claim(self, claim_id: str, **changes: Any) -> Claim:
+        """
+        Change fields of an existing claim and mark it for revalidation.
+        
+        Raises:
+            KeyError: If the claim is not in the ledger
+        """
+        claim = self.claims[claim_id]
+        for name, value in changes.items():
+            setattr(claim, name, value)
+        if "dependencies" in changes:
+            self.dependency_index.set_dependencies(claim_id, claim.dependencies)
+        self.mark_dirty(claim_id)
+        return claim
+    
+    def mark_dirty(self, claim_id: str) -> None:
+        """Mark a claim as changed since the last validation"""
+        # Nothing cached yet: the next validation covers every claim anyway
+        if self._validations:
+            self._dirty.add(claim_id)
     
     def get_claim(self, claim_id: str) -> Optional[Claim]:
         """Get a claim by ID"""
         return self.claims.get(claim_id)
     
-    def validate_all(self, risk_class: RiskClass) -> Dict[str, Any]:
-        """Validate all claims in the ledger"""
-        validator = ProofValidator()
+    def get_dependents(self, claim_id: str, transitive: bool = True) -> Set[str]:
+        """Get the claims depending on a claim (directly or transitively)"""
+        if not transitive:
+            return set(self.dependency_index.dependents(claim_id))
+        dependents = self.dependency_index.transitive_dependents([claim_id])
+        dependents.discard(claim_id)
+        return dependents
+    
+    def check_dependencies(self) -> Dict[str, Any]:
+        """
+        Check dependency integrity across the ledger.
+        
+        Returns:
+            Dict with dangling references (claim ID -> missing IDs) and cycles
+        """
+        dangling = self.dependency_index.dangling()
+        cycles = self.dependency_index.find_cycles()
+        return {
+            "valid": not dangling and not cycles,
+            "dangling": dangling,
+            "cycles": cycles
+        }
+    
+    def validate_claims(
+        self,
+        risk_class: RiskClass,
+        proof_budget: Optional[ProofBudget] = None
+    ) -> "ClaimValidations":
+        """
+        Validate every claim in one batch, bypassing the result cache.
+        
+        Returns:
+            ClaimValidations in ledger order (see ProofValidator.validate_claims)
+        """
+        return ProofValidator.validate_claims(self.claims.values(), risk_class, proof_budget)
+    
+    def validate_all(
+        self,
+        risk_class: RiskClass,
+        proof_budget: Optional[ProofBudget] = None
+    ) -> Dict[str, Any]:
+        """
+        Validate all claims in the ledger.
+        
+        Only dirty claims, their dependents and claims never validated are
+        revalidated; cached per-claim results are kept until the risk class
+        or proof budget (default: the one of PROOF_BUDGETS) changes. Returned
+        per-claim results are shared with the cache and must be treated as
+        read-only.
+        """
+        proof_budget = proof_budget or PROOF_BUDGETS.get(risk_class)
+        if proof_budget != self._validated_budget:
+            self._validations.clear()
+            self._validated_budget = proof_budget
+        elif self._dirty:
+            for claim_id in self.dependency_index.transitive_dependents(self._dirty):
+                self._validations.pop(claim_id, None)
+        self._dirty.clear()
+        
+        # Drop results of claims removed from the ledger
+        if len(self._validations) > len(self.claims):
+            self._validations = {
+                claim_id: result for claim_id, result in self._validations.items()
+                if claim_id in self.claims
+            }
+        
+        # Validate the claims without a cached result in one batch
+        pending = [claim for claim_id, claim in self.claims.items() if claim_id not in self._validations]
+        if pending:
+            batch = ProofValidator.validate_claims(pending, risk_class, proof_budget)
+            for index, claim_id in enumerate(batch.claim_ids):
+                self._validations[claim_id] = batch.result(index)
+        
         all_results = {
             "valid": True,
             "issues": [],
@@ -243,8 +650,8 @@ class ClaimLedger:
             "claim_validations": {}
         }
         
-        for claim_id, claim in self.claims.items():
-            result = validator.validate_claim(claim, risk_class)
+        for claim_id in self.claims:
+            result = self._validations[claim_id]
             all_results["claim_validations"][claim_id] = result
             
             if not result["valid"]:
@@ -275,19 +682,42 @@ class ClaimLedger:
             "by_proof_level": by_proof
         }
     
-    def to_markdown_table(self) -> str:
-        """Generate markdown table for claim ledger"""
-        lines = [
-            "| Claim-ID | Claim Text | Origin Tag | S-Level | Dependencies | Test | Status |",
-            "|----------|------------|------------|---------|--------------|------|--------|"
-        ]
+    def iter_markdown_table(self) -> Iterator[str]:
+        """Yield the markdown table for the claim ledger line by line"""
+        yield "| Claim-ID | Claim Text | Origin Tag | S-Level | Dependencies | Test | Status |"
+        yield "|----------|------------|------------|---------|--------------|------|--------|"
         
         for claim in self.claims.values():
             deps = ", ".join(claim.dependencies) if claim.dependencies else "-"
-            lines.append(
+            yield (
                 f"| {claim.claim_id} | {claim.text[:50]}... | "
                 f"[{claim.origin_tag.value}] | {claim.proof_level.name} | "
                 f"{deps} | {claim.test_description[:30]}... | {claim.status} |"
             )
-        
-        return "\n".join(lines)
+    
+    def to_markdown_table(self) -> str:
+        """Generate markdown table for claim ledger"""
+        return "\n".join(self.iter_markdown_table())
+    
+    def write_markdown(self, stream: TextIO) -> None:
+        """Write the markdown table to a file handle, row by row"""
+        lines = self.iter_markdown_table()
+        stream.write(next(lines))
+        for line in lines:
+            stream.write("\n")
+            stream.write(line)
+    
+    def write_jsonl(self, stream: TextIO) -> None:
+        """Write one JSON object per claim to a file handle"""
+        for claim in self.claims.values():
+            stream.write(json.dumps(claim.to_dict(), ensure_ascii=False))
+            stream.write("\n")
+    
+    def write_csv(self, stream: TextIO) -> None:
+        """Write the claims as CSV (dependencies separated by ';') to a file handle"""
+        writer = csv.writer(stream, lineterminator="\n")
+        writer.writerow(CLAIM_EXPORT_FIELDS)
+        for claim in self.claims.values():
+            record = claim.to_dict()
+            record["dependencies"] = ";".join(record["dependencies"])
+            writer.writerow([record[name] for name in CLAIM_EXPORT_FIELDS])
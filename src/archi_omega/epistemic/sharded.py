@@ -0,0 +1,362 @@
+"""
+ARCHI-Ω v1.2 - Sharded Claim Ledger
+
+Columnar claim ledger validated across processes:
+- Claims partitioned into shards by CRC-32 of their claim ID
+- validate_all, validate_claims and get_statistics run one task per shard
+  on a process pool
+- Encoded columns and claim IDs handed to the workers through one shared
+  memory block, copied once per call
+- Rows grouped by shard in one pass; each task reads only its shard's slice
+- Results merged in ledger order, identical to a single-process run
+- Dependency checks on the ledger-wide index, across shard boundaries
+"""
+
+import os
+import zlib
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import accumulate
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from . import columnar
+from .columnar import ColumnChecks, ColumnarClaimLedger, ORIGIN_TAGS, PROOF_LEVELS
+from .foundation import Claim, ClaimValidations, ProofBudget, RiskClass, PROOF_BUDGETS
+
+
+# Encoded columns copied to the shared block, in this order
+SHARED_COLUMNS = ("origin", "causal", "testability", "status", "proof")
+
+# Shard codes are stored in a signed byte column
+MAX_SHARDS = 127
+
+# Smaller ledgers are processed in-process: starting tasks and copying the
+# columns would cost more than the parallel work saves
+DEFAULT_PARALLEL_THRESHOLD = 100_000
+
+# Segment name -> (byte offset, byte length) in the shared block
+Layout = Dict[str, Tuple[int, int]]
+
+# Start and end of a shard's slice of the shard-ordered rows
+Bounds = Tuple[int, int]
+
+
+def shard_of(claim_id: str, shards: int) -> int:
+    """Shard of a claim: CRC-32 of its UTF-8 ID modulo the shard count"""
+    return zlib.crc32(claim_id.encode("utf-8")) % shards
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to a block created (and later unlinked) by the parent process"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13: the parent's resource tracker is shared
+        return shared_memory.SharedMemory(name=name)
+
+
+def _segments(buffer: memoryview, layout: Layout) -> Dict[str, memoryview]:
+    return {name: buffer[offset:offset + length] for name, (offset, length) in layout.items()}
+
+
+def _shard_rows(rows: memoryview, bounds: Bounds) -> Any:
+    """Rows of a shard, in ledger order, from the shard-ordered rows segment"""
+    start, end = bounds
+    if columnar.np is not None:
+        return columnar.np.frombuffer(rows, dtype=columnar.np.int64)[start:end]
+    return rows.cast("q")[start:end]
+
+
+def _take(column: memoryview, rows: Any) -> Any:
+    """Values of an encoded column at the given rows"""
+    if columnar.np is not None:
+        return columnar.np.frombuffer(column, dtype=columnar.np.int8)[rows]
+    return [column[row] for row in rows]
+
+
+def _validate_shard(
+    buffer: memoryview,
+    layout: Layout,
+    bounds: Bounds,
+    checks: ColumnChecks,
+    risk_class: RiskClass,
+    proof_budget: Optional[ProofBudget],
+    render: bool
+) -> Tuple[List[int], List[Dict[str, Any]]]:
+    """
+    Shard task: write the masks of the shard's rows to the mask column.
+    
+    Returns:
+        Tuple of (flagged rows, their rendered results) if render is set
+    """
+    segments = _segments(buffer, layout)
+    rows = _shard_rows(segments["rows"], bounds)
+    flags = columnar.column_flags(
+        *(_take(segments[name], rows) for name in SHARED_COLUMNS), checks
+    )
+    
+    # Masks go straight into the shared mask column, at the shard's rows
+    if columnar.np is not None:
+        np = columnar.np
+        np.frombuffer(segments["mask"], dtype=np.uint8)[rows] = np.frombuffer(flags, dtype=np.uint8)
+    else:
+        mask = segments["mask"]
+        for row, flag in zip(rows, flags):
+            mask[row] = flag
+    if not render:
+        return [], []
+    
+    # Render the results of the flagged rows only
+    id_offsets = segments["id_offsets"].cast("q")
+    ids = segments["ids"]
+    flagged = [index for index, flag in enumerate(flags) if flag]
+    flagged_rows = [int(rows[index]) for index in flagged]
+    validations = ClaimValidations(
+        [bytes(ids[id_offsets[row]:id_offsets[row + 1]]).decode("utf-8") for row in flagged_rows],
+        [flags[index] for index in flagged],
+        [int(value) for value in _take(segments["proof"], flagged_rows)],
+        [int(value) for value in _take(segments["testability"], flagged_rows)],
+        risk_class,
+        proof_budget
+    )
+    return flagged_rows, [validations.result(index) for index in range(len(validations))]
+
+
+def _shard_histograms(
+    buffer: memoryview,
+    layout: Layout,
+    bounds: Bounds,
+    sizes: Tuple[int, ...]
+) -> List[List[int]]:
+    """Shard task: status, origin and proof level code counts of the shard"""
+    segments = _segments(buffer, layout)
+    rows = _shard_rows(segments["rows"], bounds)
+    return [
+        columnar.column_histogram(_take(segments[name], rows), size)
+        for name, size in zip(("status", "origin", "proof"), sizes)
+    ]
+
+
+def _run_shard_task(name: str, task: Callable[..., Any], *args: Any) -> Any:
+    """Worker entry point: run a shard task on the attached shared block"""
+    block = _attach(name)
+    try:
+        return task(block.buf, *args)
+    finally:
+        block.close()
+
+
+class ShardedClaimLedger(ColumnarClaimLedger):
+    """
+    Columnar claim ledger whose bulk operations run in parallel by shard.
+    
+    Each claim belongs to the shard given by shard_of(claim_id), so a claim
+    keeps its shard across updates and runs. validate_all, validate_claims
+    and get_statistics copy the encoded columns and claim IDs into one shared
+    memory block and run one task per shard on the executor: a process pool
+    of max_workers created on first use, or any Executor passed in (a process
+    pool passed in should be started after
+    multiprocessing.resource_tracker.ensure_running(), so that its workers
+    share the tracker of the blocks). Ledgers with fewer than
+    parallel_threshold claims are processed in-process.
+    
+    Results are merged by row, so they are identical to ColumnarClaimLedger
+    results, in the same order. Dependency checks use the ledger-wide index
+    and see dependencies across shards.
+    """
+    
+    def __init__(
+        self,
+        shards: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        parallel_threshold: int = DEFAULT_PARALLEL_THRESHOLD
+    ):
+        super().__init__()
+        self.shards = shards or min(os.cpu_count() or 1, MAX_SHARDS)
+        if not 1 <= self.shards <= MAX_SHARDS:
+            raise ValueError(f"Shard count must be between 1 and {MAX_SHARDS}")
+        self.max_workers = max_workers
+        self.parallel_threshold = parallel_threshold
+        self._shard = array('b')
+        self._executor = executor
+        self._owns_executor = executor is None
+    
+    @property
+    def executor(self) -> Executor:
+        """Executor of the shard tasks, created on first use"""
+        if self._executor is None:
+            # Workers must share the parent's tracker, which unlinks the blocks
+            if hasattr(resource_tracker, "ensure_running"):
+                resource_tracker.ensure_running()
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers or self.shards)
+        return self._executor
+    
+    def close(self) -> None:
+        """Shut down the process pool if this ledger created it"""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+    
+    def __enter__(self) -> "ShardedClaimLedger":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        state["_owns_executor"] = True
+        return state
+    
+    def _append_row(self, claim: Claim) -> None:
+        super()._append_row(claim)
+        self._shard.append(shard_of(claim.claim_id, self.shards))
+    
+    def shard_sizes(self) -> List[int]:
+        """Number of claims in each shard"""
+        return columnar.column_histogram(self._shard, self.shards)
+    
+    def _parallel(self) -> bool:
+        return self.shards > 1 and len(self._id_code) >= max(self.parallel_threshold, 1)
+    
+    def _map_shards(
+        self,
+        task: Callable[..., Any],
+        args: Tuple[Any, ...],
+        with_ids: bool = False
+    ) -> Tuple[List[Any], bytearray]:
+        """
+        Run a task on every shard over a shared copy of the columns.
+        
+        Returns:
+            Tuple of (task results in shard order, mask column)
+        """
+        size = len(self._id_code)
+        claim_ids = [claim_id.encode("utf-8") for claim_id in self.claims] if with_ids else []
+        id_bytes = sum(map(len, claim_ids))
+        
+        # The 8-byte aligned rows and ID offsets come first
+        lengths = [("rows", 8 * size), ("id_offsets", 8 * (size + 1) if with_ids else 0)]
+        lengths += [(name, size) for name in SHARED_COLUMNS + ("mask",)]
+        lengths.append(("ids", id_bytes))
+        layout: Layout = {}
+        offset = 0
+        for name, length in lengths:
+            layout[name] = (offset, length)
+            offset += length
+        
+        block = shared_memory.SharedMemory(create=True, size=offset)
+        try:
+            bounds = self._fill_block(block.buf, layout, claim_ids)
+            futures = [
+                self.executor.submit(_run_shard_task, block.name, task, layout, shard_bounds, *args)
+                for shard_bounds in bounds
+            ]
+            results = [future.result() for future in futures]
+            start, length = layout["mask"]
+            mask = bytearray(block.buf[start:start + length])
+        finally:
+            block.close()
+            block.unlink()
+        return results, mask
+    
+    def _fill_block(
+        self,
+        buffer: memoryview,
+        layout: Layout,
+        claim_ids: List[bytes]
+    ) -> List[Bounds]:
+        """
+        Copy the rows grouped by shard, the encoded columns and the claim IDs
+        into the shared block.
+        
+        Returns:
+            Bounds of each shard's rows in the rows segment, in shard order
+        """
+        segments = _segments(buffer, layout)
+        segments["rows"][:] = self._shard_order()
+        for name in SHARED_COLUMNS:
+            segments[name][:] = getattr(self, f"_{name}").tobytes()
+        if claim_ids:
+            offsets = array('q', accumulate(map(len, claim_ids), initial=0))
+            segments["id_offsets"][:] = offsets.tobytes()
+            segments["ids"][:] = b"".join(claim_ids)
+        ends = list(accumulate(self.shard_sizes()))
+        return list(zip([0] + ends[:-1], ends))
+    
+    def _shard_order(self) -> bytes:
+        """Rows sorted by shard, in ledger order within a shard, as int64 bytes"""
+        if columnar.np is not None:
+            np = columnar.np
+            codes = np.frombuffer(self._shard, dtype=np.int8)
+            return np.argsort(codes, kind="stable").astype(np.int64).tobytes()
+        # Counting sort: one pass places each row after the earlier rows of its shard
+        positions = [0, *accumulate(self.shard_sizes())][:-1]
+        rows = array('q', bytes(8 * len(self._shard)))
+        for row, shard in enumerate(self._shard):
+            rows[positions[shard]] = row
+            positions[shard] += 1
+        return rows.tobytes()
+    
+    def _validate(
+        self,
+        risk_class: RiskClass,
+        proof_budget: Optional[ProofBudget],
+        render: bool
+    ) -> ClaimValidations:
+        proof_budget = proof_budget or PROOF_BUDGETS.get(risk_class)
+        checks = self._column_checks(risk_class, proof_budget)
+        results, mask = self._map_shards(
+            _validate_shard, (checks, risk_class, proof_budget, render), with_ids=render
+        )
+        rendered = {}
+        for rows, shard_results in results:
+            rendered.update(zip(rows, shard_results))
+        return ClaimValidations(
+            self._claim_ids(), mask, self._proof[:], self._testability[:],
+            risk_class, proof_budget, rendered if render else None
+        )
+    
+    def validate_claims(
+        self,
+        risk_class: RiskClass,
+        proof_budget: Optional[ProofBudget] = None
+    ) -> ClaimValidations:
+        """
+        Validate every claim, one shard per task (see ColumnarClaimLedger).
+        
+        Returns:
+            ClaimValidations with one ClaimCheck bitmask per row
+        """
+        if not self._parallel():
+            return super().validate_claims(risk_class, proof_budget)
+        return self._validate(risk_class, proof_budget, render=False)
+    
+    def validate_all(
+        self,
+        risk_class: RiskClass,
+        proof_budget: Optional[ProofBudget] = None
+    ) -> Dict[str, Any]:
+        """
+        Validate all claims in the ledger.
+        
+        The shard tasks compute the masks and render the results of their
+        flagged claims; merging them by row keeps the single-process order.
+        """
+        if not self._parallel():
+            return super().validate_all(risk_class, proof_budget)
+        self._dirty.clear()
+        return self._validate(risk_class, proof_budget, render=True).summary()
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get statistics about claims in the ledger, summed over shard histograms"""
+        if not self._parallel():
+            return super().get_statistics()
+        sizes = (len(self._status_values), len(ORIGIN_TAGS), len(PROOF_LEVELS))
+        results, _ = self._map_shards(_shard_histograms, (sizes,))
+        return self._statistics(*(
+            [sum(counts) for counts in zip(*(histograms[column] for histograms in results))]
+            for column in range(len(sizes))
+        ))
@@ -0,0 +1,396 @@
+"""
+ARCHI-Ω v1.2 - Persistent Claim Store
+
+Durable claim ledger storage:
+- Append-only record log (one JSON claim per line)
+- Memory-mapped open-addressing index (claim ID hash -> log offset), so
+  reopening a ledger only maps the index and lookups are O(1)
+- Compaction to drop superseded records
+- PersistentClaimLedger, plugging the store behind the ClaimLedger interface
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple, Union
+
+from .dependencies import DependencyIndex
+from .foundation import Claim, ClaimLedger, ProofBudget
+
+
+_MAGIC = b"AOIDX001"
+# magic, capacity (slots), used slots, log size covered by the index
+_HEADER = struct.Struct("<8sQQQ")
+# claim ID hash, log offset + 1 (0 marks an empty slot)
+_SLOT = struct.Struct("<QQ")
+# Covered log size of an index ahead of the flushed log: never matches on open
+_UNFLUSHED = 2 ** 64 - 1
+
+
+def _hash_id(claim_id: str) -> int:
+    """Stable, non-zero 64-bit hash of a claim ID"""
+    digest = hashlib.blake2b(claim_id.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") or 1
+
+
+class ClaimStore:
+    """
+    Append-only claim log with a memory-mapped ID -> offset index.
+    
+    Files live in one directory: ``claims.log`` and ``claims.idx``. Updating
+    a claim appends a new record and repoints the index; compact() rewrites
+    the log with live records only. If the index is missing or does not
+    match the log (e.g. after a crash), it is rebuilt from the log on open;
+    a partial last record left by a crash is dropped first.
+    """
+    
+    LOG_NAME = "claims.log"
+    INDEX_NAME = "claims.idx"
+    
+    def __init__(self, path: Union[str, Path], initial_capacity: int = 1024):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.log_path = self.path / self.LOG_NAME
+        self.index_path = self.path / self.INDEX_NAME
+        self._initial_capacity = max(16, 1 << (initial_capacity - 1).bit_length())
+        
+        self.log_path.touch(exist_ok=True)
+        self._truncate_torn_record()
+        self._log = open(self.log_path, "ab")
+        self._reader = open(self.log_path, "rb")
+        self._log_size = self.log_path.stat().st_size
+        self._pending = False
+        # Index changed since the last flush (its header is marked _UNFLUSHED)
+        self._unflushed = False
+        self._index_file = None
+        self._index: Optional[mmap.mmap] = None
+        self._open_index()
+    
+    # Index ------------------------------------------------------------------
+    
+    def _open_index(self) -> None:
+        if self.index_path.exists():
+            self._map_index()
+            magic, _, _, covered = _HEADER.unpack_from(self._index, 0)
+            if magic == _MAGIC and covered == self._log_size:
+                return
+            self._unmap_index()
+        self._rebuild_index()
+    
+    def _map_index(self) -> None:
+        self._index_file = open(self.index_path, "r+b")
+        self._index = mmap.mmap(self._index_file.fileno(), 0)
+        _, self._capacity, self._used, _ = _HEADER.unpack_from(self._index, 0)
+    
+    def _unmap_index(self) -> None:
+        if self._index is not None:
+            self._index.close()
+            self._index_file.close()
+            self._index = None
+            self._index_file = None
+    
+    @staticmethod
+    def _create_index(path: Path, capacity: int) -> None:
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, capacity, 0, 0))
+            f.truncate(_HEADER.size + capacity * _SLOT.size)
+    
+    def _write_header(self) -> None:
+        covered = _UNFLUSHED if self._unflushed else self._log_size
+        _HEADER.pack_into(self._index, 0, _MAGIC, self._capacity, self._used, covered)
+    
+    def _rebuild_index(self) -> None:
+        """Rebuild the index by scanning the whole log"""
+        self._unmap_index()
+        self._create_index(self.index_path, self._initial_capacity)
+        self._map_index()
+        for offset, claim_id, _ in self._scan_log():
+            self._index_put(claim_id, _hash_id(claim_id), offset)
+        self._write_header()
+    
+    def _grow_index(self) -> None:
+        """Double the index capacity, rehashing from the stored hashes"""
+        slots = [
+            _SLOT.unpack_from(self._index, _HEADER.size + i * _SLOT.size)
+            for i in range(self._capacity)
+        ]
+        capacity = self._capacity * 2
+        self._unmap_index()
+        tmp_path = self.index_path.with_suffix(".idx.tmp")
+        self._create_index(tmp_path, capacity)
+        os.replace(tmp_path, self.index_path)
+        self._map_index()
+        for hashed, stored in slots:
+            if stored:
+                slot = self._free_slot(hashed)
+                _SLOT.pack_into(self._index, _HEADER.size + slot * _SLOT.size, hashed, stored)
+        self._used = sum(1 for _, stored in slots if stored)
+        self._write_header()
+    
+    def _probe(self, hashed: int) -> Iterator[Tuple[int, int, int]]:
+        """Yield (slot, hash, offset + 1) along the probe sequence up to an empty slot"""
+        mask = self._capacity - 1
+        slot = hashed & mask
+        while True:
+            stored_hash, stored = _SLOT.unpack_from(self._index, _HEADER.size + slot * _SLOT.size)
+            yield slot, stored_hash, stored
+            if not stored:
+                return
+            slot = (slot + 1) & mask
+    
+    def _free_slot(self, hashed: int) -> int:
+        for slot, _, stored in self._probe(hashed):
+            if not stored:
+                return slot
+        raise RuntimeError("index is full")  # unreachable: load factor <= 1/2
+    
+    def _lookup(self, claim_id: str, hashed: int) -> Tuple[int, Optional[int]]:
+        """Find the slot and log offset of a claim (offset None if absent)"""
+        for slot, stored_hash, stored in self._probe(hashed):
+            if not stored:
+                return slot, None
+            if stored > self._log_size:
+                continue  # points past the log: a record lost in a crash
+            if stored_hash == hashed and self._read_id(stored - 1) == claim_id:
+                return slot, stored - 1
+    
+    def _index_put(self, claim_id: str, hashed: int, offset: int) -> None:
+        slot, previous = self._lookup(claim_id, hashed)
+        _SLOT.pack_into(self._index, _HEADER.size + slot * _SLOT.size, hashed, offset + 1)
+        if previous is None:
+            self._used += 1
+            if self._used * 2 > self._capacity:
+                self._grow_index()
+    
+    def _is_live(self, hashed: int, offset: int) -> bool:
+        return any(
+            stored_hash == hashed and stored == offset + 1
+            for _, stored_hash, stored in self._probe(hashed)
+        )
+    
+    # Log --------------------------------------------------------------------
+    
+    def _read_record(self, offset: int) -> Dict[str, Any]:
+        if self._pending:
+            self._log.flush()
+            self._pending = False
+        self._reader.seek(offset)
+        return json.loads(self._reader.readline())
+    
+    def _read_id(self, offset: int) -> str:
+        return self._read_record(offset)["claim_id"]
+    
+    def _truncate_torn_record(self, chunk_size: int = 65536) -> None:
+        """
+        Cut a partial last record (a write interrupted by a crash) off the
+        log, so that the next record starts on a line of its own.
+        """
+        with open(self.log_path, "r+b") as log:
+            end = log.seek(0, os.SEEK_END)
+            if not end:
+                return
+            log.seek(end - 1)
+            if log.read(1) == b"\n":
+                return
+            # Search backwards for the end of the last complete record
+            position = end
+            while position > 0:
+                start = max(0, position - chunk_size)
+                log.seek(start)
+                newline = log.read(position - start).rfind(b"\n")
+                if newline >= 0:
+                    log.truncate(start + newline + 1)
+                    return
+                position = start
+            log.truncate(0)
+    
+    def _scan_log(self) -> Iterator[Tuple[int, str, Dict[str, Any]]]:
+        """Yield (offset, claim ID, record) for every record of the log"""
+        if self._pending:
+            self._log.flush()
+            self._pending = False
+        with open(self.log_path, "rb") as log:
+            offset = 0
+            for line in log:
+                if line.endswith(b"\n"):
+                    record = json.loads(line)
+                    yield offset, record["claim_id"], record
+                offset += len(line)
+    
+    # Public API -------------------------------------------------------------
+    
+    def put(self, claim: Claim) -> None:
+        """Append a claim record and point the index at it"""
+        line = json.dumps(claim.to_dict(), ensure_ascii=False).encode("utf-8") + b"\n"
+        if not self._unflushed:
+            # Until the next flush the index may point past the log on disk:
+            # a crash in between must make the next open rebuild it
+            self._unflushed = True
+            self._write_header()
+            self._index.flush(0, _HEADER.size)
+        offset = self._log_size
+        self._log.write(line)
+        self._log_size += len(line)
+        self._pending = True
+        self._index_put(claim.claim_id, _hash_id(claim.claim_id), offset)
+    
+    def get(self, claim_id: str) -> Optional[Claim]:
+        """Load a claim by ID (O(1): one index probe and one record read)"""
+        _, offset = self._lookup(claim_id, _hash_id(claim_id))
+        return None if offset is None else Claim.from_dict(self._read_record(offset))
+    
+    def __contains__(self, claim_id: object) -> bool:
+        return isinstance(claim_id, str) and self._lookup(claim_id, _hash_id(claim_id))[1] is not None
+    
+    def __len__(self) -> int:
+        return self._used
+    
+    def iter_claims(self) -> Iterator[Claim]:
+        """Yield live claims in log order (an updated claim moves to the end)"""
+        for offset, claim_id, record in self._scan_log():
+            if self._is_live(_hash_id(claim_id), offset):
+                yield Claim.from_dict(record)
+    
+    def compact(self) -> None:
+        """Rewrite the log with live records only and rebuild the index"""
+        tmp_path = self.log_path.with_suffix(".log.tmp")
+        with open(tmp_path, "wb") as out:
+            for offset, claim_id, _ in self._scan_log():
+                if self._is_live(_hash_id(claim_id), offset):
+                    self._reader.seek(offset)
+                    out.write(self._reader.readline())
+        
+        self._log.close()
+        self._reader.close()
+        os.replace(tmp_path, self.log_path)
+        self._log = open(self.log_path, "ab")
+        self._reader = open(self.log_path, "rb")
+        self._log_size = self.log_path.stat().st_size
+        self._rebuild_index()
+    
+    def flush(self) -> None:
+        """Flush the log and the index to disk"""
+        self._log.flush()
+        os.fsync(self._log.fileno())
+        self._pending = False
+        self._unflushed = False
+        self._write_header()
+        self._index.flush()
+    
+    def close(self) -> None:
+        """Flush and close the store"""
+        if self._index is None:
+            return
+        self.flush()
+        self._unmap_index()
+        self._log.close()
+        self._reader.close()
+    
+    def __enter__(self) -> 'ClaimStore':
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class PersistentClaims(Mapping):
+    """Read-only ``claims`` mapping (claim ID -> Claim) backed by a ClaimStore"""
+    
+    def __init__(self, store: ClaimStore):
+        self._store = store
+    
+    def __getitem__(self, claim_id: str) -> Claim:
+        claim = self._store.get(claim_id)
+        if claim is None:
+            raise KeyError(claim_id)
+        return claim
+    
+    def __contains__(self, claim_id: object) -> bool:
+        return claim_id in self._store
+    
+    def __iter__(self) -> Iterator[str]:
+        return (claim.claim_id for claim in self._store.iter_claims())
+    
+    def __len__(self) -> int:
+        return len(self._store)
+    
+    # Single sequential pass over the log instead of one lookup per key
+    def values(self) -> Iterator[Claim]:
+        return self._store.iter_claims()
+    
+    def items(self) -> Iterator[Tuple[str, Claim]]:
+        return ((claim.claim_id, claim) for claim in self._store.iter_claims())
+
+
+class PersistentClaimLedger(ClaimLedger):
+    """
+    Claim ledger persisted in a ClaimStore directory.
+    
+    Drop-in replacement for ClaimLedger: claims are loaded from disk on
+    access, so reopening does not load the ledger. Claims returned by
+    ``claims``/get_claim are copies; change them with update_claim().
+    The dependency index is built lazily on first use.
+    """
+    
+    def __init__(self, path: Union[str, Path]):
+        # Storage is on disk: ClaimLedger.__init__ is deliberately not called
+        self.store = ClaimStore(path)
+        self.claims = PersistentClaims(self.store)
+        self._dependency_index: Optional[DependencyIndex] = None
+        self._dirty = set()
+        self._validations: Dict[str, Dict[str, Any]] = {}
+        self._validated_budget: Optional[ProofBudget] = None
+    
+    @property
+    def dependency_index(self) -> DependencyIndex:
+        if self._dependency_index is None:
+            index = DependencyIndex()
+            for claim in self.store.iter_claims():
+                index.set_dependencies(claim.claim_id, claim.dependencies)
+            self._dependency_index = index
+        return self._dependency_index
+    
+    def add_claim(self, claim: Claim) -> None:
+        """Append a claim to the ledger (replacing any claim with the same ID)"""
+        self.store.put(claim)
+        if self._dependency_index is not None:
+            self._dependency_index.set_dependencies(claim.claim_id, claim.dependencies)
+        self.mark_dirty(claim.claim_id)
+    
+    def update_claim(self, claim_id: str, **changes: Any) -> Claim:
+        """
+        Change fields of an existing claim and persist the new version.
+        
+        Raises:
+            KeyError: If the claim is not in the ledger
+        """
+        claim = self.claims[claim_id]
+        for name, value in changes.items():
+            setattr(claim, name, value)
+        self.add_claim(claim)
+        return claim
+    
+    def get_claim(self, claim_id: str) -> Optional[Claim]:
+        """Get a claim by ID (O(1) index lookup)"""
+        return self.store.get(claim_id)
+    
+    def compact(self) -> None:
+        """Drop superseded records from the log"""
+        self.store.compact()
+    
+    def flush(self) -> None:
+        """Flush pending writes to disk"""
+        self.store.flush()
+    
+    def close(self) -> None:
+        """Flush and close the underlying store"""
+        self.store.close()
+    
+    def __enter__(self) -> 'PersistentClaimLedger':
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
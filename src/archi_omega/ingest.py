@@ -0,0 +1,237 @@
+"""
+ARCHI-Ω v1.2 - Input Ingestion
+
+Fast, schema-checked loading of user inputs:
+- YAML through the libyaml CSafeLoader when available (pure-Python fallback)
+- JSON, and MessagePack when the msgpack package is installed
+- Single-pass validation of the sections (GOAL, USERS_LOAD, SLA_SLO, ...)
+  and of the optional CLAIMS list, before any pipeline work starts
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+try:
+    import msgpack
+except ImportError:  # optional dependency
+    msgpack = None
+
+from .epistemic.foundation import (
+    OriginTag, ProofLevel, TestabilityLevel, Claim, ClaimLedger, CLAIM_EXPORT_FIELDS
+)
+from .pipeline.stages import ProjectContext
+
+
+# libyaml-backed loader, about ten times faster than the Python one
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Input file formats by suffix
+INPUT_FORMATS = {
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".json": "json",
+    ".msgpack": "msgpack",
+    ".mpk": "msgpack"
+}
+
+# Section -> (context field, accepted types, expected kind). Empty sections,
+# null and "N/A" leave the field at its default.
+INPUT_SCHEMA: Dict[str, Tuple[str, tuple, str]] = {
+    "GOAL": ("goal", (str,), "a string"),
+    "DELIVERABLE": ("deliverable", (str,), "a string"),
+    "USERS_LOAD": ("users_load", (dict,), "a mapping"),
+    "SLA_SLO": ("sla_slo", (dict,), "a mapping"),
+    "DATA": ("data", (dict,), "a mapping"),
+    "CONSTRAINTS": ("constraints", (dict,), "a mapping"),
+    "INTEGRATIONS": ("integrations", (list,), "a list"),
+    "OPS": ("ops", (dict,), "a mapping"),
+    "SECURITY": ("security", (dict,), "a mapping"),
+    "AI_ML": ("ai_ml", (dict,), "a mapping"),
+    "DONE": ("done_criteria", (dict,), "a mapping of lists"),
+    "CLAIMS": ("claim_ledger", (list,), "a list of claims")
+}
+
+REQUIRED_CLAIM_FIELDS = ("claim_id", "text", "origin_tag", "proof_level")
+
+# Enum-valued claim fields
+CLAIM_ENUMS = {
+    "origin_tag": OriginTag,
+    "proof_level": ProofLevel,
+    "testability": TestabilityLevel
+}
+
+# Accepted spellings per enum field: member name (e.g. "S1") or export
+# value, both mapped to the value expected by Claim.from_dict
+CLAIM_ENUM_VALUES = {
+    field_name: {
+        **{member.name: member.value for member in enum},
+        **{member.value: member.value for member in enum}
+    }
+    for field_name, enum in CLAIM_ENUMS.items()
+}
+
+_CLAIM_FIELDS = frozenset(CLAIM_EXPORT_FIELDS)
+
+
+class InputValidationError(ValueError):
+    """Raised when a user input does not match the input schema"""
+    
+    def __init__(self, errors: List[str], source: str = "input"):
+        self.errors = errors
+        self.source = source
+        super().__init__(f"{source}: " + "; ".join(errors))
+
+
+def _type_name(value: Any) -> str:
+    return type(value).__name__
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or (isinstance(value, str) and value.strip().upper() == "N/A")
+
+
+def _check_claims(claims: List[Any], errors: List[str]) -> None:
+    """Validate the CLAIMS entries, appending problems to errors"""
+    seen = set()
+    for index, claim in enumerate(claims):
+        where = f"CLAIMS[{index}]"
+        if not isinstance(claim, dict):
+            errors.append(f"{where} must be a mapping, got {_type_name(claim)}")
+            continue
+        unknown = claim.keys() - _CLAIM_FIELDS
+        if unknown:
+            errors.append(f"{where} has unknown field(s): {', '.join(sorted(map(str, unknown)))}")
+        for name in REQUIRED_CLAIM_FIELDS:
+            if name not in claim:
+                errors.append(f"{where} is missing '{name}'")
+        for name, values in CLAIM_ENUM_VALUES.items():
+            if name in claim and not (isinstance(claim[name], str) and claim[name] in values):
+                names = ", ".join(member.name for member in CLAIM_ENUMS[name])
+                errors.append(f"{where}.{name} must be one of {names}")
+        dependencies = claim.get("dependencies", [])
+        if not isinstance(dependencies, list) or not all(isinstance(d, str) for d in dependencies):
+            errors.append(f"{where}.dependencies must be a list of claim IDs")
+        claim_id = claim.get("claim_id")
+        if "claim_id" in claim and not isinstance(claim_id, str):
+            errors.append(f"{where}.claim_id must be a string")
+        elif claim_id in seen:
+            errors.append(f"{where} duplicates claim ID '{claim_id}'")
+        else:
+            seen.add(claim_id)
+
+
+def validate_input(data: Any) -> List[str]:
+    """
+    Check parsed input against INPUT_SCHEMA in a single pass.
+    
+    Returns:
+        List of problems found (empty if the input is valid)
+    """
+    if not isinstance(data, dict):
+        return [f"input must be a mapping of sections, got {_type_name(data)}"]
+    
+    errors = []
+    for section, value in data.items():
+        spec = INPUT_SCHEMA.get(section)
+        if spec is None:
+            errors.append(f"unknown section '{section}' (expected {', '.join(INPUT_SCHEMA)})")
+            continue
+        if _is_empty(value):
+            continue
+        _, types, kind = spec
+        if not isinstance(value, types):
+            errors.append(f"{section} must be {kind}, got {_type_name(value)}")
+        elif section == "DONE":
+            for key, items in value.items():
+                if not isinstance(items, list):
+                    errors.append(f"DONE.{key} must be a list, got {_type_name(items)}")
+        elif section == "CLAIMS":
+            _check_claims(value, errors)
+    return errors
+
+
+def context_from_input(
+    data: Any,
+    source: str = "input",
+    ledger: Optional[ClaimLedger] = None
+) -> ProjectContext:
+    """
+    Build a project context from parsed input sections.
+    
+    CLAIMS entries (in the ledger export format, see Claim.to_dict, with
+    enum fields given by name or value) are added to ledger, or to a new
+    ClaimLedger.
+    
+    Raises:
+        InputValidationError: If the input does not match the schema
+    """
+    errors = validate_input(data)
+    if errors:
+        raise InputValidationError(errors, source)
+    
+    context = ProjectContext()
+    for section, value in data.items():
+        if _is_empty(value):
+            continue
+        name = INPUT_SCHEMA[section][0]
+        if section == "CLAIMS":
+            context.claim_ledger = ledger if ledger is not None else ClaimLedger()
+            for claim in value:
+                claim = dict(claim)
+                for field_name, values in CLAIM_ENUM_VALUES.items():
+                    if field_name in claim:
+                        claim[field_name] = values[claim[field_name]]
+                context.claim_ledger.add_claim(Claim.from_dict(claim))
+        else:
+            setattr(context, name, value)
+    return context
+
+
+def decode_input(payload: bytes, input_format: str) -> Any:
+    """
+    Parse raw input bytes in one of the INPUT_FORMATS.
+    
+    Raises:
+        InputValidationError: If the payload cannot be parsed
+        ImportError: For MessagePack without the msgpack package
+    """
+    try:
+        if input_format == "json":
+            return json.loads(payload)
+        if input_format == "msgpack":
+            if msgpack is None:
+                raise ImportError("MessagePack input requires the msgpack package")
+            return msgpack.unpackb(payload, raw=False)
+        return yaml.load(payload, Loader=YamlLoader)
+    except (ValueError, yaml.YAMLError) as e:
+        raise InputValidationError([f"cannot parse {input_format}: {e}"]) from e
+
+
+def load_yaml(path: Path) -> Any:
+    """Parse a YAML file with the fastest available safe loader"""
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=YamlLoader)
+
+
+def load_input(path: Path, ledger: Optional[ClaimLedger] = None) -> ProjectContext:
+    """
+    Load and validate a user input file (YAML, JSON or MessagePack).
+    
+    Files of other types (e.g. markdown) yield an empty context.
+    
+    Raises:
+        InputValidationError: If the file is malformed or does not match
+            the input schema
+    """
+    input_format = INPUT_FORMATS.get(path.suffix.lower())
+    if input_format is None:
+        return ProjectContext()
+    
+    try:
+        data = decode_input(path.read_bytes(), input_format)
+    except InputValidationError as e:
+        raise InputValidationError(e.errors, str(path)) from e
+    return context_from_input(data, str(path), ledger)
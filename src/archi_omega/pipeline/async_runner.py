@@ -0,0 +1,162 @@
+"""
+ARCHI-Ω v1.2 - Async Pipeline Runner
+
+Asyncio front-end for the execution pipeline:
+- Stages without a dependency between them (STAGE_DEPENDENCIES) run
+  concurrently, e.g. COMPILER/EXPAND/BRANCH, then LINT/STRESS/SELECT
+- The STRESS sub-tests run concurrently with each other
+- LINT and the ledger-walking stress sub-tests run on a configurable
+  thread or process executor, so the event loop is never blocked
+"""
+
+import asyncio
+import dataclasses
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Union
+
+from .stages import Pipeline, ProjectContext, STAGE_DEPENDENCIES, Stressor
+
+
+EXECUTOR_KINDS = {
+    "thread": ThreadPoolExecutor,
+    "process": ProcessPoolExecutor
+}
+
+
+class AsyncPipeline:
+    """
+    Run a Pipeline from asyncio with independent stages in parallel.
+    
+    Stages that write to the context run on the loop's default executor.
+    LINT and the stress sub-tests walking the claim ledger run on the check
+    executor: "thread" (default), "process" or any Executor instance. With
+    processes, the context is pickled for each check and read-only there, so
+    the ledger's validation cache of the caller is not updated (and ledgers
+    holding open files, such as PersistentClaimLedger, cannot be used).
+    
+    The deliverable is the same as the one of Pipeline.execute; the result
+    cache of the wrapped pipeline is honoured, telemetry is not recorded.
+    """
+    
+    def __init__(
+        self,
+        pipeline: Optional[Pipeline] = None,
+        executor: Union[str, Executor] = "thread",
+        max_workers: Optional[int] = None
+    ):
+        self.pipeline = pipeline or Pipeline()
+        if isinstance(executor, str):
+            if executor not in EXECUTOR_KINDS:
+                raise ValueError(f"Unknown executor kind: {executor}")
+            self._executor: Optional[Executor] = None
+            self._executor_kind = executor
+            self._owns_executor = True
+        else:
+            self._executor = executor
+            self._executor_kind = None
+            self._owns_executor = False
+        self.max_workers = max_workers
+    
+    @property
+    def executor(self) -> Executor:
+        """Executor of the CPU-heavy checks, created on first use"""
+        if self._executor is None:
+            self._executor = EXECUTOR_KINDS[self._executor_kind](max_workers=self.max_workers)
+        return self._executor
+    
+    def close(self) -> None:
+        """Shut down the check executor if this runner created it"""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+    
+    async def __aenter__(self) -> "AsyncPipeline":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+    
+    async def execute(self, context: ProjectContext, render_ledger: bool = True) -> Dict[str, Any]:
+        """
+        Execute the full pipeline on a project context.
+        
+        Returns:
+            Final deliverable with all sections
+        """
+        cache = self.pipeline.cache
+        if cache is not None:
+            key = self.pipeline._cache_key(context, render_ledger)
+            deliverable = cache.get(key)
+            if deliverable is not None:
+                self.pipeline._restore_context(context, deliverable)
+                return deliverable
+            deliverable = await self._run(context, render_ledger)
+            cache.put(key, deliverable)
+            return deliverable
+        
+        return await self._run(context, render_ledger)
+    
+    async def _run(self, context: ProjectContext, render_ledger: bool) -> Dict[str, Any]:
+        """Schedule every stage once its dependencies are done"""
+        context.stage_outputs = {}
+        tasks: Dict[str, "asyncio.Future[Any]"] = {}
+        for stage, dependencies in STAGE_DEPENDENCIES.items():
+            tasks[stage] = asyncio.ensure_future(self._run_stage(
+                stage, context, render_ledger, [tasks[name] for name in dependencies]
+            ))
+        
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            raise
+        
+        return context.stage_outputs["commit"]
+    
+    async def _run_stage(
+        self,
+        stage: str,
+        context: ProjectContext,
+        render_ledger: bool,
+        dependencies: List["asyncio.Future[Any]"]
+    ) -> None:
+        """Wait for the stage dependencies, then run it off the event loop"""
+        if dependencies:
+            await asyncio.gather(*dependencies)
+        
+        loop = asyncio.get_running_loop()
+        if stage == "lint":
+            result = await loop.run_in_executor(
+                self.executor, self.pipeline.linter.lint, self._snapshot(context)
+            )
+        elif stage == "stress":
+            result = await self._stress(context)
+        else:
+            result = await loop.run_in_executor(
+                None, self.pipeline._call_stage, stage, context, render_ledger
+            )
+        context.stage_outputs[stage] = result
+    
+    @staticmethod
+    def _snapshot(context: ProjectContext) -> ProjectContext:
+        """
+        Shallow copy of the context handed to the check executor, without the
+        stage outputs that concurrent stages are still adding to (a process
+        pool pickles its arguments in a background thread).
+        """
+        return dataclasses.replace(context, stage_outputs={})
+    
+    async def _stress(self, context: ProjectContext) -> Dict[str, Any]:
+        """Run the stress sub-tests concurrently, in report order"""
+        loop = asyncio.get_running_loop()
+        run_test = self.pipeline.stressor.run_test
+        snapshot = self._snapshot(context)
+        
+        async def run(name: str) -> Dict[str, Any]:
+            if name in Stressor.LEDGER_TESTS:
+                return await loop.run_in_executor(self.executor, run_test, name, snapshot)
+            return run_test(name, context)
+        
+        results = await asyncio.gather(*(run(name) for name in Stressor.TESTS))
+        return dict(zip(Stressor.TESTS, results))
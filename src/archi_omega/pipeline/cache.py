@@ -0,0 +1,191 @@
+"""
+ARCHI-Ω v1.2 - Pipeline Result Cache
+
+Content-addressed cache of pipeline deliverables:
+- Key: hash of the normalized project inputs, claims and effective config
+- In-memory LRU tier, optionally backed by an on-disk SQLite tier
+- Size limits with least-recently-used eviction, hit/miss counters
+"""
+
+import hashlib
+import json
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+
+def normalize(value: Any) -> Any:
+    """
+    Normalize an input value so that cosmetic edits hash identically.
+    
+    Strings are stripped with inner whitespace collapsed; dict keys are
+    sorted (by the JSON encoder).
+    """
+    if isinstance(value, str):
+        return " ".join(value.split())
+    if isinstance(value, dict):
+        return {str(key): normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [normalize(item) for item in value]
+    return value
+
+
+def context_fingerprint(context: Any, config: Dict[str, Any]) -> str:
+    """
+    Hash the inputs of a project context together with the pipeline config.
+    
+    Only input sections and claims are hashed; pipeline state written by the
+    stages (risk class, facts, options, ...) is not.
+    
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = {
+        "inputs": {name: normalize(getattr(context, name)) for name in context.INPUT_FIELDS},
+        "claims": [normalize(claim.to_dict()) for claim in context.claim_ledger.claims.values()],
+        "config": normalize(config)
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Two-tier LRU cache of pipeline deliverables.
+    
+    Entries are stored pickled, so every hit returns an independent copy.
+    The optional SQLite file is a local, trusted cache: do not point it at
+    files from untrusted sources.
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_bytes: int = 64 * 1024 * 1024,
+        path: Optional[Union[str, Path]] = None,
+        max_disk_bytes: int = 512 * 1024 * 1024
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.path = Path(path) if path else None
+        self.max_disk_bytes = max_disk_bytes
+        
+        self._memory: 'OrderedDict[str, bytes]' = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        
+        self._db: Optional[sqlite3.Connection] = None
+        if self.path:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                "size INTEGER NOT NULL, last_access REAL NOT NULL)"
+            )
+            self._db.commit()
+    
+    def __reduce__(self):
+        # Worker processes reopen the cache from its settings
+        return (type(self), (self.max_entries, self.max_bytes, self.path, self.max_disk_bytes))
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a deliverable (None on miss)"""
+        with self._lock:
+            blob = self._memory.get(key)
+            if blob is not None:
+                self._memory.move_to_end(key)
+            elif self._db is not None:
+                row = self._db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    blob = row[0]
+                    self._db.execute(
+                        "UPDATE results SET last_access = ? WHERE key = ?", (time.time(), key)
+                    )
+                    self._db.commit()
+                    self._remember(key, blob)
+            
+            if blob is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return pickle.loads(blob)
+    
+    def put(self, key: str, deliverable: Dict[str, Any]) -> None:
+        """Store a deliverable under a key"""
+        blob = pickle.dumps(deliverable, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._remember(key, blob)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO results (key, value, size, last_access) VALUES (?, ?, ?, ?)",
+                    (key, blob, len(blob), time.time())
+                )
+                self._evict_disk()
+                self._db.commit()
+    
+    def _remember(self, key: str, blob: bytes) -> None:
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        if len(blob) > self.max_bytes:
+            return
+        self._memory[key] = blob
+        self._memory_bytes += len(blob)
+        while len(self._memory) > self.max_entries or self._memory_bytes > self.max_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self.evictions += 1
+    
+    def _evict_disk(self) -> None:
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total <= self.max_disk_bytes:
+            return
+        for key, size in self._db.execute(
+            "SELECT key, size FROM results ORDER BY last_access"
+        ).fetchall():
+            self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+            self.evictions += 1
+            total -= size
+            if total <= self.max_disk_bytes:
+                break
+    
+    def clear(self) -> None:
+        """Drop every entry from both tiers"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM results")
+                self._db.commit()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters and tier sizes"""
+        with self._lock:
+            stats = {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._memory),
+                "bytes": self._memory_bytes
+            }
+            if self._db is not None:
+                count, size = self._db.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results"
+                ).fetchone()
+                stats["disk_entries"] = count
+                stats["disk_bytes"] = size
+        return stats
+    
+    def close(self) -> None:
+        """Close the on-disk tier"""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
@@ -0,0 +1,283 @@
+"""
+ARCHI-Ω v1.2 - Component Catalog
+
+Candidate architectures for the BRANCH stage:
+- Local catalog of component choices (compute, storage, queue, auth,
+  deploy), each scored 0-5 on the score matrix dimensions
+- Every combination of one choice per category is a candidate; its score
+  on a dimension is the mean of its components' scores
+- All candidates ranked at once by weighted total: one matrix x weight
+  vector product per category, summed over the combination grid (NumPy for
+  large catalogs, pure Python otherwise)
+- The best candidates differing in enough components become the OPTIONS
+"""
+
+import heapq
+import itertools
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+
+# Score matrix dimensions scored by the catalog (higher is better: a cost
+# of 5 is the cheapest)
+SCORE_DIMENSIONS = (
+    "robustness", "security", "simplicity", "cost",
+    "performance", "time_to_ship", "operability", "scalability"
+)
+
+DEFAULT_WEIGHTS: Mapping[str, float] = MappingProxyType(
+    {dimension: 1.0 for dimension in SCORE_DIMENSIONS}
+)
+
+# At most this many OPTIONS are kept (2-3 external options)
+MAX_OPTIONS = 3
+
+# Kept options differ from each other in at least this many categories
+MIN_DIFFERENT_COMPONENTS = 2
+
+# Catalogs with fewer combinations are ranked without NumPy, whose import
+# alone costs more than ranking them in pure Python
+VECTORIZE_MIN_COMBINATIONS = 20_000
+
+# Dimension scores from which a trade-off is listed
+ADVANTAGE_SCORE = 4.0
+DISADVANTAGE_SCORE = 2.5
+
+
+class Component(NamedTuple):
+    """A component choice and its scores, in SCORE_DIMENSIONS order"""
+    name: str
+    scores: Tuple[int, ...]
+
+
+Catalog = Mapping[str, Sequence[Component]]
+
+#                         rob sec sim cost perf tts ops scal
+COMPONENT_CATALOG: Catalog = MappingProxyType({
+    "compute": (
+        Component("Serverless functions", (4, 4, 4, 4, 3, 5, 4, 5)),
+        Component("Managed containers", (4, 4, 3, 3, 4, 4, 4, 4)),
+        Component("Kubernetes cluster", (4, 3, 1, 2, 5, 2, 2, 5)),
+        Component("Virtual machines", (3, 3, 3, 3, 4, 3, 2, 2)),
+        Component("Platform-as-a-Service", (4, 4, 5, 3, 3, 5, 5, 3)),
+    ),
+    "storage": (
+        Component("Managed PostgreSQL", (4, 4, 4, 3, 4, 4, 4, 3)),
+        Component("Serverless NoSQL", (4, 4, 3, 4, 4, 4, 5, 5)),
+        Component("Self-hosted PostgreSQL", (3, 3, 2, 4, 4, 2, 2, 3)),
+        Component("Distributed SQL", (5, 4, 2, 1, 4, 2, 3, 5)),
+        Component("Object storage + metadata DB", (4, 4, 3, 5, 3, 3, 4, 5)),
+    ),
+    "queue": (
+        Component("No queue (synchronous)", (2, 4, 5, 5, 3, 5, 4, 2)),
+        Component("Managed queue", (4, 4, 4, 4, 4, 4, 5, 4)),
+        Component("Kafka", (5, 3, 1, 2, 5, 2, 2, 5)),
+        Component("Redis streams", (3, 3, 3, 4, 5, 3, 3, 3)),
+    ),
+    "auth": (
+        Component("Managed identity provider (OIDC)", (4, 5, 4, 3, 4, 5, 5, 4)),
+        Component("Self-hosted Keycloak", (4, 4, 2, 4, 4, 2, 2, 4)),
+        Component("Application sessions", (3, 2, 4, 5, 4, 4, 3, 2)),
+        Component("API keys", (2, 2, 5, 5, 5, 5, 4, 3)),
+    ),
+    "deploy": (
+        Component("Single region, single AZ", (1, 3, 5, 5, 4, 5, 4, 2)),
+        Component("Single region, multi-AZ", (4, 3, 4, 3, 4, 4, 4, 3)),
+        Component("Multi-region active-passive", (5, 3, 2, 2, 4, 2, 3, 4)),
+        Component("Multi-region active-active", (5, 3, 1, 1, 5, 1, 2, 5)),
+    ),
+})
+
+_numpy: Any = None
+
+
+def _import_numpy() -> Any:
+    """NumPy module, imported on first use; None if not installed"""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:  # NumPy is optional
+            numpy = False
+        _numpy = numpy
+    return _numpy or None
+
+
+def weights_from_config(score_matrix: Mapping[str, Any]) -> Dict[str, float]:
+    """
+    Build dimension weights from the ``score_matrix`` section of the config.
+    
+    ``weights`` maps dimensions to non-negative weights; dimensions not given
+    keep their default weight of 1.
+    
+    Raises:
+        ValueError: If a dimension is unknown or a weight is negative
+    """
+    weights = dict(DEFAULT_WEIGHTS)
+    for dimension, weight in ((score_matrix or {}).get("weights") or {}).items():
+        if dimension not in weights:
+            raise ValueError(f"Unknown score dimension in config: {dimension}")
+        weight = float(weight)
+        if weight < 0:
+            raise ValueError(f"Negative weight for score dimension {dimension}")
+        weights[dimension] = weight
+    return weights
+
+
+def weight_vector(weights: Optional[Mapping[str, float]] = None) -> Tuple[float, ...]:
+    """Weights in SCORE_DIMENSIONS order; missing dimensions weigh 1"""
+    weights = weights or DEFAULT_WEIGHTS
+    return tuple(float(weights.get(dimension, 1.0)) for dimension in SCORE_DIMENSIONS)
+
+
+def count_combinations(catalog: Catalog = COMPONENT_CATALOG) -> int:
+    """Number of candidate architectures of a catalog"""
+    count = 1
+    for choices in catalog.values():
+        count *= len(choices)
+    return count
+
+
+def _category_totals(catalog: Catalog, weights: Sequence[float]) -> List[List[float]]:
+    """
+    Per category, each choice's contribution to a candidate's weighted total:
+    its score vector times the weights, over the number of categories.
+    """
+    categories = len(catalog)
+    return [
+        [sum(w * s for w, s in zip(weights, choice.scores)) / categories for choice in choices]
+        for choices in catalog.values()
+    ]
+
+
+def rank_combinations(
+    catalog: Catalog = COMPONENT_CATALOG,
+    weights: Optional[Mapping[str, float]] = None,
+    limit: int = MAX_OPTIONS
+) -> List[Tuple[float, Tuple[int, ...]]]:
+    """
+    Rank all combinations of a catalog by weighted total score.
+    
+    A combination's total is the weighted sum of its dimension scores, i.e.
+    of the mean component scores; it is the sum of the per-category choice
+    totals, so the totals of all combinations are the outer sum of the
+    category totals (see _category_totals). Ties keep catalog order.
+    
+    Returns:
+        Up to limit (total, choice index per category) pairs, best first
+    """
+    totals = _category_totals(catalog, weight_vector(weights))
+    size = count_combinations(catalog)
+    limit = min(limit, size)
+    if limit <= 0:
+        return []
+    
+    np = _import_numpy() if size >= VECTORIZE_MIN_COMBINATIONS else None
+    if np is None:
+        # Row-major enumeration, so the index breaks ties like the NumPy path
+        ranked = heapq.nsmallest(limit, (
+            (-sum(choice_totals), index, combination)
+            for index, (choice_totals, combination) in enumerate(zip(
+                itertools.product(*totals),
+                itertools.product(*(range(len(choices)) for choices in catalog.values()))
+            ))
+        ))
+        return [(-negated, combination) for negated, _, combination in ranked]
+    
+    # Totals of the whole combination grid, added category by category in
+    # the same order as the pure-Python sum
+    grid = np.zeros(())
+    for category_totals in totals:
+        grid = np.add.outer(grid, np.asarray(category_totals))
+    flat = grid.ravel()
+    if limit < size:
+        # Everything tied with the limit-th total competes on index
+        threshold = -np.partition(-flat, limit - 1)[limit - 1]
+        best = np.flatnonzero(flat >= threshold)
+    else:
+        best = np.arange(size)
+    best = best[np.lexsort((best, -flat[best]))][:limit]
+    combinations = zip(*np.unravel_index(best, grid.shape))
+    return [
+        (float(flat[index]), tuple(int(choice) for choice in combination))
+        for index, combination in zip(best, combinations)
+    ]
+
+
+def _distinct(
+    ranked: Iterable[Tuple[float, Tuple[int, ...]]],
+    count: int,
+    min_different: int
+) -> List[Tuple[float, Tuple[int, ...]]]:
+    """Greedily keep the best combinations differing enough from those kept"""
+    kept: List[Tuple[float, Tuple[int, ...]]] = []
+    for total, combination in ranked:
+        if all(
+            sum(a != b for a, b in zip(combination, other)) >= min_different
+            for _, other in kept
+        ):
+            kept.append((total, combination))
+            if len(kept) == count:
+                break
+    return kept
+
+
+def best_combinations(
+    catalog: Catalog = COMPONENT_CATALOG,
+    weights: Optional[Mapping[str, float]] = None,
+    count: int = MAX_OPTIONS,
+    min_different: int = MIN_DIFFERENT_COMPONENTS
+) -> List[Tuple[float, Tuple[int, ...]]]:
+    """
+    Best combinations that differ from each other in at least min_different
+    categories, so that the options are real alternatives.
+    
+    Returns:
+        Up to count (total, choice index per category) pairs, best first
+    """
+    size = count_combinations(catalog)
+    pool = min(size, max(64 * count, 256))
+    while True:
+        kept = _distinct(rank_combinations(catalog, weights, pool), count, min_different)
+        if len(kept) == count or pool == size:
+            return kept
+        pool = min(size, pool * 8)
+
+
+def build_option(
+    option_id: str,
+    combination: Sequence[int],
+    catalog: Catalog = COMPONENT_CATALOG,
+    weights: Optional[Mapping[str, float]] = None
+) -> Dict[str, Any]:
+    """
+    Option entry of the deliverable for one combination.
+    
+    Returns:
+        Dict with id, name, description, components, scores (0-5 per
+        dimension), tradeoffs and total_score
+    """
+    components = {
+        category: choices[choice]
+        for (category, choices), choice in zip(catalog.items(), combination)
+    }
+    means = [
+        sum(component.scores[i] for component in components.values()) / len(components)
+        for i in range(len(SCORE_DIMENSIONS))
+    ]
+    scores = {dimension: round(mean, 2) for dimension, mean in zip(SCORE_DIMENSIONS, means)}
+    total = sum(w * mean for w, mean in zip(weight_vector(weights), means))
+    names = {category: component.name for category, component in components.items()}
+    return {
+        "id": option_id,
+        "name": " + ".join(names.values()),
+        "description": ", ".join(f"{category}: {name}" for category, name in names.items()),
+        "components": names,
+        "scores": scores,
+        "tradeoffs": {
+            "advantages": [d for d, score in scores.items() if score >= ADVANTAGE_SCORE],
+            "disadvantages": [d for d, score in scores.items() if score <= DISADVANTAGE_SCORE]
+        },
+        "total_score": round(total, 2)
+    }
+
@@ -0,0 +1,320 @@
+"""
+ARCHI-Ω v1.2 - Option Selection
+
+Multi-dimensional choice between the OPTIONS of the SELECT stage:
+- Score vectors of the options over the score matrix dimensions
+- Pareto frontier of the distinct score vectors: sort-and-sweep for two
+  dimensions, sort-filter skyline (options sorted by score sum, each
+  compared only with the frontier found so far) for more
+- Dominance report: the frontier options dominating each other option
+- Recommendation and fallback by heap-based top-k on the weighted total
+- Weight sensitivity: win frequency of each option over Dirichlet samples
+  of the dimension weights, ranked in one pass (NumPy for large analyses),
+  and the smallest weight shift letting another option overtake
+"""
+
+import heapq
+import operator
+import random
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from .catalog import _import_numpy
+
+
+Vector = Tuple[float, ...]
+
+# Skylines of fewer distinct vectors are computed without NumPy
+VECTORIZE_MIN_VECTORS = 2_000
+
+# Vectors compared with the frontier per array operation, and the cap on
+# the cells of that comparison
+SKYLINE_BLOCK = 256
+SKYLINE_BLOCK_CELLS = 4_000_000
+
+# Weight vectors sampled by a sensitivity analysis
+DEFAULT_SENSITIVITY_SAMPLES = 2_000
+
+# Dirichlet parameter of each dimension: its share of the weights times the
+# number of dimensions, so that equal weights sample the simplex uniformly
+# (zero weights keep a small parameter)
+MIN_CONCENTRATION = 0.01
+
+# Analyses with fewer score products (samples x options x dimensions) are
+# computed without NumPy
+VECTORIZE_MIN_PRODUCTS = 1_000_000
+
+SENSITIVITY_SEED = 0
+
+
+def score_dimensions(options: Sequence[Mapping[str, Any]]) -> List[str]:
+    """Score dimensions of a list of options, in first-seen order"""
+    dimensions: Dict[str, None] = {}
+    for option in options:
+        dimensions.update(dict.fromkeys(option.get("scores") or {}))
+    return list(dimensions)
+
+
+def score_vectors(
+    options: Sequence[Mapping[str, Any]],
+    dimensions: Optional[Sequence[str]] = None
+) -> List[Vector]:
+    """Score vector of each option; dimensions an option lacks score 0"""
+    dimensions = score_dimensions(options) if dimensions is None else dimensions
+    return [
+        tuple(float((option.get("scores") or {}).get(dimension, 0)) for dimension in dimensions)
+        for option in options
+    ]
+
+
+def dominates(a: Vector, b: Vector) -> bool:
+    """Whether a is at least as good as b everywhere and better somewhere"""
+    return a != b and all(map(operator.ge, a, b))
+
+
+def _sweep_2d(unique: List[Vector]) -> List[int]:
+    """Frontier of distinct 2-D vectors: one sweep by decreasing x"""
+    order = sorted(range(len(unique)), key=lambda index: (-unique[index][0], -unique[index][1]))
+    frontier = []
+    best_y = None
+    for index in order:
+        y = unique[index][1]
+        if best_y is None or y > best_y:
+            frontier.append(index)
+            best_y = y
+    return frontier
+
+
+def _skyline(unique: List[Vector]) -> List[int]:
+    """
+    Frontier of distinct vectors by sort-filter skyline: a vector can only be
+    dominated by one with a larger sum, so after sorting by decreasing sum
+    each vector is checked against the frontier found so far only.
+    """
+    order = sorted(range(len(unique)), key=lambda index: -sum(unique[index]))
+    np = _import_numpy() if len(unique) >= VECTORIZE_MIN_VECTORS else None
+    if np is None:
+        frontier: List[int] = []
+        for index in order:
+            vector = unique[index]
+            if not any(dominates(unique[other], vector) for other in frontier):
+                frontier.append(index)
+        return frontier
+    
+    # Blocks of vectors are first compared with the whole frontier at once;
+    # those left are checked one by one, as in the pure-Python loop
+    values = np.asarray(unique, dtype=float)[order]
+    found = np.empty_like(values)
+    size = 0
+    frontier = []
+    start = 0
+    while start < len(order):
+        block = max(1, min(SKYLINE_BLOCK, SKYLINE_BLOCK_CELLS // max(1, size * values.shape[1])))
+        candidates = np.arange(start, min(start + block, len(order)))
+        if size:
+            dominated = np.all(found[None, :size] >= values[candidates, None], axis=2).any(axis=1)
+            candidates = candidates[~dominated]
+        # The candidates left only need checking against this block's additions
+        added = size
+        for position in candidates:
+            if not np.all(found[added:size] >= values[position], axis=1).any():
+                found[size] = values[position]
+                size += 1
+                frontier.append(order[position])
+        start += block
+    return frontier
+
+
+def pareto_frontier(
+    vectors: Sequence[Vector],
+    with_dominance: bool = True
+) -> Tuple[List[int], Dict[int, List[int]]]:
+    """
+    Non-dominated vectors (higher is better on every dimension).
+    
+    Equal vectors share one frontier check and do not dominate each other.
+    Two dimensions take one O(n log n) sort-and-sweep; more dimensions use a
+    sort-filter skyline, O(n log n) plus comparisons against the frontier.
+    The dominance report compares every dominated vector with the frontier;
+    leave it out for large candidate sets with with_dominance=False.
+    
+    Returns:
+        Tuple of (frontier indices in input order, dict mapping each
+        dominated index to the frontier indices dominating it)
+    """
+    groups: Dict[Vector, List[int]] = {}
+    for index, vector in enumerate(vectors):
+        groups.setdefault(tuple(vector), []).append(index)
+    unique = list(groups)
+    
+    if len(unique) <= 1:
+        found = list(range(len(unique)))
+    elif len(unique[0]) == 2:
+        found = _sweep_2d(unique)
+    else:
+        found = _skyline(unique)
+    
+    frontier = sorted(index for position in found for index in groups[unique[position]])
+    dominated_by: Dict[int, List[int]] = {}
+    if with_dominance:
+        on_frontier = set(found)
+        for position, vector in enumerate(unique):
+            if position in on_frontier:
+                continue
+            dominators = sorted(
+                index for other in found if dominates(unique[other], vector)
+                for index in groups[unique[other]]
+            )
+            for index in groups[vector]:
+                dominated_by[index] = dominators
+    return frontier, dict(sorted(dominated_by.items()))
+
+
+def top_options(
+    options: Sequence[Mapping[str, Any]],
+    indices: Sequence[int],
+    count: int
+) -> List[int]:
+    """Indices of the count options with the highest total_score, ties in order"""
+    return heapq.nlargest(count, indices, key=lambda index: options[index].get("total_score", 0))
+
+
+def option_ids(options: Sequence[Mapping[str, Any]]) -> List[str]:
+    """ID of each option; options without one are named by their index"""
+    return [option.get("id", str(index)) for index, option in enumerate(options)]
+
+
+def weight_shares(
+    dimensions: Sequence[str],
+    weights: Optional[Mapping[str, float]] = None
+) -> Tuple[float, ...]:
+    """Weights of the dimensions scaled to sum to 1; missing dimensions weigh 1"""
+    values = [float((weights or {}).get(dimension, 1.0)) for dimension in dimensions]
+    total = sum(values)
+    if total <= 0:
+        return tuple(1.0 / len(values) for _ in values)
+    return tuple(value / total for value in values)
+
+
+def flip_shift(
+    vectors: Sequence[Vector],
+    shares: Vector,
+    reference: int
+) -> Optional[Tuple[int, float, int]]:
+    """
+    Smallest weight shift letting another option overtake the reference one.
+    
+    The shift is the share of the total weight moved between dimensions. For
+    each rival, the cheapest move puts weight on the dimension where the
+    rival leads the most and takes it from the dimensions where the
+    reference leads the most, in that order, until the rival catches up.
+    
+    Returns:
+        Tuple of (rival index, shift, dimension receiving the weight), or
+        None if no option beats the reference on any dimension
+    """
+    best = None
+    for rival, vector in enumerate(vectors):
+        if rival == reference:
+            continue
+        lead = [a - b for a, b in zip(vectors[reference], vector)]
+        target = min(range(len(lead)), key=lead.__getitem__)
+        if lead[target] >= 0:
+            continue  # never strictly ahead
+        margin = sum(share * value for share, value in zip(shares, lead))
+        shift = 0.0
+        for source in sorted(range(len(lead)), key=lambda index: -lead[index]):
+            if margin <= 0:
+                break
+            gain = lead[source] - lead[target]
+            moved = min(shares[source], margin / gain) if gain > 0 else 0.0
+            shift += moved
+            margin -= moved * gain
+        if best is None or shift < best[1]:
+            best = (rival, shift, target)
+    return best
+
+
+def _gamma_rows(alpha: Sequence[float], samples: int, seed: int) -> Iterator[List[float]]:
+    """
+    Gamma variates whose normalized rows are Dirichlet samples; rankings do
+    not depend on the scale, so they are used as they are
+    """
+    gammavariate = random.Random(seed).gammavariate
+    for _ in range(samples):
+        yield [gammavariate(parameter, 1.0) for parameter in alpha]
+
+
+def win_counts(
+    vectors: Sequence[Vector],
+    shares: Vector,
+    samples: int = DEFAULT_SENSITIVITY_SAMPLES,
+    seed: int = SENSITIVITY_SEED
+) -> List[int]:
+    """
+    Number of sampled weight vectors under which each option ranks first.
+    
+    Weight vectors are drawn from a Dirichlet distribution centred on the
+    shares (see MIN_CONCENTRATION); every option's weighted total under
+    every sample comes from one samples x dimensions by dimensions x options
+    product, and ties go to the earlier option.
+    """
+    if not vectors or samples <= 0:
+        return [0] * len(vectors)
+    alpha = [max(share * len(shares), MIN_CONCENTRATION) for share in shares]
+    products = samples * len(vectors) * len(shares)
+    np = _import_numpy() if products >= VECTORIZE_MIN_PRODUCTS else None
+    if np is None:
+        counts = [0] * len(vectors)
+        for row in _gamma_rows(alpha, samples, seed):
+            totals = [sum(map(operator.mul, row, vector)) for vector in vectors]
+            counts[totals.index(max(totals))] += 1
+        return counts
+    
+    sampled = np.random.default_rng(seed).dirichlet(alpha, samples)
+    totals = sampled @ np.asarray(vectors, dtype=float).T
+    return [int(count) for count in np.bincount(totals.argmax(axis=1), minlength=len(vectors))]
+
+
+def weight_sensitivity(
+    options: Sequence[Mapping[str, Any]],
+    reference: int,
+    weights: Optional[Mapping[str, float]] = None,
+    samples: int = DEFAULT_SENSITIVITY_SAMPLES,
+    seed: int = SENSITIVITY_SEED
+) -> Dict[str, Any]:
+    """
+    How much the choice of an option depends on the dimension weights.
+    
+    Args:
+        options: Options with scores
+        reference: Index of the chosen option
+        weights: Dimension weights the choice was made with (default: 1)
+        samples: Dirichlet weight vectors sampled around the weights
+        seed: Seed of the samples, for reproducible reports
+    
+    Returns:
+        Dict with samples, win_frequency (option ID -> share of the samples
+        it ranks first in), stability (that share for the chosen option) and
+        flip (option, weight_shift and towards, the dimension receiving the
+        weight; None if no option can overtake the chosen one)
+    """
+    dimensions = score_dimensions(options)
+    vectors = score_vectors(options, dimensions)
+    shares = weight_shares(dimensions, weights)
+    counts = win_counts(vectors, shares, samples, seed)
+    ids = option_ids(options)
+    frequency = {
+        option_id: round(count / samples, 4) if samples > 0 else 0.0
+        for option_id, count in zip(ids, counts)
+    }
+    flip = flip_shift(vectors, shares, reference)
+    return {
+        "samples": max(samples, 0),
+        "win_frequency": frequency,
+        "stability": frequency[ids[reference]],
+        "flip": None if flip is None else {
+            "option": ids[flip[0]],
+            "weight_shift": round(flip[1], 4),
+            "towards": dimensions[flip[2]]
+        }
+    }
@@ -5,14 +5,25 @@ This module implements the execution pipeline:
 COMPILER → EXPAND → BRANCH → LINT → STRESS → SELECT → COMMIT
 """
 
-from typing import Dict, List, Any, Optional
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, List, Any, Optional, Callable, Iterable, Iterator, Mapping, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
 from ..epistemic.foundation import (
     RiskClass, ProofBudget, OriginTag, ClaimLedger, 
-    Claim, ProofLevel, TestabilityLevel
+    Claim, ProofLevel, TestabilityLevel, PROOF_BUDGETS
 )
+from ..utils.fields import iter_text
+from .cache import ResultCache, context_fingerprint
+from .catalog import COMPONENT_CATALOG, MAX_OPTIONS, Catalog, best_combinations, build_option
+from .selection import (
+    DEFAULT_SENSITIVITY_SAMPLES, option_ids, pareto_frontier, score_vectors, top_options,
+    weight_sensitivity
+)
+from .telemetry import Telemetry
+from ..utils.keywords import DEFAULT_SCANNER
 
 
 class TerminationCode(Enum):
@@ -47,6 +58,96 @@ class ProjectContext:
     options: List[Dict[str, Any]] = field(default_factory=list)
     recommendation: Optional[Dict[str, Any]] = None
     claim_ledger: ClaimLedger = field(default_factory=ClaimLedger)
+    
+    # Per-stage results of the last run, reused by Pipeline.reexecute
+    stage_outputs: Dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
+    
+    # User input sections
+    INPUT_FIELDS = (
+        "goal", "deliverable", "users_load", "sla_slo", "data", "constraints",
+        "integrations", "ops", "security", "ai_ml", "done_criteria"
+    )
+    
+    # Fields holding free text, walked by iter_text_fields (the recommendation
+    # is one of the options and is not walked twice)
+    TEXT_FIELDS = INPUT_FIELDS + ("facts", "unknowns", "assumptions", "options")
+    
+    def iter_text_fields(self, fields: Optional[Tuple[str, ...]] = None) -> Iterator[Tuple[str, str]]:
+        """
+        Lazily yield (field_path, text) pairs for all text in the context.
+        
+        Covers input sections, derived pipeline state and claim texts, e.g.
+        ``goal``, ``constraints.budget``, ``claim_ledger.C001.text``.
+        ``fields`` restricts the walked sections (claims are always included).
+        """
+        for name in self.TEXT_FIELDS if fields is None else fields:
+            yield from iter_text(getattr(self, name), name)
+        for claim in self.claim_ledger.claims.values():
+            yield f"claim_ledger.{claim.claim_id}.text", claim.text
+            yield f"claim_ledger.{claim.claim_id}.test", claim.test_description
+
+
+# Context fields each stage reads and writes, in execution order. Used by
+# Pipeline.reexecute to rerun only the stages affected by an edit.
+STAGE_FIELDS: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    "compile": {
+        "reads": ProjectContext.INPUT_FIELDS + ("claim_ledger",),
+        "writes": ("risk_class", "proof_budget")
+    },
+    "expand": {
+        "reads": ("users_load", "constraints"),
+        "writes": ("facts", "unknowns")
+    },
+    "branch": {
+        "reads": (),
+        "writes": ("options",)
+    },
+    "lint": {
+        "reads": ProjectContext.TEXT_FIELDS + ("claim_ledger", "risk_class"),
+        "writes": ()
+    },
+    "stress": {
+        "reads": ("claim_ledger", "proof_budget", "risk_class", "constraints", "security"),
+        "writes": ()
+    },
+    "select": {
+        "reads": ("options", "risk_class"),
+        "writes": ("recommendation",)
+    },
+    # COMMIT assembles the deliverable and always reruns
+    "commit": {
+        "reads": ("risk_class", "facts", "unknowns", "assumptions", "options",
+                  "recommendation", "claim_ledger"),
+        "writes": ()
+    }
+}
+
+
+def _stage_dependencies() -> Dict[str, Tuple[str, ...]]:
+    """
+    Derive, for each stage, the earlier stages it must wait for: those
+    writing a field it reads, or reading or writing a field it writes.
+    """
+    dependencies = {}
+    earlier: List[str] = []
+    for stage, fields in STAGE_FIELDS.items():
+        reads, writes = set(fields["reads"]), set(fields["writes"])
+        if stage == "commit":
+            # COMMIT also consumes the COMPILE, LINT and STRESS results
+            dependencies[stage] = tuple(earlier)
+        else:
+            dependencies[stage] = tuple(
+                name for name in earlier
+                if set(STAGE_FIELDS[name]["writes"]) & (reads | writes)
+                or set(STAGE_FIELDS[name]["reads"]) & writes
+            )
+        earlier.append(stage)
+    return dependencies
+
+
+# Stages each stage must wait for; stages without a path between them can
+# run concurrently (see AsyncPipeline)
+STAGE_DEPENDENCIES = _stage_dependencies()
 
 
 class Compiler:
@@ -63,12 +164,14 @@ class Compiler:
             Dict with risk_class, proof_budget, active_modules, tool_triggers, stop_rules
         """
         # Determine risk class based on project characteristics
-        has_financial = "budget" in context.constraints or "cost" in context.goal.lower()
-        has_legal = any(reg in str(context.constraints).lower() 
-                       for reg in ["gdpr", "hipaa", "pci", "legal"])
-        has_security = bool(context.security) or "security" in context.goal.lower()
-        has_health = "health" in context.goal.lower() or "medical" in context.goal.lower()
-        has_pii = "pii" in str(context.data).lower() or "personal" in str(context.data).lower()
+        goal_keywords = DEFAULT_SCANNER.scan(context.goal)
+        has_financial = "budget" in context.constraints or "financial" in goal_keywords
+        has_legal = any(DEFAULT_SCANNER.contains(text, "legal")
+                        for _, text in iter_text(context.constraints))
+        has_security = bool(context.security) or "security" in goal_keywords
+        has_health = "health" in goal_keywords
+        has_pii = any(DEFAULT_SCANNER.contains(text, "pii")
+                      for _, text in iter_text(context.data))
         
         from ..epistemic.foundation import RiskClassifier
         risk_class = RiskClassifier.classify(
@@ -80,7 +183,9 @@ class Compiler:
         )
         
         context.risk_class = risk_class
-        context.proof_budget = ProofBudget.for_risk_class(risk_class)
+        # Budgets loaded from the config's risk_classes, else the defaults
+        budgets = config.get("proof_budgets") or PROOF_BUDGETS
+        context.proof_budget = budgets.get(risk_class) or PROOF_BUDGETS[risk_class]
         
         # Determine active modules
         active_modules = ["CLARIFIER", "ARCHITECT", "SECURITY", "VERIFIER"]
@@ -90,9 +195,10 @@ class Compiler:
         # Determine tool triggers
         tool_triggers = []
         
-        # T-RECENCY: prices, laws, versions
-        if any(keyword in str(context).lower() 
-               for keyword in ["latest", "current", "price", "cost", "law", "regulation"]):
+        # T-RECENCY: prices, laws, versions (inputs only, so that a rerun
+        # does not depend on state left by an earlier run)
+        if any(DEFAULT_SCANNER.contains(text, "tool_recency")
+               for _, text in context.iter_text_fields(context.INPUT_FIELDS)):
             tool_triggers.append("T-RECENCY")
         
         # T-R2: high-impact recommendations
@@ -165,41 +271,27 @@ class Brancher:
     """
     
     @staticmethod
-    def branch(context: ProjectContext, num_options: int = 3) -> List[Dict[str, Any]]:
+    def branch(
+        context: ProjectContext,
+        num_options: int = 3,
+        weights: Optional[Mapping[str, float]] = None,
+        catalog: Catalog = COMPONENT_CATALOG
+    ) -> List[Dict[str, Any]]:
         """
         Generate alternative options for the solution.
         
+        Every combination of catalog components is a candidate; the best
+        candidates by weighted score (see catalog.best_combinations) that
+        differ in at least two components become the options.
+        
         Returns:
             List of options with scores and trade-offs
         """
-        # This is a simplified version - real implementation would use
-        # domain knowledge and templates to generate realistic options
-        
-        options = []
-        
-        # Generate placeholder options
-        for i in range(min(num_options, 3)):
-            option = {
-                "id": f"O{i+1}",
-                "name": f"Option {i+1}",
-                "description": f"Architecture option {i+1}",
-                "scores": {
-                    "robustness": 0,
-                    "security": 0,
-                    "simplicity": 0,
-                    "cost": 0,
-                    "performance": 0,
-                    "time_to_ship": 0,
-                    "operability": 0,
-                    "scalability": 0
-                },
-                "tradeoffs": {
-                    "advantages": [],
-                    "disadvantages": []
-                },
-                "total_score": 0
-            }
-            options.append(option)
+        ranked = best_combinations(catalog, weights, min(num_options, MAX_OPTIONS))
+        options = [
+            build_option(f"O{i+1}", combination, catalog, weights)
+            for i, (_, combination) in enumerate(ranked)
+        ]
         
         context.options = options
         return options
@@ -220,36 +312,54 @@ class Linter:
         """
         issues = []
         warnings = []
+        findings = []
         
         # Check claim ledger
         if context.claim_ledger.claims:
-            validation = context.claim_ledger.validate_all(context.risk_class)
+            validation = context.claim_ledger.validate_all(context.risk_class, context.proof_budget)
             if not validation["valid"]:
                 issues.extend(validation["issues"])
             warnings.extend(validation["warnings"])
         
-        # Check for promises/guarantees
-        promise_keywords = ["guarantee", "garanti", "assured", "assuré", "100%"]
-        text_to_check = str(context.__dict__)
-        for keyword in promise_keywords:
-            if keyword in text_to_check.lower():
-                issues.append(f"Overpromise detected: '{keyword}' found in text")
+        # Scan every text field once for overpromises and recency
+        overpromises: Dict[str, List[str]] = {}
+        recency: Dict[str, List[str]] = {}
+        for path, text in context.iter_text_fields():
+            hits = DEFAULT_SCANNER.scan(text)
+            for keyword in hits.get("overpromise", ()):
+                overpromises.setdefault(keyword, []).append(path)
+            for keyword in hits.get("recency", ()):
+                recency.setdefault(keyword, []).append(path)
+        
+        # Check for overpromises
+        for keyword in DEFAULT_SCANNER.keyword_classes["overpromise"]:
+            if keyword in overpromises:
+                fields = overpromises[keyword]
+                issues.append(f"Overpromise detected: '{keyword}' found in {', '.join(fields)}")
+                findings.extend(
+                    {"check": "overpromise", "keyword": keyword, "field": path} for path in fields
+                )
         
         # Check for untagged claims
         # (In real implementation, would parse text and check for assertions without tags)
         
         # Check for recency claims
-        recency_keywords = ["latest", "current", "newest", "dernier", "actuel"]
-        for keyword in recency_keywords:
-            if keyword in text_to_check.lower():
+        for keyword in DEFAULT_SCANNER.keyword_classes["recency"]:
+            if keyword in recency:
+                fields = recency[keyword]
                 warnings.append(
-                    f"Recency keyword '{keyword}' detected - ensure verification with S2 tools"
+                    f"Recency keyword '{keyword}' detected in {', '.join(fields)} "
+                    f"- ensure verification with S2 tools"
+                )
+                findings.extend(
+                    {"check": "recency", "keyword": keyword, "field": path} for path in fields
                 )
         
         return {
             "valid": len(issues) == 0,
             "issues": issues,
-            "warnings": warnings
+            "warnings": warnings,
+            "findings": findings
         }
 
 
@@ -258,6 +368,20 @@ class Stressor:
     STRESS stage: Test injection/autorité, contradictions, preuves, causalités, dépendances
     """
     
+    # Sub-tests in report order; each is an independent read-only check
+    TESTS = (
+        "injection_authority",
+        "contradictions",
+        "proof_adequacy",
+        "untested_causality",
+        "missing_dependencies",
+        "cost_ops_evaluation",
+        "security_risks"
+    )
+    
+    # Sub-tests walking the whole claim ledger (the expensive ones)
+    LEDGER_TESTS = ("proof_adequacy", "untested_causality", "missing_dependencies")
+    
     @staticmethod
     def stress(context: ProjectContext) -> Dict[str, Any]:
         """
@@ -266,45 +390,91 @@ class Stressor:
         Returns:
             Dict with stress test results
         """
-        tests = {
-            "injection_authority": {"passed": True, "issues": []},
-            "contradictions": {"passed": True, "issues": []},
-            "proof_adequacy": {"passed": True, "issues": []},
-            "untested_causality": {"passed": True, "issues": []},
-            "missing_dependencies": {"passed": True, "issues": []},
-            "cost_ops_evaluation": {"passed": True, "issues": []},
-            "security_risks": {"passed": True, "issues": []}
-        }
+        return {name: Stressor.run_test(name, context) for name in Stressor.TESTS}
+    
+    @staticmethod
+    def run_test(name: str, context: ProjectContext) -> Dict[str, Any]:
+        """
+        Run a single stress sub-test by name.
         
-        # Check proof adequacy against proof budget
+        Returns:
+            Dict with "passed" and "issues"
+        """
+        if name not in Stressor.TESTS:
+            raise ValueError(f"Unknown stress test: {name}")
+        return getattr(Stressor, name)(context)
+    
+    @staticmethod
+    def injection_authority(context: ProjectContext) -> Dict[str, Any]:
+        """Check for instructions injected into the inputs"""
+        return {"passed": True, "issues": []}
+    
+    @staticmethod
+    def contradictions(context: ProjectContext) -> Dict[str, Any]:
+        """Check for contradictory facts and claims"""
+        return {"passed": True, "issues": []}
+    
+    @staticmethod
+    def proof_adequacy(context: ProjectContext) -> Dict[str, Any]:
+        """Check proof adequacy against the proof budget"""
+        result = {"passed": True, "issues": []}
         if context.proof_budget and context.claim_ledger.claims:
             for claim in context.claim_ledger.claims.values():
                 if claim.origin_tag == OriginTag.UNKNOWN and context.risk_class == RiskClass.R2:
-                    tests["proof_adequacy"]["passed"] = False
-                    tests["proof_adequacy"]["issues"].append(
+                    result["passed"] = False
+                    result["issues"].append(
                         f"Claim {claim.claim_id} has UNKNOWN origin for R2 project"
                     )
-        
-        # Check for untested causality
+        return result
+    
+    @staticmethod
+    def untested_causality(context: ProjectContext) -> Dict[str, Any]:
+        """Check for strong causal claims without adequate testability"""
+        result = {"passed": True, "issues": []}
         for claim in context.claim_ledger.claims.values():
             if not claim.validate_strong_causality():
-                tests["untested_causality"]["passed"] = False
-                tests["untested_causality"]["issues"].append(
+                result["passed"] = False
+                result["issues"].append(
                     f"Claim {claim.claim_id} has strong causality without adequate testability"
                 )
-        
-        # Check cost/ops evaluation
+        return result
+    
+    @staticmethod
+    def missing_dependencies(context: ProjectContext) -> Dict[str, Any]:
+        """Check dependencies: dangling references and cycles"""
+        result = {"passed": True, "issues": []}
+        if context.claim_ledger.claims:
+            dependency_check = context.claim_ledger.check_dependencies()
+            for claim_id, missing in dependency_check["dangling"].items():
+                result["passed"] = False
+                result["issues"].append(
+                    f"Claim {claim_id} depends on unknown claim(s): {', '.join(missing)}"
+                )
+            for cycle in dependency_check["cycles"]:
+                result["passed"] = False
+                result["issues"].append(
+                    f"Dependency cycle among claims: {', '.join(cycle)}"
+                )
+        return result
+    
+    @staticmethod
+    def cost_ops_evaluation(context: ProjectContext) -> Dict[str, Any]:
+        """Check that costs can be evaluated"""
+        result = {"passed": True, "issues": []}
         if not context.constraints.get("budget"):
-            tests["cost_ops_evaluation"]["issues"].append("No budget constraint specified")
-        
-        # Check security risks
+            result["issues"].append("No budget constraint specified")
+        return result
+    
+    @staticmethod
+    def security_risks(context: ProjectContext) -> Dict[str, Any]:
+        """Check that high-risk projects specify security requirements"""
+        result = {"passed": True, "issues": []}
         if context.risk_class in [RiskClass.R2, RiskClass.R3] and not context.security:
-            tests["security_risks"]["passed"] = False
-            tests["security_risks"]["issues"].append(
+            result["passed"] = False
+            result["issues"].append(
                 "High-risk project without security requirements specified"
             )
-        
-        return tests
+        return result
 
 
 class Selector:
@@ -313,36 +483,65 @@ class Selector:
     """
     
     @staticmethod
-    def select(context: ProjectContext) -> Dict[str, Any]:
+    def select(
+        context: ProjectContext,
+        weights: Optional[Mapping[str, float]] = None,
+        samples: int = DEFAULT_SENSITIVITY_SAMPLES
+    ) -> Dict[str, Any]:
         """
         Select the most robust option and a fallback.
         
+        Only Pareto-optimal options over the score dimensions are candidates
+        (an option dominated by another is never recommended); among them
+        the highest total_score is recommended and the next one is the
+        fallback, or the best dominated option if the frontier has a single
+        option.
+        
+        For R2 projects the stability of the recommendation under other
+        dimension weights is measured from samples weight vectors around
+        the given weights (see selection.weight_sensitivity).
+        
         Returns:
-            Dict with recommendation and fallback
+            Dict with recommendation, fallback, pareto_frontier (option IDs),
+            dominance (option ID -> IDs of the frontier options dominating
+            it) and sensitivity (None unless R2)
         """
-        if not context.options:
+        options = context.options
+        if not options:
             return {
                 "recommendation": None,
                 "fallback": None,
-                "rationale": "No options available"
+                "rationale": "No options available",
+                "pareto_frontier": [],
+                "dominance": {},
+                "sensitivity": None
             }
         
-        # Sort options by total score
-        sorted_options = sorted(
-            context.options, 
-            key=lambda x: x.get("total_score", 0), 
-            reverse=True
-        )
+        frontier, dominated_by = pareto_frontier(score_vectors(options))
+        ranked = top_options(options, frontier, 2)
+        if len(ranked) < 2:
+            ranked += top_options(options, list(dominated_by), 2 - len(ranked))
         
-        recommendation = sorted_options[0] if sorted_options else None
-        fallback = sorted_options[1] if len(sorted_options) > 1 else None
+        recommendation = options[ranked[0]]
+        fallback = options[ranked[1]] if len(ranked) > 1 else None
         
         context.recommendation = recommendation
         
+        sensitivity = None
+        if context.risk_class == RiskClass.R2 and samples > 0:
+            sensitivity = weight_sensitivity(options, ranked[0], weights, samples)
+        
+        ids = option_ids(options)
         return {
             "recommendation": recommendation,
             "fallback": fallback,
-            "rationale": "Selected option with highest robustness score"
+            "rationale": "Selected the Pareto-optimal option with the highest weighted score",
+            "pareto_frontier": [ids[index] for index in frontier],
+            "dominance": {
+                ids[index]: [ids[other] for other in dominators]
+                for index, dominators in dominated_by.items()
+            },
+            "sensitivity": sensitivity
         }
 
 
@@ -352,10 +551,18 @@ class Committer:
     """
     
     @staticmethod
-    def commit(context: ProjectContext, validation_results: Dict[str, Any]) -> Dict[str, Any]:
+    def commit(
+        context: ProjectContext,
+        validation_results: Dict[str, Any],
+        render_ledger: bool = True
+    ) -> Dict[str, Any]:
         """
         Produce final deliverable with termination code.
         
+        With render_ledger=False the claim ledger table is not built (the
+        "claim_ledger" entry is None) so callers can stream it from
+        context.claim_ledger instead.
+        
         Returns:
             Dict with deliverable and termination code
         """
@@ -378,7 +585,7 @@ class Committer:
             "assumptions": context.assumptions,
             "options": context.options,
             "recommendation": context.recommendation,
-            "claim_ledger": context.claim_ledger.to_markdown_table(),
+            "claim_ledger": context.claim_ledger.to_markdown_table() if render_ledger else None,
             "termination": term_code.value,
             "validation_summary": validation_results
         }
@@ -391,8 +598,19 @@ class Pipeline:
     Main pipeline orchestrator: COMPILER → EXPAND → BRANCH → LINT → STRESS → SELECT → COMMIT
     """
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        cache: Optional[ResultCache] = None,
+        instrument: bool = False,
+        trace_memory: bool = True
+    ):
         self.config = config or self._default_config()
+        self.cache = cache
+        self.instrument = instrument
+        self.trace_memory = trace_memory
+        # Telemetry of the last run when instrumented
+        self.telemetry: Optional[Telemetry] = None
         self.compiler = Compiler()
         self.expander = Expander()
         self.brancher = Brancher()
@@ -415,38 +633,244 @@ class Pipeline:
             "nest": True
         }
     
-    def execute(self, context: ProjectContext) -> Dict[str, Any]:
+    def execute(self, context: ProjectContext, render_ledger: bool = True) -> Dict[str, Any]:
         """
         Execute the full pipeline on a project context.
         
+        With render_ledger=False the claim ledger table is left out of the
+        deliverable (see Committer.commit).
+        
+        If the pipeline has a result cache, an unchanged submission (same
+        normalized inputs, claims and config) returns the stored deliverable
+        and only restores the context state from it.
+        
+        An instrumented pipeline adds the run's per-stage measurements to
+        validation_summary["telemetry"] (see Telemetry.to_dict); memory
+        tracing can be turned off with trace_memory=False.
+        
         Returns:
             Final deliverable with all sections
         """
-        # Stage 1: COMPILER
-        compile_result = self.compiler.compile(context, self.config)
-        
-        # Stage 2: EXPAND
-        expand_result = self.expander.expand(context)
+        self.telemetry = Telemetry(self.trace_memory) if self.instrument else None
+        
+        if self.cache is not None:
+            key = self._cache_key(context, render_ledger)
+            deliverable = self.cache.get(key)
+            if deliverable is not None:
+                self._restore_context(context, deliverable)
+                if self.telemetry is not None:
+                    self.telemetry.cache_hit = True
+                return self._attach_telemetry(deliverable)
+            deliverable = self._run(context, render_ledger)
+            self.cache.put(key, deliverable)
+            return self._attach_telemetry(deliverable)
+        
+        return self._attach_telemetry(self._run(context, render_ledger))
+    
+    def _cache_key(self, context: ProjectContext, render_ledger: bool) -> str:
+        """Result cache key of a context under this pipeline's config"""
+        return f"{context_fingerprint(context, self.config)}:{int(render_ledger)}"
+    
+    def _attach_telemetry(self, deliverable: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the run's telemetry to the deliverable validation summary"""
+        if self.telemetry is not None:
+            deliverable["validation_summary"]["telemetry"] = self.telemetry.to_dict()
+        return deliverable
+    
+    @staticmethod
+    def _restore_context(context: ProjectContext, deliverable: Dict[str, Any]) -> None:
+        """Set the context pipeline state from a cached deliverable"""
+        compile_result = deliverable["validation_summary"]["compile"]
+        context.risk_class = compile_result["risk_class"]
+        context.proof_budget = compile_result["proof_budget"]
+        context.facts = deliverable["facts"]
+        context.unknowns = deliverable["open_questions"]
+        context.assumptions = deliverable["assumptions"]
+        context.options = deliverable["options"]
+        context.recommendation = deliverable["recommendation"]
+    
+    def _run(self, context: ProjectContext, render_ledger: bool) -> Dict[str, Any]:
+        """Run all stages on a project context"""
+        context.stage_outputs = {}
+        for stage in STAGE_FIELDS:
+            context.stage_outputs[stage] = self._run_stage(stage, context, render_ledger)
         
-        # Stage 3: BRANCH
-        num_options = 3 if self.config["divergence"] == "mid" else 2
-        self.brancher.branch(context, num_options)
+        return context.stage_outputs["commit"]
+    
+    def _run_stage(self, stage: str, context: ProjectContext, render_ledger: bool) -> Any:
+        """Run a single stage, measured when the pipeline is instrumented"""
+        if self.telemetry is None:
+            return self._call_stage(stage, context, render_ledger)
+        with self.telemetry.measure(stage, context):
+            return self._call_stage(stage, context, render_ledger)
+    
+    def _call_stage(self, stage: str, context: ProjectContext, render_ledger: bool) -> Any:
+        """Call a single stage, reading earlier results from context.stage_outputs"""
+        if stage == "compile":
+            return self.compiler.compile(context, self.config)
+        if stage == "expand":
+            return self.expander.expand(context)
+        if stage == "branch":
+            num_options = 3 if self.config["divergence"] == "mid" else 2
+            return self.brancher.branch(context, num_options, self.config.get("score_weights"))
+        if stage == "lint":
+            return self.linter.lint(context)
+        if stage == "stress":
+            return self.stressor.stress(context)
+        if stage == "select":
+            return self.selector.select(
+                context,
+                self.config.get("score_weights"),
+                self.config.get("sensitivity_samples", DEFAULT_SENSITIVITY_SAMPLES)
+            )
         
-        # Stage 4: LINT
-        lint_result = self.linter.lint(context)
+        outputs = context.stage_outputs
+        validation_results = {
+            "compile": outputs["compile"],
+            "lint": outputs["lint"],
+            "stress": outputs["stress"],
+            "select": {
+                key: outputs["select"][key]
+                for key in ("pareto_frontier", "dominance", "sensitivity")
+            }
+        }
+        return self.committer.commit(context, validation_results, render_ledger)
+    
+    def reexecute(
+        self,
+        context: ProjectContext,
+        changed_fields: Iterable[str],
+        render_ledger: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Rerun only the stages affected by edits to a previously executed context.
         
-        # Stage 5: STRESS
-        stress_result = self.stressor.stress(context)
+        A stage reruns when it reads one of the changed fields (see
+        STAGE_FIELDS); the fields it writes are then marked changed only if
+        their values actually differ, so an edit that leaves e.g. the risk
+        class unchanged stops there. Other stages reuse their stored output.
+        Edits to claims are reported as ``claim_ledger``.
         
-        # Stage 6: SELECT
-        select_result = self.selector.select(context)
+        Returns:
+            Final deliverable, identical to a full execute of the edited context
+        """
+        changed = set(changed_fields)
+        known = set(ProjectContext.INPUT_FIELDS) | {"claim_ledger"}
+        unknown = changed - known
+        if unknown:
+            raise ValueError(f"Unknown context field(s): {', '.join(sorted(unknown))}")
+        
+        self.telemetry = Telemetry(self.trace_memory) if self.instrument else None
+        outputs = context.stage_outputs
+        if not all(stage in outputs for stage in STAGE_FIELDS):
+            return self._attach_telemetry(self._run(context, render_ledger))
+        
+        for stage, fields in STAGE_FIELDS.items():
+            if stage != "commit" and changed.isdisjoint(fields["reads"]):
+                continue
+            before = [getattr(context, name) for name in fields["writes"]]
+            outputs[stage] = self._run_stage(stage, context, render_ledger)
+            for name, value in zip(fields["writes"], before):
+                if getattr(context, name) != value:
+                    changed.add(name)
+        
+        return self._attach_telemetry(outputs["commit"])
+    
+    def execute_many(
+        self,
+        items: Iterable[Any],
+        max_workers: Optional[int] = None,
+        loader: Optional[Callable[[Any], ProjectContext]] = None,
+        on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+        on_error: Optional[Callable[[int, BaseException], None]] = None
+    ) -> Dict[str, int]:
+        """
+        Execute the pipeline over many project contexts.
         
-        # Stage 7: COMMIT
-        validation_results = {
-            "compile": compile_result,
-            "lint": lint_result,
-            "stress": stress_result
-        }
-        deliverable = self.committer.commit(context, validation_results)
+        Items are ProjectContext instances, or arbitrary inputs (e.g. file
+        paths) turned into contexts by ``loader`` inside the worker. Work is
+        spread over a process pool sized to the available cores; each worker
+        builds its Pipeline once. ``on_result`` is called in the parent as
+        soon as each deliverable is ready, in completion order.
         
-        return deliverable
+        Returns:
+            Termination code counts, plus "ERROR" for failed items
+        """
+        counts = {code.value: 0 for code in TerminationCode}
+        counts["ERROR"] = 0
+        
+        def record(index: int, deliverable: Optional[Dict[str, Any]],
+                   error: Optional[BaseException]) -> None:
+            if error is not None:
+                counts["ERROR"] += 1
+                if on_error:
+                    on_error(index, error)
+                return
+            term = deliverable.get("termination", "UNKNOWN")
+            counts[term] = counts.get(term, 0) + 1
+            if on_result:
+                on_result(index, deliverable)
+        
+        workers = max_workers or os.cpu_count() or 1
+        if workers == 1:
+            for index, item in enumerate(items):
+                try:
+                    context = loader(item) if loader else item
+                    deliverable = self.execute(context)
+                except Exception as e:
+                    record(index, None, e)
+                else:
+                    record(index, deliverable, None)
+            return counts
+        
+        # Keep a bounded number of items in flight so that large (lazy)
+        # inputs are never materialized all at once.
+        max_pending = workers * 4
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_batch_worker,
+            initargs=(self.config, self.cache, self.instrument, self.trace_memory)
+        ) as executor:
+            pending = {}
+            
+            def drain(return_when) -> None:
+                done, _ = wait(pending, return_when=return_when)
+                for future in done:
+                    index = pending.pop(future)
+                    error = future.exception()
+                    record(index, None if error else future.result(), error)
+            
+            for index, item in enumerate(items):
+                future = executor.submit(_execute_batch_item, item, loader)
+                pending[future] = index
+                if len(pending) >= max_pending:
+                    drain(FIRST_COMPLETED)
+            
+            while pending:
+                drain(FIRST_COMPLETED)
+        
+        return counts
+
+
+# Per-process pipeline used by Pipeline.execute_many workers
+_batch_pipeline: Optional[Pipeline] = None
+
+
+def _init_batch_worker(
+    config: Dict[str, Any],
+    cache: Optional[ResultCache],
+    instrument: bool,
+    trace_memory: bool
+) -> None:
+    """Build the worker's Pipeline once per process"""
+    global _batch_pipeline
+    _batch_pipeline = Pipeline(config, cache, instrument, trace_memory)
+
+
+def _execute_batch_item(
+    item: Any,
+    loader: Optional[Callable[[Any], ProjectContext]]
+) -> Dict[str, Any]:
+    """Load (if needed) and execute a single batch item in a worker"""
+    context = loader(item) if loader else item
+    return _batch_pipeline.execute(context)
@@ -0,0 +1,139 @@
+"""
+ARCHI-Ω v1.2 - Pipeline Telemetry
+
+Optional per-stage instrumentation of a pipeline run:
+- Wall-clock and CPU time of each stage call
+- Peak memory allocated during the stage (tracemalloc)
+- Item counts (facts, unknowns, options, claims, ...) after the stage
+- Structured dict, JSON and Prometheus text exposition
+"""
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, Iterator, List
+
+
+# Context collections counted after each stage
+COUNTED_FIELDS = ("facts", "unknowns", "assumptions", "options")
+
+
+@dataclass
+class StageMetrics:
+    """Measurements of one stage over a run"""
+    stage: str
+    calls: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_bytes: int = 0
+    counts: Dict[str, int] = field(default_factory=dict)
+
+
+def count_items(context: Any) -> Dict[str, int]:
+    """Count the items of the context collections and its claim ledger"""
+    counts = {name: len(getattr(context, name)) for name in COUNTED_FIELDS}
+    counts["claims"] = len(context.claim_ledger.claims)
+    return counts
+
+
+class Telemetry:
+    """
+    Collects StageMetrics for the stages of a pipeline run.
+    
+    Memory tracing slows stages down noticeably; pass trace_memory=False to
+    record times and counts only.
+    """
+    
+    def __init__(self, trace_memory: bool = True):
+        self.trace_memory = trace_memory
+        self.stages: Dict[str, StageMetrics] = {}
+        self.cache_hit = False
+    
+    @contextmanager
+    def measure(self, stage: str, context: Any) -> Iterator[StageMetrics]:
+        """Measure the stage call run inside the with block"""
+        metrics = self.stages.get(stage)
+        if metrics is None:
+            metrics = self.stages[stage] = StageMetrics(stage)
+        
+        started_tracing = False
+        if self.trace_memory:
+            if tracemalloc.is_tracing():
+                # Somebody else traces: measure above the current level
+                if hasattr(tracemalloc, "reset_peak"):
+                    tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                started_tracing = True
+            base = tracemalloc.get_traced_memory()[0]
+        
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield metrics
+        finally:
+            metrics.wall_seconds += time.perf_counter() - wall
+            metrics.cpu_seconds += time.process_time() - cpu
+            metrics.calls += 1
+            if self.trace_memory:
+                peak = tracemalloc.get_traced_memory()[1] - base
+                metrics.peak_bytes = max(metrics.peak_bytes, peak)
+                if started_tracing:
+                    tracemalloc.stop()
+            metrics.counts = count_items(context)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Structured telemetry, as stored in validation_results["telemetry"].
+        
+        Returns:
+            Dict with per-stage metrics (in execution order) and totals
+        """
+        stages = [asdict(metrics) for metrics in self.stages.values()]
+        return {
+            "cache_hit": self.cache_hit,
+            "stages": stages,
+            "total": {
+                "wall_seconds": sum(metrics["wall_seconds"] for metrics in stages),
+                "cpu_seconds": sum(metrics["cpu_seconds"] for metrics in stages),
+                "peak_bytes": max((metrics["peak_bytes"] for metrics in stages), default=0)
+            }
+        }
+    
+    def to_json(self) -> str:
+        """Telemetry as a JSON document"""
+        return json.dumps(self.to_dict(), indent=2)
+    
+    def to_prometheus(self, prefix: str = "archi_omega") -> str:
+        """
+        Telemetry in the Prometheus text exposition format.
+        
+        Each metric is labelled with its stage; item counts additionally
+        carry an ``item`` label.
+        """
+        lines: List[str] = []
+        
+        def family(name: str, kind: str, help_text: str, samples: List[str]) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            lines.extend(f"{prefix}_{name}{sample}" for sample in samples)
+        
+        stages = list(self.stages.values())
+        family("stage_calls_total", "counter", "Number of stage calls",
+               [f'{{stage="{m.stage}"}} {m.calls}' for m in stages])
+        family("stage_wall_seconds", "gauge", "Wall-clock time spent in the stage",
+               [f'{{stage="{m.stage}"}} {m.wall_seconds:.6f}' for m in stages])
+        family("stage_cpu_seconds", "gauge", "CPU time spent in the stage",
+               [f'{{stage="{m.stage}"}} {m.cpu_seconds:.6f}' for m in stages])
+        if self.trace_memory:
+            family("stage_peak_bytes", "gauge", "Peak memory allocated during the stage",
+                   [f'{{stage="{m.stage}"}} {m.peak_bytes}' for m in stages])
+        family("stage_items", "gauge", "Context item counts after the stage",
+               [f'{{stage="{m.stage}",item="{item}"}} {count}'
+                for m in stages for item, count in m.counts.items()])
+        family("cache_hit", "gauge", "Whether the deliverable came from the result cache",
+               [f" {int(self.cache_hit)}"])
+        
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,329 @@
+"""
+ARCHI-Ω v1.2 - Pipeline Service
+
+Long-running HTTP service, on a TCP port or a Unix socket:
+- Configuration loaded once, pool of warm Pipeline worker processes
+- POST /execute with a YAML, JSON or MessagePack input, deliverable returned in any of
+  the CLI formats (?format=markdown|yaml|json)
+- GET /health with worker and load information
+- Concurrency limit with backpressure: 503 + Retry-After when full
+"""
+
+import argparse
+import json
+import os
+import socketserver
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from .cli import OUTPUT_EXTENSIONS, load_config, render_deliverable
+from .ingest import InputValidationError, context_from_input, decode_input, validate_input
+from .pipeline.cache import ResultCache
+from .pipeline.stages import Pipeline, _execute_batch_item, _init_batch_worker
+
+
+CONTENT_TYPES = {
+    'markdown': 'text/markdown; charset=utf-8',
+    'yaml': 'application/yaml; charset=utf-8',
+    'json': 'application/json; charset=utf-8'
+}
+
+# Largest accepted request body
+MAX_BODY_BYTES = 10 * 1024 * 1024
+
+
+def _ping() -> int:
+    """No-op task used to start the worker processes"""
+    return os.getpid()
+
+
+class PipelineService:
+    """
+    Executes pipeline requests on warm workers with bounded concurrency.
+    
+    With workers=0 the pipeline runs in the request threads (no process
+    pool); otherwise each worker process builds its Pipeline once at start.
+    At most max_pending requests are accepted at a time (running or queued
+    for a worker); further requests are refused until a slot frees up.
+    """
+    
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        cache: Optional[ResultCache] = None
+    ):
+        self.pipeline = Pipeline(config, cache)
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.max_pending = max_pending or max(self.workers, 1) * 4
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.served = 0
+        self.rejected = 0
+        
+        self.executor: Optional[ProcessPoolExecutor] = None
+        if self.workers:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_batch_worker,
+                initargs=(self.pipeline.config, cache, False, True)
+            )
+            # Start every worker now rather than on the first requests
+            for future in [self.executor.submit(_ping) for _ in range(self.workers)]:
+                future.result()
+    
+    def try_acquire(self) -> bool:
+        """Take a request slot; False if the service is at capacity"""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            return False
+        with self._lock:
+            self.in_flight += 1
+        return True
+    
+    def release(self) -> None:
+        """Give back a request slot"""
+        with self._lock:
+            self.in_flight -= 1
+            self.served += 1
+        self._slots.release()
+    
+    def execute(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute the pipeline on parsed input sections.
+        
+        Returns:
+            Final deliverable
+        """
+        if self.executor is None:
+            return self.pipeline.execute(context_from_input(data))
+        return self.executor.submit(_execute_batch_item, data, context_from_input).result()
+    
+    def health(self) -> Dict[str, Any]:
+        """Service status for GET /health"""
+        with self._lock:
+            return {
+                "status": "ok",
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "in_flight": self.in_flight,
+                "served": self.served,
+                "rejected": self.rejected
+            }
+    
+    def close(self) -> None:
+        """Stop the worker processes"""
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+
+def parse_input(body: bytes, content_type: str) -> Dict[str, Any]:
+    """
+    Parse a request body as JSON, MessagePack or YAML (by content type).
+    
+    Raises:
+        InputValidationError: If the body is malformed or not a valid input
+    """
+    if 'json' in content_type:
+        input_format = 'json'
+    elif 'msgpack' in content_type:
+        input_format = 'msgpack'
+    else:
+        input_format = 'yaml'
+    data = decode_input(body, input_format)
+    errors = validate_input(data)
+    if errors:
+        raise InputValidationError(errors)
+    return data
+
+
+class PipelineRequestHandler(BaseHTTPRequestHandler):
+    """HTTP front-end of a PipelineService (set as the server's service)"""
+    
+    server_version = "ARCHI-Omega/1.2"
+    protocol_version = "HTTP/1.1"
+    
+    def do_GET(self):
+        if urlparse(self.path).path != '/health':
+            self._send_error(404, "Not found")
+            return
+        self._send(200, json.dumps(self.server.service.health()), CONTENT_TYPES['json'])
+    
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != '/execute':
+            self._send_error(404, "Not found")
+            return
+        
+        output_format = parse_qs(url.query).get('format', ['markdown'])[0]
+        if output_format not in OUTPUT_EXTENSIONS:
+            self._send_error(400, f"Unknown format '{output_format}'")
+            return
+        
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            # Where the body ends is unknown, so the connection cannot be reused
+            self.close_connection = True
+            self._send_error(400, "Invalid Content-Length")
+            return
+        if length > MAX_BODY_BYTES:
+            # The body is left unread, so the connection cannot be reused
+            self.close_connection = True
+            self._send_error(413, f"Input larger than {MAX_BODY_BYTES} bytes")
+            return
+        body = self.rfile.read(length)
+        
+        service = self.server.service
+        if not service.try_acquire():
+            self._send_error(503, "Service at capacity, retry later", {"Retry-After": "1"})
+            return
+        # The slot is released before any reply is written, so a client
+        # never sees its response while still holding it
+        error: Optional[Tuple[int, str]] = None
+        try:
+            try:
+                data = parse_input(body, self.headers.get('Content-Type', ''))
+            except (InputValidationError, ImportError) as e:
+                error = (400, f"Invalid input: {e}")
+            else:
+                try:
+                    deliverable = service.execute(data)
+                except Exception as e:
+                    error = (500, f"Error executing pipeline: {e}")
+        finally:
+            service.release()
+        
+        if error is not None:
+            self._send_error(*error)
+            return
+        self._send(200, render_deliverable(deliverable, output_format), CONTENT_TYPES[output_format])
+    
+    def _send(
+        self,
+        status: int,
+        text: str,
+        content_type: str,
+        headers: Optional[Dict[str, str]] = None
+    ) -> None:
+        payload = text.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+    
+    def _send_error(self, status: int, message: str, headers: Optional[Dict[str, str]] = None) -> None:
+        self._send(status, json.dumps({"error": message}), CONTENT_TYPES['json'], headers)
+    
+    def address_string(self) -> str:
+        # Unix socket peers have no address
+        if isinstance(self.client_address, tuple):
+            return super().address_string()
+        return "unix"
+    
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """HTTP server on a Unix socket, one thread per connection"""
+    
+    daemon_threads = True
+
+
+def make_server(
+    service: PipelineService,
+    address: Tuple[str, int] = ('127.0.0.1', 8765),
+    unix_socket: Optional[Path] = None,
+    quiet: bool = False
+) -> socketserver.BaseServer:
+    """
+    Bind an HTTP server for a service, on a TCP address or a Unix socket.
+    
+    Returns:
+        Server ready for serve_forever()
+    """
+    if unix_socket is not None:
+        if unix_socket.exists():
+            unix_socket.unlink()
+        server = ThreadingUnixHTTPServer(str(unix_socket), PipelineRequestHandler)
+    else:
+        server = ThreadingHTTPServer(address, PipelineRequestHandler)
+    server.service = service
+    server.quiet = quiet
+    return server
+
+
+def main(argv=None):
+    """Entry point of ``archi-omega serve``"""
+    parser = argparse.ArgumentParser(
+        prog='archi-omega serve',
+        description="ARCHI-Ω v1.2 - Pipeline service"
+    )
+    parser.add_argument('--host', default='127.0.0.1', help='Address to bind (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='Port to bind (default: 8765)')
+    parser.add_argument('--unix', type=Path, help='Serve on this Unix socket instead of TCP')
+    parser.add_argument(
+        '-c', '--config',
+        type=Path,
+        default=Path('archi-omega-config.yaml'),
+        help='Configuration file (default: archi-omega-config.yaml)'
+    )
+    parser.add_argument(
+        '-j', '--workers',
+        type=int,
+        default=None,
+        help='Worker processes; 0 runs in the request threads (default: number of cores)'
+    )
+    parser.add_argument(
+        '--max-pending',
+        type=int,
+        default=None,
+        help='Requests accepted at once before answering 503 (default: 4 per worker)'
+    )
+    parser.add_argument('--cache', type=Path, help='SQLite file caching deliverables of unchanged inputs')
+    parser.add_argument('--quiet', action='store_true', help='Do not log requests')
+    args = parser.parse_args(argv)
+    
+    config = None
+    if args.config.exists():
+        try:
+            config = load_config(args.config)
+        except Exception as e:
+            print(f"Warning: Could not load config: {e}", file=sys.stderr)
+            print("Using default configuration", file=sys.stderr)
+    cache = ResultCache(path=args.cache) if args.cache else None
+    service = PipelineService(config, args.workers, args.max_pending, cache)
+    server = make_server(service, (args.host, args.port), args.unix, args.quiet)
+    
+    where = args.unix or f"http://{args.host}:{args.port}"
+    print(f"ARCHI-Ω pipeline service on {where} ({service.workers} workers)", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        if args.unix is not None and args.unix.exists():
+            args.unix.unlink()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
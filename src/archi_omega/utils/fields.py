@@ -0,0 +1,31 @@
+"""
+ARCHI-Ω v1.2 - Field Walker
+
+Lazily walks nested input structures (dicts, lists, strings) and yields
+``(field_path, text)`` pairs, so checks can scan text field by field without
+serializing the whole structure.
+"""
+
+from typing import Any, Iterator, Tuple
+
+
+def iter_text(value: Any, path: str = "") -> Iterator[Tuple[str, str]]:
+    """
+    Yield every string nested in a value with its field path.
+    
+    Dict keys are yielded under the path of their entry, before the entry's
+    value. Paths use ``.`` for dict keys and ``[i]`` for list items, e.g.
+    ``constraints.budget`` or ``integrations[0]``. Non-string scalars
+    (numbers, booleans, enums, None) are skipped.
+    """
+    if isinstance(value, str):
+        yield path, value
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            item_path = f"{path}.{key}" if path else str(key)
+            if isinstance(key, str):
+                yield item_path, key
+            yield from iter_text(item, item_path)
+    elif isinstance(value, (list, tuple)):
+        for index, item in enumerate(value):
+            yield from iter_text(item, f"{path}[{index}]")
@@ -0,0 +1,86 @@
+"""
+ARCHI-Ω v1.2 - Keyword Scanner
+
+Single-pass keyword matching shared by the pipeline stages and claims:
+every keyword class (overpromise, recency, causality, ...) is compiled into
+one regex, so a text is lowercased and scanned once whatever the number of
+keywords. Results are cached per text.
+"""
+
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, List, Mapping
+
+
+# Keyword classes, in reporting order
+KEYWORD_CLASSES: Dict[str, List[str]] = {
+    "overpromise": ["guarantee", "garanti", "assured", "assuré", "100%"],
+    "recency": ["latest", "current", "newest", "dernier", "actuel"],
+    "tool_recency": ["latest", "current", "price", "cost", "law", "regulation"],
+    "causality": ["will cause", "causes", "results in", "leads to", "guarantees"],
+    "financial": ["cost"],
+    "legal": ["gdpr", "hipaa", "pci", "legal"],
+    "security": ["security"],
+    "health": ["health", "medical"],
+    "pii": ["pii", "personal"],
+}
+
+
+class KeywordScanner:
+    """
+    Finds all keyword classes in a text in a single pass.
+    
+    Matching is case-insensitive substring matching, like ``keyword in
+    text.lower()``: overlapping keywords (e.g. "guarantee" inside
+    "guarantees") are all reported.
+    """
+    
+    def __init__(self, keyword_classes: Mapping[str, Iterable[str]], cache_size: int = 4096):
+        self.keyword_classes = {name: list(keywords) for name, keywords in keyword_classes.items()}
+        
+        self._classes_by_keyword: Dict[str, List[str]] = {}
+        for name, keywords in self.keyword_classes.items():
+            for keyword in keywords:
+                self._classes_by_keyword.setdefault(keyword.lower(), []).append(name)
+        
+        keywords = sorted(self._classes_by_keyword, key=len, reverse=True)
+        # Keywords found at the same position as a longer match (its prefixes)
+        self._implied = {
+            keyword: [other for other in keywords if keyword.startswith(other)]
+            for keyword in keywords
+        }
+        # Zero-width lookahead so that a match is attempted at every position
+        self._pattern = re.compile(
+            "(?=(" + "|".join(re.escape(keyword) for keyword in keywords) + "))"
+        )
+        self.scan = lru_cache(maxsize=cache_size)(self._scan)
+    
+    def _scan(self, text: str) -> Mapping[str, FrozenSet[str]]:
+        """Scan a text and return the keywords found, by keyword class"""
+        found: Dict[str, set] = {}
+        seen = set()
+        for match in self._pattern.finditer(text.lower()):
+            keyword = match.group(1)
+            if keyword in seen:
+                continue
+            for implied in self._implied[keyword]:
+                if implied not in seen:
+                    seen.add(implied)
+                    for name in self._classes_by_keyword[implied]:
+                        found.setdefault(name, set()).add(implied)
+        return MappingProxyType({name: frozenset(hits) for name, hits in found.items()})
+    
+    def find(self, text: str, keyword_class: str) -> List[str]:
+        """Keywords of a class found in a text, in declaration order"""
+        hits = self.scan(text).get(keyword_class)
+        if not hits:
+            return []
+        return [keyword for keyword in self.keyword_classes[keyword_class] if keyword in hits]
+    
+    def contains(self, text: str, keyword_class: str) -> bool:
+        """Check whether a text contains any keyword of a class"""
+        return keyword_class in self.scan(text)
+
+
+DEFAULT_SCANNER = KeywordScanner(KEYWORD_CLASSES)
@@ -0,0 +1,338 @@
+"""
+ARCHI-Ω v1.2 - Watch Mode
+
+Long-lived ``archi-omega watch <dir>`` loop for edit-save-check cycles:
+- Polls the directory for changed intake files (YAML, JSON, MessagePack)
+  and documents (Markdown, YAML, Python), with a debounce period
+- Reparses only the changed files; an intake file reruns only the pipeline
+  stages reading its changed sections (Pipeline.reexecute)
+- Overpromise lint of the changed documents (archi_omega.doclint)
+- Prints a compact delta: termination codes, LINT issues and warnings,
+  document findings added or fixed
+"""
+
+import argparse
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+
+from .cli import load_config
+from .doclint import DEFAULT_EXCLUDES, LINT_SUFFIXES, SKIPPED_DIRS, Finding, _excluded, lint_text
+from .ingest import (
+    INPUT_FORMATS, INPUT_SCHEMA, InputValidationError, context_from_input, decode_input
+)
+from .pipeline.stages import Pipeline, ProjectContext, STAGE_FIELDS
+
+
+# Default seconds between two scans of the tree
+DEFAULT_INTERVAL = 0.05
+
+# Default seconds without further change before a batch of changes is processed
+DEFAULT_DEBOUNCE = 0.02
+
+WATCHED_SUFFIXES = tuple(sorted(set(LINT_SUFFIXES) | set(INPUT_FORMATS)))
+
+# Relative path -> (mtime in nanoseconds, size)
+Snapshot = Dict[str, Tuple[int, int]]
+
+
+@dataclass
+class WatchedInput:
+    """Parsed sections, context and LINT results of an intake file"""
+    data: Dict[str, Any] = field(default_factory=dict)
+    context: Optional[ProjectContext] = None
+    termination: Optional[str] = None
+    lint: Tuple[str, ...] = ()
+    error: Optional[str] = None
+
+
+def _lint_messages(deliverable: Dict[str, Any]) -> Tuple[str, ...]:
+    """LINT stage issues and warnings of a deliverable"""
+    result = deliverable["validation_summary"].get("lint") or {}
+    return tuple(result.get("issues", [])) + tuple(
+        f"warning: {warning}" for warning in result.get("warnings", [])
+    )
+
+
+class Watcher:
+    """
+    Keeps the pipeline results and document findings of a directory current.
+    
+    Intake files are the INPUT_FORMATS files of the tree, documents the
+    LINT_SUFFIXES files; both skip the excludes (by default the rules
+    documentation and configuration, see doclint.DEFAULT_EXCLUDES). A
+    YAML intake file is also a document.
+    """
+    
+    def __init__(
+        self,
+        root: Path,
+        pipeline: Optional[Pipeline] = None,
+        excludes: Tuple[str, ...] = DEFAULT_EXCLUDES,
+        stream: TextIO = sys.stdout
+    ):
+        self.root = Path(root)
+        self.pipeline = pipeline or Pipeline()
+        self.excludes = tuple(excludes)
+        self.stream = stream
+        self.snapshot: Snapshot = {}
+        self.inputs: Dict[str, WatchedInput] = {}
+        self.findings: Dict[str, List[Finding]] = {}
+    
+    def scan(self) -> Snapshot:
+        """Modification time and size of every watched file"""
+        snapshot = {}
+        for directory, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [
+                name for name in dirnames
+                if name not in SKIPPED_DIRS and not name.endswith(".egg-info")
+            ]
+            relative = Path(directory).relative_to(self.root)
+            for name in filenames:
+                if not name.endswith(WATCHED_SUFFIXES):
+                    continue
+                path = (relative / name).as_posix()
+                if _excluded(path, self.excludes):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(directory, name))
+                except OSError:  # removed since listed
+                    continue
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+    
+    def poll(self) -> List[str]:
+        """Paths added, modified or removed since the previous poll, sorted"""
+        snapshot = self.scan()
+        changed = {
+            path for path in snapshot.keys() | self.snapshot.keys()
+            if snapshot.get(path) != self.snapshot.get(path)
+        }
+        self.snapshot = snapshot
+        return sorted(changed)
+    
+    def process(self, paths: List[str]) -> List[str]:
+        """
+        Bring the results of changed files up to date.
+        
+        Returns:
+            Delta lines, empty if nothing visible changed
+        """
+        lines = []
+        for path in paths:
+            start = time.perf_counter()
+            payload = self._read(path)
+            delta = []
+            if path.endswith(LINT_SUFFIXES):
+                delta += self._update_document(path, payload)
+            if os.path.splitext(path)[1].lower() in INPUT_FORMATS:
+                delta += self._update_input(path, payload)
+            if delta:
+                elapsed = (time.perf_counter() - start) * 1000
+                lines.append(f"{path} ({elapsed:.1f} ms)")
+                lines.extend(f"  {line}" for line in delta)
+        return lines
+    
+    def _read(self, path: str) -> Optional[bytes]:
+        try:
+            return (self.root / path).read_bytes()
+        except OSError:  # removed
+            return None
+    
+    def _update_document(self, path: str, payload: Optional[bytes]) -> List[str]:
+        """Re-lint a document and report the findings added and fixed"""
+        before = self.findings.pop(path, [])
+        after = []
+        if payload is not None:
+            after = lint_text(payload.decode("utf-8", errors="replace"), path)
+        if after:
+            self.findings[path] = after
+        
+        def key(finding: Finding) -> Tuple[str, str, str]:
+            # Findings moved by edits elsewhere in the file are not news
+            return finding.rule_id, finding.keyword, finding.text
+        
+        old = {key(finding) for finding in before}
+        new = {key(finding) for finding in after}
+        return [
+            f"+ {finding.line}:{finding.column} {finding.rule_id} "
+            f"'{finding.keyword}': {finding.text}"
+            for finding in after if key(finding) not in old
+        ] + [
+            f"- {finding.rule_id} '{finding.keyword}': {finding.text}"
+            for finding in before if key(finding) not in new
+        ]
+    
+    def _update_input(self, path: str, payload: Optional[bytes]) -> List[str]:
+        """Rerun the stages affected by the changed sections of an intake file"""
+        if payload is None:
+            state = self.inputs.pop(path, None)
+            return ["removed"] if state is not None else []
+        
+        state = self.inputs.setdefault(path, WatchedInput())
+        input_format = INPUT_FORMATS[os.path.splitext(path)[1].lower()]
+        try:
+            data = decode_input(payload, input_format) or {}
+            new_context = context_from_input(data, path)
+        except (InputValidationError, ImportError) as e:
+            message = str(e)
+            reported = state.error == message
+            state.error = message
+            return [] if reported else [f"! {message}"]
+        
+        delta = []
+        if state.error is not None:
+            state.error = None
+            delta.append("input valid again")
+        
+        # Context fields of the sections that differ from the last parse
+        changed = {
+            INPUT_SCHEMA[section][0]
+            for section in data.keys() | state.data.keys()
+            if data.get(section) != state.data.get(section)
+        }
+        state.data = data
+        if state.context is None:
+            state.context = new_context
+            deliverable = self.pipeline.execute(state.context, render_ledger=False)
+            rerun = list(STAGE_FIELDS)
+        elif changed:
+            for name in changed:
+                setattr(state.context, name, getattr(new_context, name))
+            previous = dict(state.context.stage_outputs)
+            deliverable = self.pipeline.reexecute(state.context, changed, render_ledger=False)
+            rerun = [
+                stage for stage in STAGE_FIELDS
+                if state.context.stage_outputs.get(stage) is not previous.get(stage)
+            ]
+        else:
+            return delta
+        
+        # A cache hit returns the deliverable without filling stage_outputs
+        termination = deliverable["termination"]
+        if termination != state.termination:
+            delta.append(f"{state.termination or 'new'} -> {termination}")
+        state.termination = termination
+        
+        lint = _lint_messages(deliverable)
+        delta += [f"+ {message}" for message in lint if message not in state.lint]
+        delta += [f"- {message}" for message in state.lint if message not in lint]
+        state.lint = lint
+        
+        if delta:
+            delta.append(f"reran {', '.join(rerun)}")
+        return delta
+    
+    def summary(self) -> str:
+        """One-line status of the whole directory"""
+        terminations: Dict[str, int] = {}
+        errors = 0
+        for state in self.inputs.values():
+            if state.error is not None:
+                errors += 1
+            elif state.termination is not None:
+                terminations[state.termination] = terminations.get(state.termination, 0) + 1
+        parts = [f"{count} {code}" for code, count in sorted(terminations.items())]
+        if errors:
+            parts.append(f"{errors} invalid")
+        findings = sum(map(len, self.findings.values()))
+        parts.append(f"{findings} overpromise finding{'s' if findings != 1 else ''}")
+        return f"{len(self.inputs)} inputs: " + ", ".join(parts)
+    
+    def check(self) -> List[str]:
+        """Process every file changed since the last check"""
+        return self.process(self.poll())
+    
+    def run(
+        self,
+        interval: float = DEFAULT_INTERVAL,
+        debounce: float = DEFAULT_DEBOUNCE
+    ) -> None:
+        """
+        Watch until interrupted: process the first scan, then every batch
+        of changes once no file has changed for ``debounce`` seconds.
+        """
+        self._report(self.check())
+        while True:
+            time.sleep(interval)
+            changed = set(self.poll())
+            if not changed:
+                continue
+            # An editor may write a file in several steps; wait for quiet
+            while True:
+                time.sleep(debounce)
+                more = self.poll()
+                if not more:
+                    break
+                changed.update(more)
+            self._report(self.process(sorted(changed)))
+    
+    def _report(self, lines: List[str]) -> None:
+        stamp = time.strftime("%H:%M:%S")
+        for line in lines:
+            print(f"[{stamp}] {line}" if not line.startswith("  ") else line, file=self.stream)
+        print(f"[{stamp}] {self.summary()}", file=self.stream, flush=True)
+
+
+def main(argv=None):
+    """Entry point of ``archi-omega watch``"""
+    parser = argparse.ArgumentParser(
+        prog='archi-omega watch',
+        description="ARCHI-Ω v1.2 - Re-run the pipeline and lint on file changes"
+    )
+    parser.add_argument('directory', type=Path, help='Directory of intake files and documents')
+    parser.add_argument(
+        '-c', '--config',
+        type=Path,
+        default=Path('archi-omega-config.yaml'),
+        help='Configuration file (default: archi-omega-config.yaml)'
+    )
+    parser.add_argument(
+        '--interval',
+        type=float,
+        default=DEFAULT_INTERVAL,
+        help=f'Seconds between scans (default: {DEFAULT_INTERVAL})'
+    )
+    parser.add_argument(
+        '--debounce',
+        type=float,
+        default=DEFAULT_DEBOUNCE,
+        help=f'Quiet seconds before processing changes (default: {DEFAULT_DEBOUNCE})'
+    )
+    parser.add_argument(
+        '--once',
+        action='store_true',
+        help='Check once and exit: 1 if an input is invalid or a finding is left'
+    )
+    args = parser.parse_args(argv)
+    
+    if not args.directory.is_dir():
+        print(f"Error: '{args.directory}' is not a directory", file=sys.stderr)
+        return 1
+    
+    config = None
+    if args.config.exists():
+        try:
+            config = load_config(args.config)
+        except Exception as e:
+            print(f"Warning: Could not load config: {e}", file=sys.stderr)
+            print("Using default configuration", file=sys.stderr)
+    watcher = Watcher(args.directory, Pipeline(config))
+    if args.once:
+        watcher._report(watcher.check())
+        invalid = any(state.error is not None for state in watcher.inputs.values())
+        return 1 if invalid or watcher.findings else 0
+    
+    print(f"Watching {args.directory} (Ctrl-C to stop)", file=sys.stderr)
+    try:
+        watcher.run(args.interval, args.debounce)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,7 +2,16 @@
 Tests for ARCHI-Ω v1.2 epistemic foundation
 """
 
+import csv
+import dataclasses
+import io
+import json
+import pickle
+import subprocess
 import sys
+import tempfile
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add src to path
@@ -10,8 +19,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from archi_omega.epistemic.foundation import (
     ProofLevel, RiskClass, TestabilityLevel, OriginTag,
-    Claim, ClaimLedger, RiskClassifier, ProofValidator, ProofBudget
+    Claim, ClaimLedger, RiskClassifier, ProofValidator, ProofBudget,
+    PROOF_BUDGETS, PROOF_RANK, TESTABILITY_RANK, budgets_from_config, ClaimCheck, ISSUE_CHECKS
 )
+from archi_omega.epistemic import columnar as columnar_module
+from archi_omega.epistemic.columnar import ColumnarClaimLedger, ClaimView
+from archi_omega.epistemic.store import PersistentClaimLedger
+from archi_omega.epistemic.sharded import ShardedClaimLedger, shard_of
+from archi_omega.utils.keywords import KeywordScanner, KEYWORD_CLASSES
 
 
 def test_proof_levels():
@@ -58,6 +73,61 @@ def test_proof_budget():
     print("✓ Proof budget test passed")
 
 
+def test_proof_budget_registry():
+    """Test the shared budget registry, rank tables and config budgets"""
+    assert ProofBudget.for_risk_class(RiskClass.R2) is PROOF_BUDGETS[RiskClass.R2]
+    assert PROOF_BUDGETS[RiskClass.R3].required_levels == ()
+    try:
+        PROOF_BUDGETS[RiskClass.R0].minimum_pillars = 5
+        assert False, "Budgets should be immutable"
+    except dataclasses.FrozenInstanceError:
+        pass
+    
+    assert PROOF_RANK[ProofLevel.S0] < PROOF_RANK[ProofLevel.S2] < PROOF_RANK[ProofLevel.S4]
+    assert TESTABILITY_RANK[TestabilityLevel.T1] < TESTABILITY_RANK[TestabilityLevel.T3]
+    
+    # The shipped config describes the default budgets
+    import yaml
+    config_path = Path(__file__).parent.parent / "archi-omega-config.yaml"
+    with open(config_path) as f:
+        risk_classes = yaml.safe_load(f)["risk_classes"]
+    assert budgets_from_config(risk_classes) == dict(PROOF_BUDGETS)
+    
+    # A stricter R1 budget: warn below S2
+    budgets = budgets_from_config({"R1": {"proof_budget": ["S2", "alternatives"], "minimum_level": "S2"}})
+    strict = budgets[RiskClass.R1]
+    assert strict.required_levels == (ProofLevel.S2,)
+    assert strict.requires_alternatives and strict.minimum_pillars == 1
+    
+    claim = Claim(
+        claim_id="C001",
+        text="Tasks are stored in PostgreSQL",
+        origin_tag=OriginTag.DED,
+        proof_level=ProofLevel.S1,
+        dependencies=[],
+        test_description="Check schema",
+        status="PASS"
+    )
+    assert ProofValidator.validate_claim(claim, RiskClass.R1)["warnings"] == []
+    warnings = ProofValidator.validate_claim(claim, RiskClass.R1, strict)["warnings"]
+    assert warnings == [
+        "Claim C001 for R1 should have proof level ≥S2 (currently raisonnement/calcul)"
+    ]
+    for ledger in (ClaimLedger(), ColumnarClaimLedger()):
+        ledger.add_claim(claim)
+        assert ledger.validate_all(RiskClass.R1)["warnings"] == []
+        assert ledger.validate_all(RiskClass.R1, strict)["warnings"] == warnings
+    
+    for bad in ({"R9": {}}, {"R1": {"proof_budget": ["S7"]}}, {"R1": {"minimum_level": "high"}}):
+        try:
+            budgets_from_config(bad)
+            assert False, f"Invalid budget config accepted: {bad}"
+        except ValueError:
+            pass
+    
+    print("✓ Proof budget registry test passed")
+
+
 def test_claim_creation():
     """Test claim creation and validation"""
     claim = Claim(
@@ -170,6 +240,86 @@ def test_proof_validator():
     print("✓ Proof validator test passed")
 
 
+def test_batch_validation():
+    """Test validate_claims bitmasks and lazily rendered messages"""
+    def claim(claim_id, text, origin, level, testability=TestabilityLevel.T2, status="PASS"):
+        return Claim(claim_id, text, origin, level, [], "Test", status, testability)
+    
+    claims = [
+        claim("C1", "Tasks are stored in PostgreSQL", OriginTag.USER, ProofLevel.S3),
+        claim("C2", "Caching will cause faster pages", OriginTag.UNKNOWN, ProofLevel.S1,
+              TestabilityLevel.T1),
+        claim("C3", "Users prefer dark mode", OriginTag.HYP, ProofLevel.S2, status="UNKNOWN")
+    ]
+    
+    batch = ProofValidator.validate_claims(claims, RiskClass.R2)
+    assert len(batch) == 3 and not batch.valid
+    assert list(batch.flags) == [
+        0,
+        ClaimCheck.UNKNOWN_ORIGIN | ClaimCheck.UNTESTED_CAUSALITY | ClaimCheck.LOW_PROOF,
+        ClaimCheck.UNTESTED_HYPOTHESIS
+    ]
+    assert batch.flagged(ISSUE_CHECKS) == [1]
+    assert batch.count(ClaimCheck.UNTESTED_HYPOTHESIS) == 1
+    assert batch.issues() == [
+        "Claim C2 has UNKNOWN origin for high-risk (fort impact)",
+        "Claim C2 has strong causality but insufficient testability (has test implicite, needs ≥T2)"
+    ]
+    assert batch.warnings() == [
+        "Claim C2 for R2 should have proof level ≥S2 (currently raisonnement/calcul)",
+        "Claim C3 is hypothesis but not yet tested"
+    ]
+    for index, item in enumerate(claims):
+        assert batch.result(index) == ProofValidator.validate_claim(item, RiskClass.R2)
+    
+    # R1: no origin or proof level findings
+    batch = ProofValidator.validate_claims(claims, RiskClass.R1)
+    assert list(batch.flags) == [0, ClaimCheck.UNTESTED_CAUSALITY, ClaimCheck.UNTESTED_HYPOTHESIS]
+    
+    # Ledgers give the same masks, the columnar one computed over its columns
+    sample = make_sample_claims(90)
+    ledger = ClaimLedger()
+    columnar = ColumnarClaimLedger()
+    for item in sample:
+        ledger.add_claim(item)
+        columnar.add_claim(item)
+    numpy_module = columnar_module.np
+    try:
+        for np_module in {numpy_module, None}:
+            columnar_module.np = np_module
+            for risk_class in RiskClass:
+                expected = ProofValidator.validate_claims(sample, risk_class)
+                for result in (ledger.validate_claims(risk_class), columnar.validate_claims(risk_class)):
+                    assert list(result.flags) == list(expected.flags)
+                    assert list(result.claim_ids) == list(expected.claim_ids)
+                    assert result.summary() == expected.summary()
+    finally:
+        columnar_module.np = numpy_module
+    
+    # Claims without findings get results of their own
+    for validate in (ledger.validate_all, columnar.validate_all):
+        results = validate(RiskClass.R1)["claim_validations"]
+        clean = [
+            result for result in results.values()
+            if result == {"valid": True, "issues": [], "warnings": []}
+        ]
+        assert len(clean) >= 2
+        clean[0]["warnings"].append("Edited by a caller")
+        assert clean[1]["warnings"] == []
+    
+    # Columnar results decode IDs on access, from a snapshot of the rows
+    batch = columnar.validate_claims(RiskClass.R2)
+    columnar.add_claim(claim("C999", "Added after the batch", OriginTag.USER, ProofLevel.S3))
+    for item in sample:
+        columnar.update_claim(item.claim_id, proof_level=ProofLevel.S3)
+    assert len(batch) == 90 and batch.claim_ids[-1] == sample[-1].claim_id
+    results = batch.summary()["claim_validations"]
+    assert dict(results) == ledger.validate_all(RiskClass.R2)["claim_validations"]
+    assert results[sample[0].claim_id] == dict(results.items())[sample[0].claim_id]
+    
+    print("✓ Batch validation test passed")
+
+
 def test_markdown_table_generation():
     """Test markdown table generation"""
     ledger = ClaimLedger()
@@ -194,6 +344,371 @@ def test_markdown_table_generation():
     print("✓ Markdown table generation test passed")
 
 
+def test_incremental_validation():
+    """Test that validate_all only revalidates dirty claims and dependents"""
+    ledger = ClaimLedger()
+    for i in range(1, 6):
+        ledger.add_claim(Claim(
+            claim_id=f"C00{i}",
+            text=f"Test claim {i}",
+            origin_tag=OriginTag.USER,
+            proof_level=ProofLevel.S0,
+            dependencies=[f"C00{i - 1}"] if i > 1 else [],
+            test_description=f"Test {i}",
+            status="PASS"
+        ))
+    
+    validated = []
+    original = ProofValidator.validate_claims
+    
+    def counting_validate(claims, risk_class, proof_budget=None):
+        result = original(claims, risk_class, proof_budget)
+        validated.extend(result.claim_ids)
+        return result
+    
+    ProofValidator.validate_claims = staticmethod(counting_validate)
+    try:
+        assert ledger.validate_all(RiskClass.R1)["valid"]
+        assert len(validated) == 5
+        
+        # Nothing changed: everything comes from the cache
+        validated.clear()
+        ledger.validate_all(RiskClass.R1)
+        assert validated == []
+        
+        # Changing C004 revalidates it and its dependent C005 only
+        ledger.update_claim("C004", text="This will cause an outage", testability=TestabilityLevel.T0)
+        result = ledger.validate_all(RiskClass.R1)
+        assert sorted(validated) == ["C004", "C005"]
+        assert not result["valid"]
+        assert not result["claim_validations"]["C004"]["valid"]
+        
+        # A new risk class invalidates every cached result
+        validated.clear()
+        ledger.validate_all(RiskClass.R2)
+        assert len(validated) == 5
+    finally:
+        ProofValidator.validate_claims = staticmethod(original)
+    
+    print("✓ Incremental validation test passed")
+
+
+def test_dependency_checks():
+    """Test dependency index: dangling references, cycles, dependents"""
+    ledger = ClaimLedger()
+    edges = {
+        "C001": [],
+        "C002": ["C001"],
+        "C003": ["C002", "C999"],
+        "C004": ["C005"],
+        "C005": ["C004"],
+        "C006": ["C006"],
+    }
+    for claim_id, dependencies in edges.items():
+        ledger.add_claim(Claim(
+            claim_id=claim_id,
+            text=f"Claim {claim_id}",
+            origin_tag=OriginTag.DED,
+            proof_level=ProofLevel.S1,
+            dependencies=dependencies,
+            test_description="Test",
+            status="UNKNOWN"
+        ))
+    
+    check = ledger.check_dependencies()
+    assert not check["valid"]
+    assert check["dangling"] == {"C003": ["C999"]}
+    assert sorted(sorted(cycle) for cycle in check["cycles"]) == [["C004", "C005"], ["C006"]]
+    
+    assert ledger.get_dependents("C001") == {"C002", "C003"}
+    assert ledger.get_dependents("C001", transitive=False) == {"C002"}
+    
+    # Replacing dependencies updates both directions of the index
+    ledger.update_claim("C003", dependencies=["C002"])
+    ledger.update_claim("C005", dependencies=[])
+    ledger.update_claim("C006", dependencies=[])
+    assert ledger.check_dependencies()["valid"]
+    assert ledger.dependency_index.edge_count == 3
+    
+    print("✓ Dependency checks test passed")
+
+
+def test_keyword_scanner():
+    """Test single-pass keyword scanning against substring semantics"""
+    scanner = KeywordScanner(KEYWORD_CLASSES)
+    text = "Caching GUARANTEES the latest prices; it leads to 100% uptime"
+    
+    for keyword_class, keywords in KEYWORD_CLASSES.items():
+        expected = [k for k in keywords if k in text.lower()]
+        assert scanner.find(text, keyword_class) == expected, keyword_class
+    
+    # Overlapping keywords are all reported
+    assert scanner.find(text, "overpromise") == ["guarantee", "100%"]
+    assert scanner.find(text, "causality") == ["leads to", "guarantees"]
+    assert not scanner.contains(text, "health")
+    
+    # Results are cached per text
+    assert scanner.scan(text) is scanner.scan(text)
+    
+    print("✓ Keyword scanner test passed")
+
+
+def make_sample_claims(count: int):
+    """Build a deterministic list of varied claims"""
+    origins = list(OriginTag)
+    levels = list(ProofLevel)
+    testabilities = list(TestabilityLevel)
+    statuses = ["PASS", "FAIL", "UNKNOWN"]
+    return [
+        Claim(
+            claim_id=f"C{i:03d}",
+            text="This will cause faster pages" if i % 7 == 0 else f"Claim number {i % 10}",
+            origin_tag=origins[i % len(origins)],
+            proof_level=levels[i % len(levels)],
+            dependencies=[f"C{i - 1:03d}"] if i % 3 else [],
+            test_description=f"Test {i % 4}",
+            status=statuses[i % len(statuses)],
+            testability=testabilities[i % len(testabilities)]
+        )
+        for i in range(count)
+    ]
+
+
+def test_columnar_ledger():
+    """Test that the columnar ledger behaves like the dict-backed ledger"""
+    ledger = ClaimLedger()
+    columnar = ColumnarClaimLedger()
+    for claim in make_sample_claims(60):
+        ledger.add_claim(claim)
+        columnar.add_claim(claim)
+    
+    assert len(columnar.claims) == 60
+    assert list(columnar.claims) == list(ledger.claims)
+    assert "C010" in columnar.claims and "C999" not in columnar.claims
+    assert isinstance(columnar.get_claim("C010"), ClaimView)
+    assert columnar.get_claim("C010") == ledger.get_claim("C010")
+    assert columnar.get_claim("C999") is None
+    
+    for risk_class in RiskClass:
+        assert columnar.validate_all(risk_class) == ledger.validate_all(risk_class)
+    assert columnar.get_statistics() == ledger.get_statistics()
+    assert columnar.to_markdown_table() == ledger.to_markdown_table()
+    assert columnar.check_dependencies() == ledger.check_dependencies()
+    
+    # Updates write through the view to the columns
+    for target in (ledger, columnar):
+        target.update_claim("C005", status="PASS", dependencies=["C001", "C002", "C404"])
+    assert columnar.get_claim("C005").to_claim() == ledger.get_claim("C005")
+    assert columnar.check_dependencies() == ledger.check_dependencies()
+    columnar.compact()
+    assert columnar.get_claim("C005").dependencies == ["C001", "C002", "C404"]
+    assert columnar.validate_all(RiskClass.R2) == ledger.validate_all(RiskClass.R2)
+    
+    print("✓ Columnar ledger test passed")
+
+
+def test_columnar_bulk_paths():
+    """Test bulk statistics/validation with and without NumPy"""
+    ledger = ClaimLedger()
+    columnar = ColumnarClaimLedger()
+    for claim in make_sample_claims(90):
+        ledger.add_claim(claim)
+        columnar.add_claim(claim)
+    columnar.update_claim("C004", status="BLOCKED")
+    ledger.update_claim("C004", status="BLOCKED")
+    
+    numpy_module = columnar_module.np
+    try:
+        for np_module in {numpy_module, None}:
+            columnar_module.np = np_module
+            assert columnar.get_statistics() == ledger.get_statistics()
+            for risk_class in RiskClass:
+                assert columnar.validate_all(risk_class) == ledger.validate_all(risk_class)
+    finally:
+        columnar_module.np = numpy_module
+    
+    print("✓ Columnar bulk paths test passed")
+
+
+def test_sharded_ledger():
+    """Test process-parallel validation and statistics against the columnar ledger"""
+    reference = ColumnarClaimLedger()
+    with ShardedClaimLedger(shards=3, max_workers=2, parallel_threshold=0) as ledger:
+        for claim in make_sample_claims(120):
+            reference.add_claim(claim)
+            ledger.add_claim(claim)
+        assert sum(ledger.shard_sizes()) == 120 and all(ledger.shard_sizes())
+        
+        for risk_class in RiskClass:
+            result = ledger.validate_all(risk_class)
+            expected = reference.validate_all(risk_class)
+            assert result == expected
+            assert list(result["claim_validations"]) == list(expected["claim_validations"])
+            assert list(ledger.validate_claims(risk_class).flags) == \
+                list(reference.validate_claims(risk_class).flags)
+        assert ledger.get_statistics() == reference.get_statistics()
+        
+        # Dependencies across shards: C011 -> C012 -> C011 and a dangling one
+        assert shard_of("C011", 3) != shard_of("C012", 3)
+        for target in (ledger, reference):
+            target.update_claim("C011", dependencies=["C012"])
+            target.update_claim("C012", dependencies=["C011", "C999"])
+        assert ledger.check_dependencies() == reference.check_dependencies()
+        assert ledger.check_dependencies()["dangling"] == {"C012": ["C999"]}
+        assert ledger.validate_all(RiskClass.R2) == reference.validate_all(RiskClass.R2)
+        
+        # Pickled without its pool, e.g. for a process executor
+        copy = pickle.loads(pickle.dumps(ledger))
+        assert copy.get_statistics() == reference.get_statistics()
+        copy.close()
+    
+    # Rows grouped by shard in ledger order, and the pure-Python shard tasks
+    numpy_module = columnar_module.np
+    with ThreadPoolExecutor(2) as executor:
+        ledger = ShardedClaimLedger(shards=3, executor=executor, parallel_threshold=0)
+        for claim in make_sample_claims(120):
+            ledger.add_claim(claim)
+        expected_order = sorted(range(120), key=lambda row: ledger._shard[row])
+        try:
+            for np_module in {numpy_module, None}:
+                columnar_module.np = np_module
+                assert list(array('q', ledger._shard_order())) == expected_order
+                assert ledger.get_statistics() == reference.get_statistics()
+                assert ledger.validate_all(RiskClass.R2) == reference.validate_all(RiskClass.R2)
+        finally:
+            columnar_module.np = numpy_module
+        
+        # Unrendered results keep the proof levels of the validated rows
+        batch = ledger.validate_claims(RiskClass.R2)
+        ledger.update_claim("C015", proof_level=ProofLevel.S3)
+        assert batch.summary() == reference.validate_all(RiskClass.R2)
+    
+    # Below the threshold everything runs in-process
+    small = ShardedClaimLedger(shards=3)
+    for claim in make_sample_claims(10):
+        small.add_claim(claim)
+    assert small.validate_all(RiskClass.R1)["claim_validations"]
+    assert small._executor is None
+    
+    print("✓ Sharded ledger test passed")
+
+
+def test_streaming_exports():
+    """Test markdown/JSONL/CSV writers against the in-memory exports"""
+    for ledger in (ClaimLedger(), ColumnarClaimLedger()):
+        for claim in make_sample_claims(25):
+            ledger.add_claim(claim)
+        
+        markdown = io.StringIO()
+        ledger.write_markdown(markdown)
+        assert markdown.getvalue() == ledger.to_markdown_table()
+        
+        jsonl = io.StringIO()
+        ledger.write_jsonl(jsonl)
+        records = [json.loads(line) for line in jsonl.getvalue().splitlines()]
+        assert records == [claim.to_dict() for claim in ledger.claims.values()]
+        
+        table = io.StringIO()
+        ledger.write_csv(table)
+        rows = list(csv.DictReader(io.StringIO(table.getvalue())))
+        assert len(rows) == 25
+        assert rows[4]["claim_id"] == "C004"
+        assert rows[4]["dependencies"] == "C003"
+        assert rows[4]["origin_tag"] == ledger.get_claim("C004").origin_tag.value
+    
+    print("✓ Streaming exports test passed")
+
+
+def test_persistent_ledger():
+    """Test the on-disk ledger: reopen, O(1) lookups, updates, compaction"""
+    reference = ClaimLedger()
+    with tempfile.TemporaryDirectory() as path:
+        with PersistentClaimLedger(path) as ledger:
+            for claim in make_sample_claims(200):
+                ledger.add_claim(claim)
+                reference.add_claim(claim)
+            assert ledger.get_claim("C150") == reference.get_claim("C150")
+        
+        # Reopen: the index is mapped, nothing is loaded up front
+        with PersistentClaimLedger(path) as ledger:
+            assert len(ledger.claims) == 200
+            assert "C199" in ledger.claims and "C200" not in ledger.claims
+            assert ledger.get_claim("C200") is None
+            assert ledger.get_statistics() == reference.get_statistics()
+            assert ledger.validate_all(RiskClass.R2) == reference.validate_all(RiskClass.R2)
+            assert ledger.check_dependencies() == reference.check_dependencies()
+            
+            ledger.update_claim("C010", status="FAIL", dependencies=["C404"])
+            reference.update_claim("C010", status="FAIL", dependencies=["C404"])
+            assert ledger.get_claim("C010").status == "FAIL"
+            # The updated claim moved to the end of the log
+            assert list(ledger.claims)[-1] == "C010"
+            result = ledger.validate_all(RiskClass.R2)
+            expected = reference.validate_all(RiskClass.R2)
+            assert result["claim_validations"] == expected["claim_validations"]
+            assert sorted(result["warnings"]) == sorted(expected["warnings"])
+            assert ledger.check_dependencies() == reference.check_dependencies()
+            
+            size = ledger.store.log_path.stat().st_size
+            ledger.compact()
+            assert ledger.store.log_path.stat().st_size < size
+            assert len(ledger.claims) == 200
+            assert ledger.get_claim("C010") == reference.get_claim("C010")
+        
+        # A missing index is rebuilt from the log
+        (Path(path) / "claims.idx").unlink()
+        with PersistentClaimLedger(path) as ledger:
+            assert len(ledger.claims) == 200
+            assert ledger.get_claim("C010").dependencies == ["C404"]
+        
+        # A record torn by a crash is dropped; later appends stay readable
+        with open(Path(path) / "claims.log", "ab") as log:
+            log.write(b'{"claim_id": "C900", "text": "Torn')
+        with PersistentClaimLedger(path) as ledger:
+            assert len(ledger.claims) == 200 and "C900" not in ledger.claims
+            ledger.add_claim(Claim(
+                claim_id="C901",
+                text="Written after the crash",
+                origin_tag=OriginTag.USER,
+                proof_level=ProofLevel.S0,
+                dependencies=[],
+                test_description="",
+                status="UNKNOWN"
+            ))
+        (Path(path) / "claims.idx").unlink()
+        with PersistentClaimLedger(path) as ledger:
+            assert len(ledger.claims) == 201
+            assert ledger.get_claim("C901").text == "Written after the crash"
+    
+    # A crash after an unflushed put: the index is rebuilt, not trusted
+    crash = (
+        "import os, sys\n"
+        "sys.path[:0] = sys.argv[2:]\n"
+        "from test_epistemic import make_sample_claims\n"
+        "from archi_omega.epistemic.store import PersistentClaimLedger\n"
+        "ledger = PersistentClaimLedger(sys.argv[1])\n"
+        "claims = make_sample_claims(6)\n"
+        "for claim in claims[:5]:\n"
+        "    ledger.add_claim(claim)\n"
+        "ledger.store.flush()\n"
+        "ledger.add_claim(claims[5])\n"
+        "os._exit(1)\n"
+    )
+    tests_dir = Path(__file__).parent
+    with tempfile.TemporaryDirectory() as path:
+        subprocess.run(
+            [sys.executable, "-c", crash, path, str(tests_dir), str(tests_dir.parent / "src")],
+            check=False
+        )
+        lost = make_sample_claims(6)[5].claim_id
+        with PersistentClaimLedger(path) as ledger:
+            assert len(ledger.claims) == 5
+            assert ledger.get_claim(lost) is None
+            assert ledger.get_claim("C000") is not None
+    
+    print("✓ Persistent ledger test passed")
+
+
 def run_all_tests():
     """Run all tests"""
     print("\n=== Running ARCHI-Ω Epistemic Foundation Tests ===\n")
@@ -203,11 +718,21 @@ def run_all_tests():
         test_risk_classes()
         test_risk_classifier()
         test_proof_budget()
+        test_proof_budget_registry()
         test_claim_creation()
         test_strong_causality_validation()
         test_claim_ledger()
         test_proof_validator()
+        test_batch_validation()
         test_markdown_table_generation()
+        test_incremental_validation()
+        test_dependency_checks()
+        test_keyword_scanner()
+        test_columnar_ledger()
+        test_columnar_bulk_paths()
+        test_sharded_ledger()
+        test_streaming_exports()
+        test_persistent_ledger()
         
         print("\n=== All tests passed! ✓ ===\n")
         return 0
@@ -0,0 +1,861 @@
+"""
+Tests for ARCHI-Ω v1.2 pipeline
+"""
+
+import asyncio
+import http.client
+import io
+import json
+import subprocess
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from archi_omega.pipeline.stages import (
+    Pipeline, ProjectContext, TerminationCode, Linter, Stressor, Selector, STAGE_DEPENDENCIES
+)
+from archi_omega.pipeline.async_runner import AsyncPipeline
+from archi_omega.pipeline.cache import ResultCache, context_fingerprint
+from archi_omega.pipeline import catalog as catalog_module
+from archi_omega.pipeline.catalog import (
+    Component, best_combinations, rank_combinations, weights_from_config
+)
+from archi_omega.pipeline import selection as selection_module
+from archi_omega.pipeline.selection import dominates, flip_shift, pareto_frontier, win_counts
+from archi_omega.epistemic.foundation import Claim, OriginTag, ProofLevel, RiskClass
+from archi_omega.server import PipelineService, make_server
+from archi_omega import ingest as ingest_module
+from archi_omega.ingest import InputValidationError, context_from_input, load_input
+from archi_omega.cli import (
+    batch_output_paths, load_user_input, render_deliverable, write_deliverable
+)
+from archi_omega import doclint
+from archi_omega.doclint import LineIndex, lint_text, lint_tree
+from archi_omega.watch import Watcher, main as watch_main
+
+EXAMPLE_INPUT = Path(__file__).parent.parent / "examples" / "sample-input.yaml"
+
+
+def make_context(goal: str = "Test goal", budget: str = "$100") -> ProjectContext:
+    """Build a minimal project context"""
+    context = ProjectContext()
+    context.goal = goal
+    context.constraints = {"budget": budget}
+    return context
+
+
+def test_brancher_catalog():
+    """Test that BRANCH ranks catalog combinations into distinct options"""
+    context = make_context()
+    Pipeline().execute(context)
+    options = context.options
+    assert [option["id"] for option in options] == ["O1", "O2", "O3"]
+    totals = [option["total_score"] for option in options]
+    assert totals == sorted(totals, reverse=True) and totals[0] > 0
+    for i, option in enumerate(options):
+        assert set(option["components"]) == {"compute", "storage", "queue", "auth", "deploy"}
+        assert all(0 <= score <= 5 for score in option["scores"].values())
+        for other in options[:i]:
+            different = sum(
+                option["components"][name] != other["components"][name]
+                for name in option["components"]
+            )
+            assert different >= 2
+    assert context.recommendation == options[0]
+    
+    narrow = Pipeline({**Pipeline._default_config(), "divergence": "low"})
+    context = make_context()
+    narrow.execute(context)
+    assert len(context.options) == 2
+    
+    # Weights steer the ranking
+    cheap = weights_from_config({"weights": {"cost": 10}})
+    context = make_context()
+    Pipeline({**Pipeline._default_config(), "score_weights": cheap}).execute(context)
+    cost = catalog_module.SCORE_DIMENSIONS.index("cost")
+    cheapest = [
+        max(choice.scores[cost] for choice in choices)
+        for choices in catalog_module.COMPONENT_CATALOG.values()
+    ]
+    assert context.recommendation["scores"]["cost"] == round(sum(cheapest) / len(cheapest), 2)
+    for bad in ({"weights": {"ai_risk": 1}}, {"weights": {"cost": -1}}):
+        try:
+            weights_from_config(bad)
+            assert False, "Invalid weights should raise ValueError"
+        except ValueError:
+            pass
+    
+    # Vectorized and pure-Python ranking agree, ties kept in catalog order
+    flat = {name: [Component(f"{name}{i}", (3,) * 8) for i in range(12)] for name in "abcd"}
+    varied = {
+        name: [
+            Component(f"{name}{i}", tuple((i * 7 + d * 3) % 6 for d in range(8)))
+            for i in range(12)
+        ]
+        for name in "abcd"
+    }
+    original = catalog_module.VECTORIZE_MIN_COMBINATIONS
+    try:
+        results = []
+        for threshold in (1, 10 ** 9):
+            catalog_module.VECTORIZE_MIN_COMBINATIONS = threshold
+            results.append([
+                rank_combinations(flat, None, 4),
+                rank_combinations(varied, {"cost": 2.0}, 50),
+                best_combinations(varied, {"cost": 2.0})
+            ])
+    finally:
+        catalog_module.VECTORIZE_MIN_COMBINATIONS = original
+    assert results[0] == results[1]
+    assert [combination for _, combination in results[1][0]] == [
+        (0, 0, 0, 0), (0, 0, 0, 1), (0, 0, 0, 2), (0, 0, 0, 3)
+    ]
+    
+    print("✓ Brancher catalog test passed")
+
+
+def test_selector_pareto():
+    """Test Pareto-frontier selection and the dominance report"""
+    def option(option_id, robustness, cost, total):
+        scores = {"robustness": robustness, "cost": cost}
+        return {"id": option_id, "scores": scores, "total_score": total}
+    
+    context = make_context()
+    context.options = [
+        option("A", 5, 1, 6), option("B", 1, 5, 6), option("C", 1, 1, 9), option("D", 5, 1, 6)
+    ]
+    result = Selector.select(context)
+    assert result["pareto_frontier"] == ["A", "B", "D"]
+    assert result["dominance"] == {"C": ["A", "B", "D"]}
+    # C has the highest total but is dominated; ties keep option order
+    assert (result["recommendation"]["id"], result["fallback"]["id"]) == ("A", "B")
+    assert context.recommendation["id"] == "A"
+    
+    # A single frontier option falls back to the best dominated one
+    context.options = [option("A", 5, 5, 10), option("B", 1, 1, 2), option("C", 2, 2, 4)]
+    result = Selector.select(context)
+    assert result["pareto_frontier"] == ["A"]
+    assert result["dominance"] == {"B": ["A"], "C": ["A"]}
+    assert result["fallback"]["id"] == "C"
+    
+    context.options = []
+    assert Selector.select(context)["recommendation"] is None
+    
+    # Skyline matches the pairwise definition on a larger set
+    vectors = [tuple((i * 37 + d * 11) % 7 for d in range(4)) for i in range(300)]
+    frontier, dominated_by = pareto_frontier(vectors)
+    expected = [i for i, v in enumerate(vectors) if not any(dominates(w, v) for w in vectors)]
+    assert frontier == expected
+    for index, dominators in dominated_by.items():
+        assert dominators == [i for i in frontier if dominates(vectors[i], vectors[index])]
+    assert sorted(frontier + list(dominated_by)) == list(range(300))
+    
+    # Block comparisons against the frontier give the same skyline
+    original = selection_module.VECTORIZE_MIN_VECTORS
+    selection_module.VECTORIZE_MIN_VECTORS = 0
+    try:
+        assert pareto_frontier(vectors, with_dominance=False) == (frontier, {})
+    finally:
+        selection_module.VECTORIZE_MIN_VECTORS = original
+    
+    # The frontier and dominance report reach the deliverable
+    context = make_context()
+    deliverable = Pipeline().execute(context)
+    report = Selector.select(context)
+    summary = deliverable["validation_summary"]["select"]
+    assert summary["pareto_frontier"] == report["pareto_frontier"]
+    assert summary["dominance"] == report["dominance"]
+    ids = [option["id"] for option in deliverable["options"]]
+    assert deliverable["recommendation"]["id"] in report["pareto_frontier"]
+    assert sorted(report["pareto_frontier"] + list(report["dominance"])) == sorted(ids)
+    
+    print("✓ Selector Pareto test passed")
+
+
+def test_selector_sensitivity():
+    """Test the weight sensitivity of R2 recommendations"""
+    def option(option_id, robustness, cost):
+        scores = {"robustness": robustness, "cost": cost}
+        return {"id": option_id, "scores": scores, "total_score": robustness + cost}
+    
+    context = make_context()
+    context.options = [option("A", 5, 2), option("B", 1, 5), option("C", 1, 1)]
+    context.risk_class = RiskClass.R1
+    assert Selector.select(context)["sensitivity"] is None
+    
+    context.risk_class = RiskClass.R2
+    sensitivity = Selector.select(context)["sensitivity"]
+    assert sensitivity["samples"] == 2000
+    frequency = sensitivity["win_frequency"]
+    assert frequency["C"] == 0 and abs(sum(frequency.values()) - 1) < 1e-9
+    # A wins while the robustness share is above 3/7
+    assert abs(frequency["A"] - 4 / 7) < 0.05
+    assert sensitivity["stability"] == frequency["A"]
+    # B catches up once 1/14 of the weight moves from robustness to cost
+    assert sensitivity["flip"] == {"option": "B", "weight_shift": 0.0714, "towards": "cost"}
+    
+    # Weighting robustness up makes A more stable and harder to overturn
+    weighted = Selector.select(context, {"robustness": 3.0})["sensitivity"]
+    assert weighted["stability"] > sensitivity["stability"]
+    assert weighted["flip"]["weight_shift"] > sensitivity["flip"]["weight_shift"]
+    assert Selector.select(context, samples=0)["sensitivity"] is None
+    
+    # An option ahead on every dimension cannot be overturned
+    vectors = [(5.0, 5.0), (1.0, 2.0)]
+    assert flip_shift(vectors, (0.5, 0.5), 0) is None
+    assert win_counts(vectors, (0.5, 0.5), 100) == [100, 0]
+    
+    # The vectorized ranking samples the same distribution
+    original = selection_module.VECTORIZE_MIN_PRODUCTS
+    selection_module.VECTORIZE_MIN_PRODUCTS = 0
+    try:
+        vectorized = Selector.select(context)["sensitivity"]
+    finally:
+        selection_module.VECTORIZE_MIN_PRODUCTS = original
+    assert abs(vectorized["stability"] - sensitivity["stability"]) < 0.05
+    assert vectorized["flip"] == sensitivity["flip"]
+    
+    # The report reaches the deliverable and its markdown
+    context = make_context()
+    deliverable = Pipeline().execute(context)
+    assert context.risk_class == RiskClass.R2
+    report = Selector.select(context)["sensitivity"]
+    assert deliverable["validation_summary"]["select"]["sensitivity"] == report
+    markdown = render_deliverable(deliverable, "markdown")
+    assert f"**Stability:** {report['stability']:.1%} of 2000 weight samples" in markdown
+    assert "**Flip distance:**" in markdown
+    deliverable["validation_summary"]["select"]["sensitivity"] = None
+    assert "**Stability:**" not in render_deliverable(deliverable, "markdown")
+    
+    print("✓ Selector sensitivity test passed")
+
+
+def test_execute_many_in_process():
+    """Test batch execution without a process pool"""
+    pipeline = Pipeline()
+    contexts = [make_context(goal=f"Goal {i}") for i in range(5)]
+    delivered = []
+    
+    counts = pipeline.execute_many(
+        contexts,
+        max_workers=1,
+        on_result=lambda index, deliverable: delivered.append(index)
+    )
+    
+    assert sorted(delivered) == [0, 1, 2, 3, 4]
+    assert counts[TerminationCode.TERM_LIVRE.value] == 5
+    assert counts["ERROR"] == 0
+    
+    print("✓ In-process batch execution test passed")
+
+
+def test_execute_many_process_pool():
+    """Test batch execution over a process pool with a worker-side loader"""
+    pipeline = Pipeline()
+    items = [EXAMPLE_INPUT] * 6 + [Path("missing-input.yaml")]
+    delivered = {}
+    errors = []
+    
+    counts = pipeline.execute_many(
+        items,
+        max_workers=2,
+        loader=load_user_input,
+        on_result=lambda index, deliverable: delivered.__setitem__(index, deliverable),
+        on_error=lambda index, error: errors.append(index)
+    )
+    
+    assert sorted(delivered) == [0, 1, 2, 3, 4, 5]
+    assert errors == [6]
+    assert counts["ERROR"] == 1
+    assert sum(counts.values()) == len(items)
+    
+    single = Pipeline().execute(load_user_input(EXAMPLE_INPUT))
+    assert delivered[0]["termination"] == single["termination"]
+    
+    print("✓ Process pool batch execution test passed")
+
+
+def test_batch_output_paths():
+    """Test that batch inputs never share an output file"""
+    out = Path("deliverables")
+    inputs = [Path("in/a.yaml"), Path("in/b.yaml")]
+    assert batch_output_paths(inputs, out, ".md") == [out / "a.md", out / "b.md"]
+    
+    # Same stem with another suffix, or in another directory of a glob
+    inputs = [Path("in/a.json"), Path("in/a.yaml"), Path("in/x/a.yaml"), Path("in/y/a.yaml")]
+    assert batch_output_paths(inputs, out, ".md") == [
+        out / "a.json.md", out / "a.yaml.md", out / "x" / "a.md", out / "y" / "a.md"
+    ]
+    
+    print("✓ Batch output paths test passed")
+
+
+def test_stress_missing_dependencies():
+    """Test that STRESS reports dangling dependencies and cycles"""
+    context = make_context()
+    for claim_id, dependencies in [("C001", ["C002"]), ("C002", ["C001"]), ("C003", ["C404"])]:
+        context.claim_ledger.add_claim(Claim(
+            claim_id=claim_id,
+            text=f"Claim {claim_id}",
+            origin_tag=OriginTag.DED,
+            proof_level=ProofLevel.S1,
+            dependencies=dependencies,
+            test_description="Test",
+            status="UNKNOWN"
+        ))
+    
+    result = Stressor.stress(context)["missing_dependencies"]
+    assert not result["passed"]
+    assert any("C404" in issue for issue in result["issues"])
+    assert any("cycle" in issue and "C001" in issue for issue in result["issues"])
+    
+    print("✓ Stress missing dependencies test passed")
+
+
+def test_lint_reports_fields():
+    """Test that LINT findings report the field they came from"""
+    context = make_context(goal="Deliver the latest stack")
+    context.integrations = ["Billing", "Uptime guarantee from vendor"]
+    context.claim_ledger.add_claim(Claim(
+        claim_id="C001",
+        text="Caching is assured to help",
+        origin_tag=OriginTag.HYP,
+        proof_level=ProofLevel.S1,
+        dependencies=[],
+        test_description="Load test",
+        status="UNKNOWN"
+    ))
+    
+    result = Linter.lint(context)
+    assert not result["valid"]
+    fields = {(f["check"], f["keyword"], f["field"]) for f in result["findings"]}
+    assert ("overpromise", "guarantee", "integrations[1]") in fields
+    assert ("overpromise", "assured", "claim_ledger.C001.text") in fields
+    assert ("recency", "latest", "goal") in fields
+    assert any("integrations[1]" in issue for issue in result["issues"])
+    
+    paths = dict(context.iter_text_fields())
+    assert paths["constraints.budget"] == "$100"
+    
+    print("✓ Lint field reporting test passed")
+
+
+def test_streamed_deliverable_matches_rendered():
+    """Test that streaming the deliverable gives the same output as rendering it"""
+    context = load_user_input(EXAMPLE_INPUT)
+    context.claim_ledger.add_claim(Claim(
+        claim_id="C001",
+        text="API responds under 200ms at p95",
+        origin_tag=OriginTag.USER,
+        proof_level=ProofLevel.S0,
+        dependencies=[],
+        test_description="Load test",
+        status="UNKNOWN"
+    ))
+    rendered = Pipeline().execute(context)
+    streamed = Pipeline().execute(context, render_ledger=False)
+    assert streamed["claim_ledger"] is None
+    
+    output = io.StringIO()
+    write_deliverable(streamed, "markdown", output, context.claim_ledger)
+    assert output.getvalue() == render_deliverable(rendered, "markdown")
+    
+    output = io.StringIO()
+    write_deliverable(rendered, "json", output)
+    assert output.getvalue() == render_deliverable(rendered, "json")
+    
+    print("✓ Streamed deliverable test passed")
+
+
+def test_result_cache():
+    """Test content-addressed caching of deliverables"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = Path(tmp) / "results.sqlite"
+        pipeline = Pipeline(cache=ResultCache(path=cache_path))
+        
+        first = pipeline.execute(load_user_input(EXAMPLE_INPUT))
+        
+        # Cosmetic whitespace edits hit the cache and restore context state
+        context = load_user_input(EXAMPLE_INPUT)
+        context.goal = "  " + context.goal.replace(" ", "   ") + "\n"
+        assert context_fingerprint(context, pipeline.config) == \
+            context_fingerprint(load_user_input(EXAMPLE_INPUT), pipeline.config)
+        second = pipeline.execute(context)
+        assert second == first and second is not first
+        assert context.facts == first["facts"]
+        assert context.risk_class == first["validation_summary"]["compile"]["risk_class"]
+        assert pipeline.cache.stats()["hits"] == 1
+        
+        # A real change, or another config, misses
+        context.goal = "Build a medical records platform"
+        pipeline.execute(context)
+        Pipeline(dict(pipeline.config, divergence="low"), pipeline.cache).execute(
+            load_user_input(EXAMPLE_INPUT)
+        )
+        assert pipeline.cache.stats()["misses"] == 3
+        
+        # The on-disk tier survives the process-level cache
+        reopened = ResultCache(path=cache_path)
+        assert Pipeline(cache=reopened).execute(load_user_input(EXAMPLE_INPUT)) == first
+        assert reopened.stats()["hits"] == 1
+        assert reopened.stats()["disk_entries"] == 3
+        reopened.close()
+        pipeline.cache.close()
+    
+    # Memory tier evicts least recently used entries
+    cache = ResultCache(max_entries=2)
+    for key in ("a", "b", "a", "c"):
+        cache.put(key, {"key": key})
+    assert cache.get("b") is None and cache.get("a") == {"key": "a"}
+    assert cache.stats()["evictions"] == 1
+    
+    print("✓ Result cache test passed")
+
+
+def test_reexecute_reruns_affected_stages():
+    """Test incremental re-execution after editing one input section"""
+    pipeline = Pipeline()
+    context = load_user_input(EXAMPLE_INPUT)
+    pipeline.execute(context)
+    
+    ran = []
+    run_stage = pipeline._run_stage
+    
+    def record_stage(stage, ctx, render_ledger):
+        ran.append(stage)
+        return run_stage(stage, ctx, render_ledger)
+    
+    pipeline._run_stage = record_stage
+    
+    # Ops is read by COMPILE (same risk class) and LINT only
+    context.ops = {"monitoring": "Grafana"}
+    deliverable = pipeline.reexecute(context, ["ops"])
+    assert ran == ["compile", "lint", "commit"]
+    
+    fresh = load_user_input(EXAMPLE_INPUT)
+    fresh.ops = {"monitoring": "Grafana"}
+    assert deliverable == Pipeline().execute(fresh)
+    
+    # A goal change that raises the risk class reruns its readers
+    context = ProjectContext(goal="Build a task tracker")
+    pipeline.execute(context)
+    ran.clear()
+    context.goal = "Build a medical records system"
+    deliverable = pipeline.reexecute(context, ["goal"])
+    assert ran == ["compile", "lint", "stress", "select", "commit"]
+    assert deliverable == Pipeline().execute(ProjectContext(goal=context.goal))
+    assert context.stage_outputs["select"]["sensitivity"] is not None
+    
+    # Options and recommendation were reused, not regenerated
+    ran.clear()
+    context.constraints = dict(context.constraints, budget="$50k/month")
+    pipeline.reexecute(context, ["constraints"])
+    assert "branch" not in ran and "select" not in ran
+    assert "expand" in ran and "stress" in ran
+    
+    try:
+        pipeline.reexecute(context, ["risk_class"])
+        assert False, "Derived fields should be rejected"
+    except ValueError:
+        pass
+    
+    print("✓ Incremental re-execution test passed")
+
+
+def test_pipeline_telemetry():
+    """Test per-stage instrumentation and its exports"""
+    context = load_user_input(EXAMPLE_INPUT)
+    context.claim_ledger.add_claim(Claim(
+        claim_id="C001",
+        text="Redis reduces latency",
+        origin_tag=OriginTag.DED,
+        proof_level=ProofLevel.S1,
+        dependencies=[],
+        test_description="Load test",
+        status="UNKNOWN"
+    ))
+    pipeline = Pipeline(instrument=True)
+    deliverable = pipeline.execute(context)
+    
+    telemetry = deliverable["validation_summary"]["telemetry"]
+    stages = [metrics["stage"] for metrics in telemetry["stages"]]
+    assert stages == ["compile", "expand", "branch", "lint", "stress", "select", "commit"]
+    for metrics in telemetry["stages"]:
+        assert metrics["calls"] == 1
+        assert metrics["wall_seconds"] >= 0 and metrics["cpu_seconds"] >= 0
+        assert metrics["peak_bytes"] >= 0
+        assert metrics["counts"]["claims"] == 1
+    branch = telemetry["stages"][2]
+    assert branch["counts"]["options"] == len(context.options)
+    assert telemetry["stages"][0]["counts"]["facts"] == 0
+    assert telemetry["stages"][1]["counts"]["facts"] == len(context.facts)
+    assert telemetry["cache_hit"] is False
+    
+    assert json.loads(pipeline.telemetry.to_json()) == telemetry
+    exposition = pipeline.telemetry.to_prometheus()
+    assert 'archi_omega_stage_calls_total{stage="lint"} 1' in exposition
+    assert 'archi_omega_stage_items{stage="commit",item="claims"} 1' in exposition
+    
+    # Uninstrumented pipelines add nothing
+    assert "telemetry" not in Pipeline().execute(load_user_input(EXAMPLE_INPUT))["validation_summary"]
+    
+    print("✓ Pipeline telemetry test passed")
+
+
+def test_stage_dependencies():
+    """Test the stage schedule derived from the declared fields"""
+    assert STAGE_DEPENDENCIES["compile"] == ()
+    assert STAGE_DEPENDENCIES["expand"] == ()
+    assert STAGE_DEPENDENCIES["branch"] == ()
+    assert STAGE_DEPENDENCIES["lint"] == ("compile", "expand", "branch")
+    assert STAGE_DEPENDENCIES["stress"] == ("compile",)
+    assert STAGE_DEPENDENCIES["select"] == ("compile", "branch")
+    assert len(STAGE_DEPENDENCIES["commit"]) == 6
+    
+    print("✓ Stage dependencies test passed")
+
+
+def test_async_pipeline():
+    """Test that the async runner matches the sequential pipeline"""
+    def make_claimed_context():
+        context = load_user_input(EXAMPLE_INPUT)
+        for claim_id, dependencies in [("C001", []), ("C002", ["C001", "C404"])]:
+            context.claim_ledger.add_claim(Claim(
+                claim_id=claim_id,
+                text="Caching will cause faster pages",
+                origin_tag=OriginTag.UNKNOWN,
+                proof_level=ProofLevel.S1,
+                dependencies=dependencies,
+                test_description="Test",
+                status="UNKNOWN"
+            ))
+        return context
+    
+    expected = Pipeline().execute(make_claimed_context())
+    assert not expected["validation_summary"]["stress"]["missing_dependencies"]["passed"]
+    
+    for executor in ("thread", "process"):
+        async def run():
+            async with AsyncPipeline(executor=executor, max_workers=2) as runner:
+                context = make_claimed_context()
+                deliverable = await runner.execute(context)
+                return context, deliverable
+        
+        context, deliverable = asyncio.run(run())
+        assert deliverable == expected
+        assert list(deliverable["validation_summary"]["stress"]) == list(Stressor.TESTS)
+        assert set(context.stage_outputs) == set(STAGE_DEPENDENCIES)
+    
+    try:
+        AsyncPipeline(executor="fibers")
+        assert False, "Unknown executor kinds should be rejected"
+    except ValueError:
+        pass
+    
+    print("✓ Async pipeline test passed")
+
+
+def test_pipeline_service():
+    """Test the HTTP service, including backpressure when at capacity"""
+    service = PipelineService(workers=0, max_pending=1)
+    server = make_server(service, ("127.0.0.1", 0), quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    
+    def request(method, path, body=None, headers=None):
+        connection = http.client.HTTPConnection(*server.server_address)
+        connection.request(method, path, body, headers or {})
+        response = connection.getresponse()
+        result = response.status, response.getheader("Retry-After"), response.read().decode()
+        connection.close()
+        return result
+    
+    try:
+        body = EXAMPLE_INPUT.read_bytes()
+        status, _, text = request("POST", "/execute?format=json", body)
+        assert status == 200
+        expected = Pipeline().execute(load_user_input(EXAMPLE_INPUT))
+        assert json.loads(text) == json.loads(render_deliverable(expected, "json"))
+        
+        as_json = json.dumps({"GOAL": "Build a task tracker"})
+        status, _, text = request("POST", "/execute", as_json, {"Content-Type": "application/json"})
+        assert status == 200 and text.startswith("# ARCHI-Ω v1.2 - Deliverable")
+        
+        assert request("POST", "/execute", "- not a mapping")[0] == 400
+        # Error replies are written after the slot is released
+        assert service.health()["in_flight"] == 0
+        assert request("POST", "/execute?format=xml", body)[0] == 400
+        for length in ("abc", "-1"):
+            assert request("POST", "/execute", "GOAL: x", {"Content-Length": length})[0] == 400
+        assert request("GET", "/missing")[0] == 404
+        
+        # Hold the only slot: further requests are refused
+        assert service.try_acquire()
+        status, retry_after, _ = request("POST", "/execute", body)
+        assert status == 503 and retry_after == "1"
+        service.release()
+        
+        status, _, text = request("GET", "/health")
+        health = json.loads(text)
+        assert status == 200 and health["rejected"] == 1 and health["in_flight"] == 0
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.close()
+    
+    print("✓ Pipeline service test passed")
+
+
+def test_input_ingestion():
+    """Test schema-checked loading of YAML, JSON and claim inputs"""
+    yaml_context = load_input(EXAMPLE_INPUT)
+    data = ingest_module.load_yaml(EXAMPLE_INPUT)
+    data["CLAIMS"] = [
+        {"claim_id": "C001", "text": "Cache hit rate above 80%", "origin_tag": "DED",
+         "proof_level": "S1", "test": "Load test"},
+        {"claim_id": "C002", "text": "Latency drops", "origin_tag": "HYP",
+         "proof_level": "S0", "dependencies": ["C001"]}
+    ]
+    data["AI_ML"] = "N/A"
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "input.json"
+        path.write_text(json.dumps(data))
+        context = load_input(path)
+    
+    assert context.goal == yaml_context.goal
+    assert context.done_criteria == yaml_context.done_criteria
+    assert context.ai_ml is None
+    assert list(context.claim_ledger.claims) == ["C001", "C002"]
+    assert context.claim_ledger.claims["C001"].test_description == "Load test"
+    assert context.claim_ledger.claims["C002"].dependencies == ["C001"]
+    
+    # Every problem is reported at once
+    bad = {
+        "GOAL": "Test",
+        "BUDGET": "$100",
+        "CONSTRAINTS": ["$100"],
+        "DONE": {"pass": "fast"},
+        "CLAIMS": [
+            {"claim_id": "C001", "text": "x", "origin_tag": "DED", "proof_level": "S9"},
+            {"claim_id": "C001", "text": "y", "proof_level": "S1", "extra": 1}
+        ]
+    }
+    try:
+        context_from_input(bad, "bad.yaml")
+        assert False, "Invalid input should be rejected"
+    except InputValidationError as e:
+        assert str(e).startswith("bad.yaml: ")
+        assert len(e.errors) == 7
+        assert any("unknown section 'BUDGET'" in error for error in e.errors)
+        assert "CONSTRAINTS must be a mapping, got list" in e.errors
+        assert "DONE.pass must be a list, got str" in e.errors
+        assert "CLAIMS[0].proof_level must be one of S0, S1, S2, S3, S4" in e.errors
+        assert "CLAIMS[1] is missing 'origin_tag'" in e.errors
+        assert "CLAIMS[1] duplicates claim ID 'C001'" in e.errors
+    
+    try:
+        ingest_module.decode_input(b"GOAL: [unclosed", "yaml")
+        assert False, "Malformed YAML should be rejected"
+    except InputValidationError:
+        pass
+    
+    msgpack = ingest_module.msgpack
+    try:
+        ingest_module.msgpack = None
+        ingest_module.decode_input(b"\x80", "msgpack")
+        assert False, "MessagePack needs the optional package"
+    except ImportError:
+        pass
+    finally:
+        ingest_module.msgpack = msgpack
+    if msgpack is not None:
+        payload = msgpack.packb({"GOAL": "Packed goal"})
+        assert ingest_module.decode_input(payload, "msgpack") == {"GOAL": "Packed goal"}
+    
+    print("✓ Input ingestion test passed")
+
+
+def test_lazy_imports():
+    """Test that importing the package and the CLI defers the heavy modules"""
+    probe = (
+        "import sys, archi_omega.cli, archi_omega\n"
+        "heavy = ['yaml', 'numpy', 'archi_omega.pipeline', 'archi_omega.epistemic']\n"
+        "print(sorted(name for name in heavy if name in sys.modules))\n"
+        "archi_omega.Pipeline\n"
+        "print('archi_omega.pipeline.stages' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=str(Path(__file__).parent.parent / "src"),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    assert result.stdout.split("\n")[:2] == ["[]", "True"], result.stdout
+    
+    try:
+        import archi_omega
+        archi_omega.NoSuchClass
+        assert False, "Unknown attributes should raise AttributeError"
+    except AttributeError:
+        pass
+    
+    print("✓ Lazy imports test passed")
+
+
+def test_doclint():
+    """Test the tree linter: positions, excludes, cache reuse, pool and reports"""
+    index = LineIndex("a\nbc\n\nd")
+    positions = [index.locate(offset) for offset in (0, 2, 3, 5, 6)]
+    assert positions == [(1, 1), (2, 1), (2, 2), (3, 1), (4, 1)]
+    assert [index.line(number) for number in (1, 2, 3, 4)] == ["a", "bc", "", "d"]
+    
+    findings = lint_text("Fine.\nUptime is GUARANTEED, 100% sure\n100% uptime target\n", "x.md")
+    assert [(f.line, f.column, f.rule_id) for f in findings] == [(2, 11, "OP001"), (2, 23, "OP007")]
+    assert findings[0].text == "Uptime is GUARANTEED, 100% sure"
+    assert lint_text("Assured <!-- archi-omega-lint: allow -->", "x.md") == []
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / "docs").mkdir()
+        (root / "tests").mkdir()
+        (root / "docs" / "a.md").write_text("Results guaranteed\n", encoding="utf-8")
+        (root / "docs" / "b.yaml").write_text("note: clean\n", encoding="utf-8")
+        (root / "docs" / "c.txt").write_text("guaranteed\n", encoding="utf-8")
+        (root / "tests" / "t.py").write_text("# guaranteed\n", encoding="utf-8")
+        cache = root / doclint.CACHE_FILE
+        
+        report = lint_tree(root, cache_path=cache, workers=0)
+        assert (report.files, report.cached) == (2, 0)
+        assert [(f.path, f.line) for f in report.findings] == [("docs/a.md", 1)]
+        
+        # Unchanged files keep their findings from the cache
+        (root / "docs" / "b.yaml").write_text("note: 100% safe\n", encoding="utf-8")
+        report = lint_tree(root, cache_path=cache, workers=0)
+        assert report.cached == 1
+        assert [(f.path, f.rule_id) for f in report.findings] == [
+            ("docs/a.md", "OP001"), ("docs/b.yaml", "OP007")
+        ]
+        assert lint_tree(root, cache_path=cache, workers=0).cached == 2
+        
+        # Process pool above the file threshold, same findings
+        original = doclint.PARALLEL_MIN_FILES
+        doclint.PARALLEL_MIN_FILES = 1
+        try:
+            assert lint_tree(root, workers=2).findings == report.findings
+        finally:
+            doclint.PARALLEL_MIN_FILES = original
+        
+        json_report = report.to_json()
+        assert json_report["passed"] is False and len(json_report["findings"]) == 2
+        sarif = json.loads(json.dumps(report.to_sarif()))
+        assert sarif["version"] == "2.1.0"
+        result = sarif["runs"][0]["results"][1]
+        assert result["ruleId"] == "OP007"
+        location = result["locations"][0]["physicalLocation"]
+        assert location["artifactLocation"]["uri"] == "docs/b.yaml"
+        assert location["region"]["startLine"] == 1
+    
+    print("✓ Doc lint test passed")
+
+
+def test_watch_mode():
+    """Test that the watcher reruns affected stages and reports deltas"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        intake = root / "intake.yaml"
+        original = EXAMPLE_INPUT.read_text(encoding="utf-8")
+        intake.write_text(original, encoding="utf-8")
+        (root / "notes.md").write_text("# Notes\n", encoding="utf-8")
+        watcher = Watcher(root, stream=io.StringIO())
+        
+        lines = watcher.check()
+        assert lines[0].startswith("intake.yaml") and "new -> TERM-LIVRÉ" in lines[1]
+        assert watcher.check() == []
+        
+        # A GOAL edit reruns COMPILE, LINT and COMMIT only
+        edited = original.replace("GOAL: ", "GOAL: Results guaranteed. ", 1)
+        intake.write_text(edited, encoding="utf-8")
+        lines = watcher.check()
+        assert "  + Overpromise detected: 'guarantee' found in goal" in lines
+        assert lines[-1] == "  reran compile, lint, commit"
+        assert any(line.startswith("  + 1:") and "OP001" in line for line in lines)
+        
+        (root / "notes.md").write_text("# Notes\nUptime assured\n", encoding="utf-8")
+        lines = watcher.check()
+        assert lines[0].startswith("notes.md ")
+        assert lines[1:] == ["  + 2:8 OP003 'assured': Uptime assured"]
+        
+        intake.write_text("GOAL: [1]\n", encoding="utf-8")
+        lines = watcher.check()
+        assert lines[-1].startswith("  ! ") and "GOAL must be a string" in lines[-1]
+        assert "1 invalid" in watcher.summary()
+        
+        intake.write_text(original, encoding="utf-8")
+        lines = watcher.check()
+        assert "  input valid again" in lines
+        assert "  - Overpromise detected: 'guarantee' found in goal" in lines
+        
+        # A cached pipeline returns the deliverable without stage outputs
+        cached = Pipeline(cache=ResultCache())
+        cached.execute(load_user_input(EXAMPLE_INPUT), render_ledger=False)
+        lines = Watcher(root, cached, stream=io.StringIO()).check()
+        assert "  new -> TERM-LIVRÉ" in lines
+        
+        intake.unlink()
+        assert watcher.check()[1] == "  removed"
+        assert watch_main([str(root), "--once"]) == 1  # notes.md keeps a finding
+        
+        # An unreadable config falls back to the defaults
+        bad_config = Path(tmp + "-config.yaml")
+        bad_config.write_text("mode: [unclosed\n", encoding="utf-8")
+        try:
+            assert watch_main([str(root), "--once", "-c", str(bad_config)]) == 1
+        finally:
+            bad_config.unlink()
+    
+    print("✓ Watch mode test passed")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("\n=== Running ARCHI-Ω Pipeline Tests ===\n")
+    
+    try:
+        test_brancher_catalog()
+        test_selector_pareto()
+        test_selector_sensitivity()
+        test_execute_many_in_process()
+        test_execute_many_process_pool()
+        test_batch_output_paths()
+        test_stress_missing_dependencies()
+        test_lint_reports_fields()
+        test_streamed_deliverable_matches_rendered()
+        test_result_cache()
+        test_reexecute_reruns_affected_stages()
+        test_pipeline_telemetry()
+        test_stage_dependencies()
+        test_async_pipeline()
+        test_pipeline_service()
+        test_input_ingestion()
+        test_lazy_imports()
+        test_doclint()
+        test_watch_mode()
+        
+        print("\n=== All tests passed! ✓ ===\n")
+        return 0
+    except AssertionError as e:
+        print(f"\n✗ Test failed: {e}\n")
+        return 1
+    except Exception as e:
+        print(f"\n✗ Error: {e}\n")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())